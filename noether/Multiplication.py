@@ -44,6 +44,10 @@ class Multiplication(Generic[T], ImmutableDict[T, Rational]):
     def __hash__(self):
         return hash(tuple(sorted(self.items())))
 
+    def __reduce__(self):
+        # ImmutableDict can't be filled item by item
+        return (type(self), (dict(self), ))
+
     # % Geometric ops
 
     def _geo(self, value: T | 'Multiplication[T]', direction: int):
@@ -2,4 +2,38 @@ from .errors import *
 from .config import conf
 from .core import *
 from .catalogue import *
-conf._remove_unused_keys()
+
+if conf.get('CATALOGUE_lazy') and not conf.get('CATALOGUE_snapshot'):
+    # Units are found as they are first used,
+    # and unused options removed once everything is loaded
+    from .catalogue import __getattr__, __dir__
+else:
+    conf._remove_unused_keys()
+
+    if conf.get('CATALOGUE_all_prefixes_in_namespace'):
+        # Prefixed units are made as they are first used
+        from .catalogue import _prefixed
+
+        def __getattr__(name: str):
+            if name == '__all__':
+                # so that `from noether import *` provides them too
+                return [k for k in __dir__() if not k.startswith('_')]
+            if name not in _prefixed:
+                raise AttributeError(
+                    f'module {__name__!r} has no attribute {name!r}')
+            value = globals()[name] = _prefixed.resolve(name)
+            return value
+
+        def __dir__():
+            return sorted({*globals(), *_prefixed.deferred})
+
+# MeasureArray imports numpy, so is only imported when first used
+_getattr = globals().get('__getattr__')
+
+
+def __getattr__(name: str):
+    if name == 'MeasureArray':
+        return core.MeasureArray
+    if _getattr is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return _getattr(name)
@@ -5,17 +5,25 @@ Provide terms (eg `-10degC @ degF` or `30dalton`) to see their value.
 
 Best ran as `python -im noether`, as if no terms are provided,
 a convenient interactive prompt is summoned.
+
+With `--batch`, terms are read from stdin, one per line,
+and their results written to stdout as each is done.
+
+`python -m noether serve` keeps Noether loaded, answering terms
+sent over a Unix socket by `python -m noether_client`.
 """
 
 from os import environ
+import sys
 import noether
-from noether import *
+from noether import Measure
 
 
 from argparse import ArgumentParser
 parser = ArgumentParser(
     description=__doc__,
-    usage='python -[i]m noether [-h] [--no-color] [--value] [terms ...]'
+    usage='python -[i]m noether [-h] [--no-color] [--value] [--batch [--json]] [terms ...]\n'
+          '       python -m noether serve [--socket PATH]'
 )
 parser.add_argument(
     '--no-color',
@@ -26,6 +34,45 @@ parser.add_argument(
     '--value', '-V',
     action='store_true',
     help='If terms are present, display only their numeric value')
+parser.add_argument(
+    '--batch', '--stdin',
+    action='store_true',
+    help='Evaluate each line of stdin as terms, reporting errors per line')
+parser.add_argument(
+    '--json',
+    action='store_true',
+    help='With --batch, read and write JSON lines: '
+         'each line a string or {"expr": terms, "id": any}')
+parser.add_argument(
+    '--socket',
+    help='See `python -m noether serve -h`')
+
+serve_parser = ArgumentParser(
+    prog='python -m noether serve',
+    description='Keep Noether loaded, answering terms sent over a Unix socket'
+                ' by `python -m noether_client`. Stops on ^C or SIGTERM.')
+serve_parser.add_argument(
+    '--socket',
+    help='The Unix socket to listen on (default $XDG_CACHE_HOME/noether/server.sock,'
+         ' or NOETHER_SOCKET)')
+
+# % Serve
+
+# `serve` is a subcommand only as the first argument, as terms follow no grammar
+if sys.argv[1:2] == ['serve']:
+    import os
+    import signal
+    from ._server import serve, SOCKET_PATH
+    args = serve_parser.parse_args(sys.argv[2:])
+    # stop as for ^C, so that the socket is removed
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        serve(args.socket or SOCKET_PATH)
+    except OSError as e:
+        print(e, file=sys.stderr)
+        os._exit(1)
+    sys.stdout.flush()
+    os._exit(0)
 
 # weird args like `-10degC` are thrown to `unknown`,
 # but if we get args with a nargs='*', they may be in the wrong order
@@ -33,13 +80,16 @@ parser.add_argument(
 args, unknown = parser.parse_known_args()
 args.terms = unknown
 
+if args.socket is not None:
+    parser.error('--socket is only used with `python -m noether serve`')
+
 # % Color
 
 if environ.get('NO_COLOR', ''):
     args.color = False
 
 pretty = None
-if args.color and not args.value:
+if args.color and not args.value and not args.batch:
     try:
         from rich import pretty
     except ImportError:
@@ -47,14 +97,26 @@ if args.color and not args.value:
     else:
         pretty.install()
 
+# % Batch
+
+if args.batch:
+    import os
+    from ._batch import run
+    failed = run(
+        noether, sys.stdin, sys.stdout, sys.stderr,
+        value=args.value, as_json=args.json)
+    sys.stdout.flush()
+    os._exit(2 if failed else 0)
+
 # % Eval and print terms
 
 if args.terms:
     from ._tokenizers import cli_dialect, transform
+    from .helpers import ModuleNamespace
     src = transform(" ".join(args.terms), cli_dialect)
     try:
-        del cli_dialect, transform
-        value = eval(src)
+        # names are looked up as used, so unused units are never made
+        value = eval(src, ModuleNamespace(noether))
         if args.value:
             if isinstance(value, Measure):
                 print(value.value)
@@ -85,6 +147,8 @@ if args.terms:
 
 # TODO: allow cli dialect?
 
+from noether import *
+
 print(f'{len(catalogue.units())} units, {len(list(catalogue.prefixes()))} prefixes')
 print('''
 >>> import noether
@@ -96,4 +160,4 @@ if pretty is not None:
 >>> pretty.install()''')
 print()
 
-del ArgumentParser, parser, args, unknown
+del ArgumentParser, parser, serve_parser, args, unknown
@@ -0,0 +1,123 @@
+'''
+Evaluating many terms in one process, for `python -m noether --batch`
+and `python -m noether serve`.
+
+Each line of input is a term, as given on the command line,
+or with `--json` a JSON string or object
+`{"expr": term, "id": any, "options": {config option: value}}`.
+'''
+
+import json
+from types import ModuleType
+from typing import IO, Iterable
+
+from .config import conf
+from ._tokenizers import cli_dialect, transform
+from .core import Measure
+from .helpers import ModuleNamespace
+
+
+class TermGlobals(dict):
+    'Globals for one term, finding any other name in the shared namespace.'
+
+    def __init__(self, namespace: ModuleNamespace):
+        super().__init__()
+        self.namespace = namespace
+
+    def __missing__(self, name: str):
+        return self.namespace[name]
+
+
+class Evaluator:
+    '''
+    Evaluates terms in the cli dialect, sharing one namespace between them
+    so that each name is only looked up once. Each term has globals of its own,
+    so that eg `(meter := second)` cannot change the namespace of the next.
+    '''
+
+    def __init__(self, module: ModuleType):
+        self.namespace = ModuleNamespace(module)
+
+    def __call__(self, term: str):
+        return eval(transform(term, cli_dialect), TermGlobals(self.namespace))
+
+
+def plain_value(value):
+    'The numeric value of a result, or its text, for JSON.'
+    if isinstance(value, Measure):
+        value = value.value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return str(value)
+
+
+def error_text(e: Exception) -> str:
+    return f'{type(e).__name__}: {e}'
+
+
+def parse_json_line(line: str) -> dict:
+    'A JSON line as a request object.'
+    request = json.loads(line)
+    if isinstance(request, str):
+        return {'expr': request}
+    if not isinstance(request, dict) or not isinstance(request.get('expr'), str):
+        raise ValueError('expected a string or an object with an "expr" string')
+    return request
+
+
+def respond(evaluate: Evaluator, line: str) -> dict:
+    '''
+    The response to a JSON line: its result and value, or an error,
+    with any config `options` applied while it is evaluated and shown.
+    '''
+    echo = {}
+    try:
+        request = parse_json_line(line)
+        if 'id' in request:
+            echo['id'] = request['id']
+        with conf.override(**request.get('options', {})):
+            result = evaluate(request['expr'])
+            return {**echo, 'result': repr(result), 'value': plain_value(result)}
+    except Exception as e:
+        return {**echo, 'error': error_text(e)}
+
+
+def run(
+    module: ModuleType,
+    lines: Iterable[str],
+    out: IO[str],
+    err: IO[str],
+    value: bool = False,
+    as_json: bool = False,
+) -> int:
+    '''
+    Evaluate each line, writing one result per line as it is done.
+    Errors are written to `err` (or as `{"error": ...}` with `as_json`)
+    without stopping. Returns the number of lines which failed.
+    '''
+    evaluate = Evaluator(module)
+    failed = 0
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        if as_json:
+            response = respond(evaluate, line)
+            failed += 'error' in response
+            out.write(json.dumps(response, ensure_ascii=False) + '\n')
+
+        else:
+            try:
+                result = evaluate(line)
+            except Exception as e:
+                failed += 1
+                err.write(f'line {number}: {error_text(e)}\n')
+                err.flush()
+                continue
+            if value and isinstance(result, Measure):
+                result = result.value
+            out.write((str(result) if value else repr(result)) + '\n')
+
+        out.flush()
+    return failed
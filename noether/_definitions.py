@@ -0,0 +1,550 @@
+'''
+Importing GNU Units definitions files (`definitions.units`) into a Catalogue,
+for `python -m noether.gnu -f FILE`.
+
+Supported are primitive units (`!` and `!dimensionless`), prefixes (`kilo-`),
+derived units and aliases, which may refer to each other in any order
+or to Noether's own units, along with `!include`, `!set`, `!var`,
+`!locale` and `!utf8`. Nonlinear units (`tempF(x)`) and tables
+(`wiregauge[in]`) are skipped with a warning.
+
+Compiling a large file takes a while, so the result is cached,
+keyed by the contents of the file and of those it includes.
+'''
+
+from fractions import Fraction
+from hashlib import sha256
+from pathlib import Path
+from typing import Callable, Iterator
+import os
+import pickle
+import re
+import warnings
+
+from .errors import NoetherError, NoetherWarning
+from .helpers import get_dot_cache
+from .core import Catalogue, Dimension, Measure, Prefix, Unit, display
+from .core.Prefix import PrefixSet
+from .core.PrefixTrie import PrefixTrie
+
+DEFINITIONS_CACHE = get_dot_cache() / 'noether' / 'definitions'
+DEFINITIONS_CACHE_VERSION = 1
+
+NOETHER_DIR = Path(__file__).parent
+
+Value = Measure | Prefix
+
+
+class DefinitionError(ValueError):
+    pass
+
+
+# % Reading
+
+Definition = tuple[str, str, str]  # name, expression, where (for messages)
+
+
+def _read(path: Path, files: dict[Path, str], variables: dict[str, str]) -> Iterator[Definition]:
+    '''
+    The definitions of a file, in order, following `!include`.
+    Each file read is noted in `files` with the hash of its contents.
+    '''
+    if path in files:
+        return  # already included
+    text = path.read_text(encoding='utf-8')
+    files[path] = sha256(text.encode()).hexdigest()
+
+    # `!var` and `!locale` blocks which are being skipped, innermost last
+    skipping: list[bool] = []
+    lines = text.splitlines()
+    number = 0
+    while number < len(lines):
+        start = number
+        line = lines[number].split('#', 1)[0].rstrip()
+        number += 1
+        while line.endswith('\\') and number < len(lines):
+            line = line[:-1] + ' ' + lines[number].split('#', 1)[0].strip()
+            number += 1
+        if not line.strip():
+            continue
+        where = f'{path.name}:{start + 1}'
+        words = line.split()
+
+        if words[0].startswith('!'):
+            command, arguments = words[0][1:], words[1:]
+            if command in ('endvar', 'endlocale', 'endutf8'):
+                if skipping:
+                    skipping.pop()
+            elif command == 'var' or command == 'varnot':
+                name, values = arguments[0], arguments[1:]
+                matches = os.environ.get(name, variables.get(name)) in values
+                skipping.append(matches == (command == 'varnot'))
+            elif command == 'locale':
+                skipping.append(arguments[:1] != ['en_US'])
+            elif command == 'utf8':
+                skipping.append(False)
+            elif any(skipping):
+                continue
+            elif command == 'include':
+                yield from _read(path.parent / arguments[0], files, variables)
+            elif command == 'set':
+                variables.setdefault(arguments[0], ' '.join(arguments[1:]))
+            # others (!message, !prompt, !unitlist &c) only concern the CLI
+            continue
+
+        if any(skipping):
+            continue
+        if len(words) < 2:
+            warnings.warn(f'{where}: {words[0]!r} has no definition', NoetherWarning)
+            continue
+        name, expression = line.split(None, 1)
+        yield name, expression.strip(), where
+
+
+# % Expressions
+
+TOKEN = re.compile(r'''
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+        | (?P<op>\*\*|[-+*/^|(),])
+        | (?P<name>[^\s\d.+\-*/|^(),~;#][^\s+\-*/|^(),~;#]*)
+    )''', re.VERBOSE)
+
+# `cm3` is `cm^3`
+EXPONENT_SUFFIX = re.compile(r'(.*[^\d_])([2-9])$')
+
+FUNCTIONS: dict[str, Callable] = {
+    'sqrt': lambda x: x ** Fraction(1, 2),
+    'cuberoot': lambda x: x ** Fraction(1, 3),
+}
+
+
+def _tokens(expression: str) -> list[tuple[str, str]]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN.match(expression, position)
+        if match is None or match.end() == position:
+            raise DefinitionError(f'cannot parse {expression[position:]!r}')
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == 'name' and text == 'per':
+            kind, text = 'op', '/'
+        tokens.append((kind, text))
+        position = match.end()
+    return tokens
+
+
+def _plain(value):
+    'Numbers and Measures without any unit, so arithmetic stays cheap.'
+    if isinstance(value, Prefix):
+        return value.value
+    if isinstance(value, Measure) and type(value) is not Measure:
+        return Measure._new(value._value, value.stddev, value.dim)
+    return value
+
+
+class _Parser:
+    '''
+    Evaluates a GNU Units expression. Juxtaposition binds tighter
+    than `*` and `/`, so `W / m^2 K` is `W / (m^2 K)`, and `|` divides
+    numbers only, tightest of all.
+    '''
+
+    def __init__(self, expression: str, resolve: Callable[[str], Value]):
+        self.tokens = _tokens(expression)
+        self.position = 0
+        self.resolve = resolve
+
+    def peek(self) -> tuple[str, str] | None:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def take(self, op: str | None = None) -> tuple[str, str]:
+        token = self.peek()
+        if token is None or (op is not None and token != ('op', op)):
+            raise DefinitionError(f'expected {op or "more"}')
+        self.position += 1
+        return token
+
+    def parse(self):
+        value = self.sum()
+        if self.peek() is not None:
+            raise DefinitionError(f'unexpected {self.peek()[1]!r}')
+        return value
+
+    def sum(self):
+        value = self.product()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            op = self.take()[1]
+            other = self.product()
+            value = value + other if op == '+' else value - other
+        return value
+
+    def product(self):
+        if self.peek() == ('op', '/'):  # e.g. `/s` for `1/s`
+            value = 1
+        else:
+            value = self.juxtaposition()
+        while self.peek() in (('op', '*'), ('op', '/')):
+            op = self.take()[1]
+            other = self.juxtaposition()
+            value = value * other if op == '*' else value / other
+        return value
+
+    def juxtaposition(self):
+        value = self.power()
+        while (token := self.peek()) is not None and (
+                token[0] != 'op' or token[1] == '('):
+            value = value * self.power()
+        return value
+
+    def power(self):
+        value = self.unary()
+        if self.peek() in (('op', '^'), ('op', '**')):
+            self.take()
+            exponent = _plain(self.power())
+            if isinstance(exponent, Measure):
+                if exponent.dim:
+                    raise DefinitionError('exponents must be dimensionless')
+                exponent = exponent._value
+            value = value ** exponent
+        return value
+
+    def unary(self):
+        if self.peek() == ('op', '-'):
+            self.take()
+            return -self.unary()
+        return self.primary()
+
+    def primary(self):
+        kind, text = self.take()
+        if kind == 'number':
+            value = _number(text)
+            if self.peek() == ('op', '|'):
+                self.take()
+                kind, text = self.take()
+                if kind != 'number':
+                    raise DefinitionError('`|` divides numbers only')
+                value = Fraction(value) / Fraction(_number(text))
+            return value
+        if kind == 'name':
+            if text in FUNCTIONS and self.peek() == ('op', '('):
+                self.take('(')
+                value = self.sum()
+                self.take(')')
+                return FUNCTIONS[text](value)
+            return _plain(self.resolve(text))
+        if text == '(':
+            value = self.sum()
+            self.take(')')
+            return value
+        raise DefinitionError(f'unexpected {text!r}')
+
+
+def _number(text: str):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+# % Names
+
+def _singulars(name: str) -> Iterator[str]:
+    'What `name` may be the plural of, as GNU Units understands plurals.'
+    if len(name) > 2 and name.endswith('s'):
+        yield name[:-1]
+        if name.endswith('es'):
+            yield name[:-2]
+        if name.endswith('ies'):
+            yield name[:-3] + 'y'
+
+
+class Resolver:
+    '''
+    Finds units and prefixes by name, as GNU Units does:
+    by exact name, then as a plural, then with any prefix,
+    then as a power (`cm3`). Earlier catalogues take precedence.
+    '''
+
+    def __init__(self, catalogues: list[Catalogue]):
+        self.catalogues = catalogues
+
+    def exact(self, name: str) -> Value | None:
+        for catalogue in self.catalogues:
+            unit = catalogue.units_by_name.get(name)
+            if unit is not None:
+                return unit
+        for catalogue in self.catalogues:
+            if name in catalogue._prefixes:
+                return catalogue._prefixes[name]
+        return None
+
+    def prefixes(self, name: str) -> list[tuple[str, Prefix]]:
+        found = []
+        for catalogue in self.catalogues:
+            found += catalogue._prefixes.matches(name)
+        return sorted(found, key=lambda m: -len(m[0]))
+
+    def _unprefixed(self, name: str) -> Value | None:
+        for candidate in (name, *_singulars(name)):
+            value = self.exact(candidate)
+            if value is not None:
+                return value
+        return None
+
+    def get(self, name: str) -> Value:
+        value = self._unprefixed(name)
+        if value is not None:
+            return value
+
+        for p, prefix in self.prefixes(name):
+            unit = self._unprefixed(name[len(p):])
+            if isinstance(unit, Measure):
+                return prefix * unit
+
+        power = EXPONENT_SUFFIX.match(name)
+        if power is not None:
+            try:
+                base = self.get(power.group(1))
+            except NameError:
+                base = None
+            if isinstance(base, Measure):
+                return _plain(base) ** int(power.group(2))
+
+        raise NameError(f"unknown unit '{name}'")
+
+    __getitem__ = get
+
+
+# % Compiling
+
+class _Compiler(Resolver):
+    '''
+    Resolves the definitions of a file as they are needed,
+    so that they may be given in any order.
+    '''
+
+    def __init__(self, definitions: dict[str, Definition], base: Catalogue, name: str):
+        self.definitions = definitions
+        self.units: dict[str, Value] = {}
+        self.prefix_set = PrefixSet(name)
+        self._prefix_names: PrefixTrie[str] = PrefixTrie()
+        self.primitives: list[Unit] = []
+        self.dimensions: list[tuple[str, str]] = []
+        self.compiling: set[str] = set()
+        self.failed: set[str] = set()
+        self.base = base
+        super().__init__([base])
+
+    def exact(self, name: str) -> Value | None:
+        if name in self.definitions and not name.endswith('-'):
+            return self.define(name)
+        if name + '-' in self.definitions:
+            return self.define(name + '-')
+        return super().exact(name)
+
+    def prefixes(self, name: str) -> list[tuple[str, Prefix]]:
+        return sorted(
+            [(p, self.define(p + '-')) for p, _ in self._prefix_names.matches(name)]
+            + super().prefixes(name),
+            key=lambda m: -len(m[0]))
+
+    def compile(self) -> dict[str, Value]:
+        self._prefix_names = PrefixTrie(
+            (k[:-1], k) for k in self.definitions if k.endswith('-'))
+        for name in self.definitions:
+            try:
+                self.define(name)
+            except DefinitionError:
+                pass  # already warned
+        return self.units
+
+    def define(self, name: str) -> Value:
+        if name in self.units:
+            return self.units[name]
+        _, expression, where = self.definitions[name]
+        if name in self.failed:
+            raise DefinitionError(f'{name!r} is not defined')
+        if name in self.compiling:
+            raise DefinitionError(f'{name!r} is defined circularly')
+
+        self.compiling.add(name)
+        try:
+            value = self._evaluate(name, expression)
+        except (NoetherError, NameError, ArithmeticError, TypeError, ValueError) as e:
+            self.failed.add(name)
+            warnings.warn(f'{where}: cannot define {name!r}: {e}', NoetherWarning)
+            raise DefinitionError(f'{name!r} is not defined') from None
+        finally:
+            self.compiling.discard(name)
+        self.units[name] = value
+        return value
+
+    def _evaluate(self, name: str, expression: str) -> Value:
+        if name.endswith('-'):
+            value = _Parser(expression, self.get).parse()
+            if isinstance(value, Measure):
+                if value.dim:
+                    raise DefinitionError('prefixes must be dimensionless')
+                value = value._value
+            prefix = Prefix(name[:-1], name[:-1], value)
+            self.prefix_set.add(prefix)
+            return prefix
+
+        if expression == '!dimensionless':
+            return Unit(1, name)
+        if expression == '!':
+            return self._primitive(name)
+
+        tokens = _tokens(expression)
+        if len(tokens) == 1 and tokens[0][0] == 'name':
+            # an alias shares its unit
+            unit = self.get(tokens[0][1])
+            if isinstance(unit, Unit):
+                return unit
+
+        value = _Parser(expression, self.get).parse()
+        if isinstance(value, Prefix):
+            value = value.value
+        if not isinstance(value, Measure):
+            value = Measure(value)
+        return Unit(value, name)
+
+    def _primitive(self, name: str) -> Unit:
+        existing = self.base.units_by_name.get(name)
+        if existing is not None and existing.dim.is_base_dimension():
+            return existing  # e.g. `m !`, as Noether's own meter
+        if name not in Dimension._known_dimensions:
+            Dimension.new(name, name)
+            self.dimensions.append((name, name))
+        unit = Unit(Dimension({name: 1}), name, name)
+        self.primitives.append(unit)
+        return unit
+
+
+def compile_definitions(path: Path, base: Catalogue):
+    '''
+    Parse and evaluate a definitions file, returning a Catalogue
+    of its units and prefixes, the new base dimensions and primitive units
+    it made, and the files it read with their hashes.
+    '''
+    files: dict[Path, str] = {}
+    definitions: dict[str, Definition] = {}
+    for definition in _read(path, files, {}):
+        name, expression, where = definition
+        if name.endswith(']') or '(' in name:
+            warnings.warn(
+                f'{where}: {name!r} is a nonlinear unit or table, which are not supported',
+                NoetherWarning)
+            continue
+        # like GNU Units, later definitions take precedence
+        definitions.pop(name, None)
+        definitions[name] = definition
+
+    compiler = _Compiler(definitions, base, path.name)
+    namespace: dict = {
+        k: v for k, v in compiler.compile().items() if not k.endswith('-')}
+    # no unit name ends with `-`, so this can't clash
+    namespace['prefixes-'] = compiler.prefix_set
+    catalogue = Catalogue(namespace, path.name)
+    return catalogue, compiler.dimensions, compiler.primitives, files
+
+
+# % Caching
+
+def _cache_path(path: Path, cache_dir: Path) -> Path:
+    return cache_dir / (sha256(str(path).encode()).hexdigest()[:24] + '.pickle')
+
+
+def _key(path: Path) -> tuple:
+    from .catalogue._lazy import cache_key
+    return DEFINITIONS_CACHE_VERSION, cache_key(NOETHER_DIR / 'catalogue'), str(path)
+
+
+def _unchanged(files: dict[str, str]) -> bool:
+    for file, digest in files.items():
+        try:
+            if sha256(Path(file).read_bytes()).hexdigest() != digest:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _save(cache: Path, key: tuple, compiled, base: Catalogue):
+    catalogue, dimensions, primitives, files = compiled
+    # Noether's own units are referred to by name, staying shared
+    shared = {id(unit): name for name, unit in base.units_by_name.items()}
+
+    class Pickler(pickle.Pickler):
+        def persistent_id(self, obj):
+            if isinstance(obj, Unit) and id(obj) in shared:
+                return shared[id(obj)]
+            return None
+
+    try:
+        os.makedirs(cache.parent, exist_ok=True)
+        temporary = cache.with_suffix('.tmp')
+        with open(temporary, 'wb') as f:
+            pickle.dump((key, {str(p): h for p, h in files.items()}), f)
+            pickle.dump(dimensions, f)
+            Pickler(f, pickle.HIGHEST_PROTOCOL).dump((catalogue, primitives))
+        os.replace(temporary, cache)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        pass  # the cache is only an optimisation
+
+
+def _restore(cache: Path, key: tuple, base: Catalogue) -> Catalogue | None:
+    class Unpickler(pickle.Unpickler):
+        def persistent_load(self, name):
+            return base.units_by_name[name]
+
+    try:
+        with open(cache, 'rb') as f:
+            saved_key, files = pickle.load(f)
+            if saved_key != key or not _unchanged(files):
+                return None
+            # Base dimensions are needed before any Dimension is unpickled
+            for name, symbol in pickle.load(f):
+                if name not in Dimension._known_dimensions:
+                    Dimension.new(name, symbol)
+            catalogue, primitives = Unpickler(f).load()
+    except Exception:
+        return None
+
+    for unit in primitives:
+        if unit.dim not in display.dimension_units:
+            display(unit)
+    return catalogue
+
+
+def load_definitions(
+    path: str | os.PathLike,
+    base: Catalogue | None = None,
+    cache_dir: Path | None = DEFINITIONS_CACHE,
+) -> Catalogue:
+    '''
+    A Catalogue of the units and prefixes defined in a GNU Units file,
+    which may refer to units of `base` (Noether's catalogue by default).
+    The result is cached in `cache_dir` unless it is None.
+    '''
+    if base is None:
+        from .catalogue import catalogue as base
+    path = Path(path).resolve()
+
+    catalogue = None
+    if cache_dir is not None:
+        cache = _cache_path(path, cache_dir)
+        key = _key(path)
+        catalogue = _restore(cache, key, base)
+
+    if catalogue is None:
+        compiled = compile_definitions(path, base)
+        catalogue = compiled[0]
+        if cache_dir is not None:
+            _save(cache, key, compiled, base)
+    return catalogue
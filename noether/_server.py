@@ -0,0 +1,93 @@
+'''
+A long-lived Noether process, for `python -m noether serve`,
+so that each conversion need not import Noether afresh.
+
+Clients connect to a Unix socket and write JSON lines as `--batch --json`
+reads them, each answered by a JSON line in turn. Config `options` given
+with a request apply only to it. See `noether_client.py` for a client.
+
+Terms are evaluated as Python, so the socket is only accessible
+to the user running the server. Each has locals of its own,
+so one client cannot rebind names for another.
+'''
+
+from pathlib import Path
+import json
+import os
+import socket
+import socketserver
+
+from .helpers import get_dot_cache
+from ._batch import Evaluator, respond
+
+# as in noether_client.py
+SOCKET_PATH = Path(
+    os.environ.get('NOETHER_SOCKET')
+    or get_dot_cache() / 'noether' / 'server.sock')
+
+
+class Handler(socketserver.StreamRequestHandler):
+    'Answers each line of a connection until it is closed.'
+    server: 'Server'
+
+    def handle(self):
+        for line in self.rfile:
+            line = line.decode('utf-8', 'replace').strip()
+            if not line:
+                continue
+            response = respond(self.server.evaluate, line)
+            self.wfile.write(
+                json.dumps(response, ensure_ascii=False).encode() + b'\n')
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, evaluate: Evaluator):
+        self.evaluate = evaluate
+        self.path = path
+        # only the user may connect
+        umask = os.umask(0o077)
+        try:
+            super().__init__(str(path), Handler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self):
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def _listening(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def make_server(path: Path = SOCKET_PATH) -> Server:
+    '''
+    A Server evaluating terms with the `noether` namespace,
+    replacing the socket at `path` if no server is listening there.
+    '''
+    import noether
+
+    path = Path(path)
+    if path.exists():
+        if _listening(path):
+            raise OSError(f'A Noether server is already listening on {path}')
+        path.unlink()
+    os.makedirs(path.parent, exist_ok=True)
+    return Server(path, Evaluator(noether))
+
+
+def serve(path: Path = SOCKET_PATH):
+    'Serve until interrupted.'
+    with make_server(path) as server:
+        print(f'Noether listening on {server.path}', flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -16,14 +16,20 @@ StreamProcessor = Callable[[TokenStream], TokenStream]
 def cli_dialect(stream: TokenStream):
     '''
     Process tokens for __main__ dialect, replacing:
-    - `in` -> `inch`
+    - `in` -> `inch`, except the `in` of `for ... in`
     - `-3unit` -> `unit(-3)`
     '''
     queue: deque[TokenInfo] = deque()
+    loops = 0  # `for`s awaiting their `in`
 
     for token in stream:
-        if token.type == NAME and token.string == 'in':
-            token = token._replace(string='inch')
+        if token.type == NAME and token.string == 'for':
+            loops += 1
+        elif token.type == NAME and token.string == 'in':
+            if loops:
+                loops -= 1
+            else:
+                token = token._replace(string='inch')
 
         queue.append(token)
         if len(queue) == 3:
@@ -47,7 +53,14 @@ def cli_dialect(stream: TokenStream):
 def untokenize(stream: TokenStream):
     s = iter(stream)
     assert next(s).type == ENCODING
-    return ''.join(token.string for token in s)
+    out = ''
+    for token in s:
+        # keep names apart, as in `i for i in x`
+        if out[-1:].isidentifier() or out[-1:].isdigit():
+            if token.string[:1].isidentifier() or token.string[:1].isdigit():
+                out += ' '
+        out += token.string
+    return out
 
 
 def transform(text: str, processor: StreamProcessor):
@@ -0,0 +1,359 @@
+'''
+Microbenchmarks for Noether's hot paths.
+
+    python -m noether.bench [--record FILE] [suite ...]
+
+Each suite reports the best time per operation;
+if no suites are given, all are run.
+With --record, results are appended to FILE as JSON lines,
+and compared with the last results recorded there.
+'''
+
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from importlib.util import find_spec
+import json
+import os
+import platform
+from pathlib import Path
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from timeit import Timer
+from typing import Callable, Iterable
+
+Result = tuple[str, float]
+Suite = Callable[[], Iterable[Result]]
+
+suites: dict[str, Suite] = {}
+
+
+def suite(function: Suite | None = None, *, name: str | None = None):
+    '''Register a benchmark suite under its function name, or `name`.'''
+    if function is None:
+        return lambda function: suite(function, name=name)
+    suites[name or function.__name__] = function
+    return function
+
+
+def time_statements(statements: Iterable[str], setup: str = '', repeat: int = 5):
+    '''Yield the best time per execution of each statement.'''
+    for statement in statements:
+        timer = Timer(statement, setup)
+        number, _ = timer.autorange()
+        yield statement, min(timer.repeat(repeat, number)) / number
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in ('s', 1), ('ms', 1e-3), ('µs', 1e-6):
+        if seconds >= scale:
+            return f'{seconds / scale:8.2f} {unit}'
+    return f'{seconds / 1e-9:8.1f} ns'
+
+
+# % Suites
+
+@suite
+def arithmetic():
+    '''Multiplication, addition and powers of Measures and Units.'''
+    return time_statements([
+        'meter * second',
+        'a * b',
+        'a * 3',
+        'a + b',
+        'a - b',
+        'a ** 2',
+        'a ** 0.5',
+    ], setup=(
+        'from noether import meter, second, cm\n'
+        'a = meter(2, 0.1)\n'
+        'b = cm(3)\n'
+    ))
+
+
+@suite
+def numbers():
+    '''Formatting numbers for display.'''
+    return time_statements([
+        'canonical_number(1234567)',
+        'canonical_number(3.14159)',
+        'canonical_number(Fraction(1, 3))',
+        'canonical_number(6.02214076e23)',
+        'canonical_number(1.45, 0.12)',
+        'canonical_number(1.00794, 0.00007, True)',
+    ], setup=(
+        'from fractions import Fraction\n'
+        'from noether.display import canonical_number\n'
+    ))
+
+
+@suite
+def display():
+    '''str() of Measures, with and without a unit of their own.'''
+    return time_statements([
+        'str(a)',
+        'str(b)',
+        'str(c)',
+    ], setup=(
+        'from noether import meter, second, kilogram, ampere, cm\n'
+        'a = cm(3)\n'
+        'b = meter / second * 3\n'
+        'c = meter**3 * kilogram / second**3 / ampere**2 * 2.5\n'
+    ))
+
+
+@suite
+def columns():
+    '''1000 measures formatted one by one, and as a column.'''
+    return time_statements([
+        '[str(m) for m in measures]',
+        'format_column(measures)',
+        '[str(m @ cm) for m in measures]',
+        'format_column(measures, cm)',
+    ], setup=(
+        'from noether import meter, cm\n'
+        'from noether.display import format_column\n'
+        'measures = [meter(i * 1.37) for i in range(1000)]\n'
+    ), repeat=3)
+
+
+@suite
+def comparison():
+    '''Finding the closest everyday comparison for info_comparison.'''
+    return time_statements([
+        'info_comparison.best_comparison(a)',
+        'info_comparison.best_comparison(b)',
+        'max(info_comparison.get_comparisons(a))',
+    ], setup=(
+        'from noether import meter, second\n'
+        'from noether.catalogue.info.comparison import info_comparison\n'
+        'a = meter(3)\n'
+        'b = meter / second * 20\n'
+        'info_comparison.best_comparison(a)\n'
+    ))
+
+# The spectrum suite needs numpy, which is optional
+# numpy is optional, so is only checked for, not imported
+if find_spec('numpy') is not None:
+    @suite
+    def spectrum():
+        '''Naming EM spectrum bands, one wavelength and 1000 at once.'''
+        return time_statements([
+            'spectrum_names(a)',
+            'spectrum_names_array(b)',
+        ], setup=(
+            'import numpy as np\n'
+            'from noether import nm\n'
+            'from noether.catalogue.info.spectrum import spectrum_names, spectrum_names_array\n'
+            'a = nm(500)\n'
+            'b = nm(np.geomspace(1e-3, 1e11, 1000))\n'
+        ))
+
+
+@suite
+def conversion():
+    '''Converting plain numbers between units, by Measure and by converter.'''
+    return time_statements([
+        '(meter(x) @ foot).value',
+        'to_feet(x)',
+        '(degC(x) @ degF).value',
+        'to_fahrenheit(x)',
+        'converter(degC, degF)',
+    ], setup=(
+        'from noether import meter, foot, degC, degF, converter\n'
+        'to_feet = converter(meter, foot)\n'
+        'to_fahrenheit = converter(degC, degF)\n'
+        'x = 37.5\n'
+    ))
+
+
+@contextmanager
+def fresh_environment(config: str = ''):
+    '''
+    Environment variables for a subprocess with the given `noether.toml`,
+    and with none of the user's config or cache.
+    '''
+    with TemporaryDirectory() as tmp:
+        (Path(tmp) / 'noether.toml').write_text(config)
+        yield dict(os.environ, XDG_CONFIG_HOME=tmp, XDG_CACHE_HOME=tmp)
+
+
+def run_python(code: str, env: dict[str, str] | None = None, *flags: str):
+    '''Run `code` in a fresh interpreter, with its output captured as text.'''
+    return subprocess.run(
+        [sys.executable, *flags, '-c', code],
+        env=env, capture_output=True, text=True, check=True)
+
+
+@suite
+def startup():
+    '''`import noether` in a fresh interpreter, with each catalogue option.'''
+    modes = {
+        'eager': '',
+        'lazy': '[CATALOGUE]\nlazy = true\n',
+        'snapshot': '[CATALOGUE]\nsnapshot = true\n',
+    }
+    for mode, config in modes.items():
+        with fresh_environment(config) as env:
+            times = []
+            for _ in range(6):  # the first run writes any cache
+                start = perf_counter()
+                run_python('import noether', env)
+                times.append(perf_counter() - start)
+            yield f'import noether ({mode})', min(times[1:])
+
+
+def subsystem(module: str, depth: int = 3) -> str:
+    '''
+    The part of Noether, or other package, whose import time `module` counts towards:
+    noether modules to `depth` names (noether.catalogue.scientific),
+    and otherwise the top-level package, or stdlib.
+    '''
+    names = module.split('.')
+    if names[0] == 'noether':
+        return '.'.join(names[:depth])
+    if names[0] in sys.stdlib_module_names or names[0] in sys.builtin_module_names:
+        return 'stdlib'
+    return names[0]
+
+
+def import_times(env: dict[str, str] | None = None) -> dict[str, float]:
+    '''
+    Seconds each module took to import, excluding submodules,
+    by `python -X importtime` in a fresh interpreter.
+    Only modules imported by `import noether` are counted.
+    '''
+    result = run_python('import noether', env, '-X', 'importtime')
+
+    # Modules are listed after those they import,
+    # so those of each top-level import precede it
+    times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:'):
+            continue
+        own, _, module = line.removeprefix('import time:').split('|')
+        if not own.strip().isdigit():
+            continue  # the header
+        name = module.strip()
+        times[name] = times.get(name, 0) + int(own) * 1e-6
+        if module[1:] == name:  # top-level
+            if name == 'noether':
+                return times
+            times = {}
+    return times
+
+
+def phase_times(env: dict[str, str] | None = None) -> dict[str, float]:
+    '''
+    Seconds spent in each phase of `import noether` timed by
+    `helpers.import_phase`, such as Config.register, which are
+    work within modules that importtime cannot separate.
+    '''
+    result = run_python(
+        'import json, noether\n'
+        'from noether.helpers import import_phases\n'
+        'print(json.dumps(import_phases))',
+        dict(env or os.environ, NOETHER_IMPORT_PHASES='1'))
+    return json.loads(result.stdout)
+
+
+@suite(name='import')
+def import_breakdown(repeat: int = 5, depth: int = 3):
+    '''
+    Where `import noether` spends its time, by subsystem,
+    then by phase (`phase: ...`), which are counted within subsystems.
+    '''
+    best: dict[str, float] = {}
+    phases: dict[str, float] = {}
+    with fresh_environment() as env:
+        for _ in range(repeat):
+            totals: dict[str, float] = {}
+            for module, seconds in import_times(env).items():
+                key = subsystem(module, depth)
+                totals[key] = totals.get(key, 0) + seconds
+            for key, seconds in totals.items():
+                best[key] = min(best.get(key, seconds), seconds)
+            # timed separately, as timing adds a little to each call
+            for key, seconds in phase_times(env).items():
+                phases[key] = min(phases.get(key, seconds), seconds)
+
+    yield 'total', sum(best.values())
+    yield from sorted(best.items(), key=lambda kv: -kv[1])
+    for key, seconds in sorted(phases.items(), key=lambda kv: -kv[1]):
+        yield f'phase: {key}', seconds
+
+
+# % Recording
+
+def last_record(path: Path, name: str) -> dict[str, float]:
+    '''The last results recorded for suite `name` in `path`.'''
+    results = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                record = json.loads(line)
+                if record['suite'] == name:
+                    results = record['results']
+    except (OSError, ValueError, KeyError):
+        pass
+    return results
+
+
+def record(path: Path, name: str, results: dict[str, float]):
+    '''Append the results of suite `name` to `path`.'''
+    try:
+        from importlib.metadata import version
+        noether_version = version('noether')
+    except Exception:
+        noether_version = None
+
+    with open(path, 'a') as f:
+        f.write(json.dumps({
+            'suite': name,
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'noether': noether_version,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results,
+        }) + '\n')
+
+
+# % Command line
+
+parser = ArgumentParser(
+    description=__doc__.split('\n\n')[0].strip(),
+    usage='python -m noether.bench [-h] [--record FILE] [suite ...]',
+)
+parser.add_argument(
+    'suites', nargs='*', metavar='suite',
+    help=f'Suites to run: {", ".join(suites)}')
+parser.add_argument(
+    '--record', metavar='FILE', type=Path,
+    help='Append results to FILE, showing the change since last recorded')
+
+
+def main(argv: list[str] | None = None):
+    args = parser.parse_args(argv)
+    for name in args.suites:
+        if name not in suites:
+            parser.error(f'unknown suite {name!r}')
+
+    for name in args.suites or suites:
+        print(f'# {name}')
+        previous = last_record(args.record, name) if args.record else {}
+        results = {}
+        for label, seconds in suites[name]():
+            results[label] = seconds
+            line = f'{format_time(seconds)}  {label}'
+            if previous.get(label):
+                line += f'  ({seconds / previous[label] - 1:+.0%})'
+            print(line)
+        if args.record:
+            record(args.record, name, results)
+
+
+if __name__ == '__main__':
+    main()
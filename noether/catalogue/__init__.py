@@ -1,36 +1,92 @@
 from noether.core.Prefix import *
 from noether.config import Config, conf
 
-# Essentials
-from .prefixes import *
-from .dimensions import *
+Config.register('CATALOGUE_lazy', False, help='''\
+Only import units when they are first used (e.g. as `noether.inch`),
+which makes `import noether` faster.
+`from noether import *` then only provides the essentials.''')
 
-# Units are imported in this exact order
-from .data import *
-from .scientific import *
-from .conventional import *
+Config.register('CATALOGUE_snapshot', False, help='''\
+Save the imported catalogue to a cache file, and restore it from there
+while Noether and its import options are unchanged,
+which makes `import noether` faster. Takes precedence over CATALOGUE_lazy.''')
 
 Config.register('CATALOGUE_historical', True, help='''\
 Provide historical units.''')
-if conf.get('CATALOGUE_historical'):
-    from .historic import *
 
 Config.register('CATALOGUE_humorous', True, help='''\
 Provide humorous and fictional units.''')
+
+Config.register('CATALOGUE_all_prefixes_in_namespace', True, help='''\
+Put every prefixed unit (microohm, kibibyte &c) as measures in the Noether namespace.
+This may cause annoyance if you `from noether import *`!''')
+
+# Units are imported in this exact order
+_modules = ['data', 'scientific', 'conventional']
+if conf.get('CATALOGUE_historical'):
+    _modules.append('historic')
 if conf.get('CATALOGUE_humorous'):
-    from .humorous import *
+    _modules.append('humorous')
 
-# Catalogue export
+from sys import modules as _sys_modules
 
-from noether.core.Catalogue import Catalogue  # noqa
-from . import info  # noqa
+_restored = False
+if conf.get('CATALOGUE_snapshot'):
+    from . import _snapshot
 
-catalogue = Catalogue(locals(), 'Noether catalogue')
+    _options_before = set(Config.options)
+    _restored = _snapshot.restore(_sys_modules[__name__])
 
-vars().update({p.prefix: p for p in catalogue.prefixes()})
+if _restored:
+    from . import info  # noqa
 
-Config.register('CATALOGUE_all_prefixes_in_namespace', True, help='''\
-Put every prefixed unit (microohm, kibibyte &c) as measures in the Noether namespace.
-This may cause annoyance if you `from noether import *`!''')
-if conf.get('CATALOGUE_all_prefixes_in_namespace'):
-    vars().update(catalogue.all_prefixed_units())
+else:
+    # Essentials
+    from .prefixes import *
+    from .dimensions import *
+
+    if conf.get('CATALOGUE_snapshot') or not conf.get('CATALOGUE_lazy'):
+        from .data import *
+        from .scientific import *
+        from .conventional import *
+        if 'historic' in _modules:
+            from .historic import *
+        if 'humorous' in _modules:
+            from .humorous import *
+
+    # Catalogue export
+
+    from noether.core.Catalogue import Catalogue  # noqa
+    from . import info  # noqa
+
+    catalogue = Catalogue(locals(), 'Noether catalogue')
+
+    vars().update({p.prefix: p for p in catalogue.prefixes()})
+
+if conf.get('CATALOGUE_lazy') and not conf.get('CATALOGUE_snapshot'):
+    from ._lazy import LazyCatalogue as _LazyCatalogue
+
+    _lazy = _LazyCatalogue(
+        _sys_modules[__name__], _modules, catalogue,
+        conf.get('CATALOGUE_all_prefixes_in_namespace'))
+
+    def __getattr__(name: str):
+        return _lazy.resolve(name)
+
+    def __dir__():
+        return _lazy.names()
+
+elif conf.get('CATALOGUE_all_prefixes_in_namespace'):
+    from ._prefixed import PrefixedNamespace as _PrefixedNamespace
+
+    _prefixed = _PrefixedNamespace(_sys_modules[__name__], catalogue)
+
+    def __getattr__(name: str):
+        return _prefixed.resolve(name)
+
+    def __dir__():
+        return _prefixed.names()
+
+if conf.get('CATALOGUE_snapshot') and not _restored:
+    _snapshot.save(_sys_modules[__name__], [
+        k for k in Config.options if k not in _options_before])
@@ -0,0 +1,225 @@
+'''
+Loading the catalogue on demand, for CATALOGUE_lazy.
+
+Modules are always imported in the same order as an eager import,
+so that display units are chosen identically. An index of which module
+each name needs is built by loading everything once, and cached.
+'''
+
+from importlib import import_module
+import json
+import os
+from pathlib import Path
+from sys import version_info
+from types import ModuleType
+
+from ..config import conf
+from ..helpers import get_dot_cache
+from ..core import Catalogue, Unit, PrefixedUnit
+
+INDEX_FILE = get_dot_cache() / 'noether' / 'catalogue_index.json'
+INDEX_VERSION = 1
+
+# name -> (modules to load, unit name, prefix name)
+# where the value is either namespace[name]
+# or prefix * catalogue.units_by_name[unit]
+Index = dict[str, tuple[int, str | None, str | None]]
+
+
+def star_exports(module: ModuleType) -> dict:
+    'The names `from module import *` would bind.'
+    names = getattr(module, '__all__', None)
+    if names is None:
+        names = [k for k in vars(module) if not k.startswith('_')]
+    return {k: getattr(module, k) for k in names}
+
+
+def cache_key(package: Path) -> str:
+    '''
+    Identifies the catalogue source and the
+    options which change it when imported.
+    '''
+    sources = [
+        (str(p.relative_to(package)), p.stat().st_mtime_ns, p.stat().st_size)
+        for pattern in ('*.py', '*.txt')  # listings such as CODATA.txt
+        for p in sorted(package.rglob(pattern))]
+    options = sorted(
+        (k, v) for k, v in conf._config.items()
+        if k.split('_', 1)[0].isupper())
+    return json.dumps([
+        INDEX_VERSION, version_info[:2], str(package), sources, options])
+
+
+class LazyCatalogue:
+    '''
+    Imports catalogue modules, in order, as their names are requested.
+    '''
+
+    def __init__(
+        self,
+        package: ModuleType,
+        modules: list[str],
+        catalogue: Catalogue,
+        prefixed_in_namespace: bool,
+        index_file: Path = INDEX_FILE,
+    ):
+        self.package = package
+        self.namespace = vars(package)
+        self.modules = modules
+        self.catalogue = catalogue
+        self.prefixed_in_namespace = prefixed_in_namespace
+        self.index_file = index_file
+        self.loaded = 0
+        self.completed = False
+        self._index: Index | None = None
+        # the namespace an eager import would have before prefixed units
+        self._exports = dict(self.namespace)
+        # prefixed units already put in the namespace
+        self._resolved: set[str] = set()
+
+        catalogue._complete = self.complete
+        self.index()
+        self._prune()
+
+    def load(self, count: int):
+        'Ensure the first `count` modules are loaded.'
+        if self.loaded >= min(count, len(self.modules)):
+            return
+        while self.loaded < min(count, len(self.modules)):
+            module = import_module(
+                f'.{self.modules[self.loaded]}', self.package.__name__)
+            exports = star_exports(module)
+            self.namespace.update(exports)
+            self._exports.update(exports)
+            for k, v in exports.items():
+                self.catalogue.register(k, v)
+            self.loaded += 1
+        self._prune()
+
+    def _prune(self):
+        # Names which an eager import would bind to something else
+        # are removed, so that __getattr__ resolves them when needed
+        if self._index is None or self.completed:
+            return
+        for name, (count, unit, _) in self._index.items():
+            if name not in self.namespace:
+                continue
+            if count > self.loaded or (unit is not None and name not in self._resolved):
+                del self.namespace[name]
+
+    def complete(self):
+        'Load everything, leaving the namespace as an eager import would.'
+        if self.completed:
+            return
+        self.index()  # builds the index, and so completes, if out of date
+        if not self.completed:
+            self.load(len(self.modules))
+            self._finish()
+
+    def _finish(self) -> dict[str, Unit]:
+        self.completed = True
+        # Register everything again in the order an eager import does,
+        # as later units may take over names and symbols of earlier ones
+        Catalogue.__init__(self.catalogue, self._exports, self.catalogue.name)
+
+        prefixed = {}
+        if self.prefixed_in_namespace:
+            prefixed = self.catalogue.all_prefixed_units()
+            self.namespace.update(prefixed)
+        conf._remove_unused_keys()
+        return prefixed
+
+    # % Index
+
+    def index(self) -> Index:
+        if self._index is None:
+            key = cache_key(Path(self.package.__file__).parent)
+            self._index = self._read_index(key)
+            if self._index is None:
+                self._index = self._build_index()
+                self._write_index(key, self._index)
+        return self._index
+
+    def _read_index(self, key: str) -> Index | None:
+        try:
+            with open(self.index_file) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('key') != key:
+            return None
+        return {k: tuple(v) for k, v in cached['names'].items()}
+
+    def _write_index(self, key: str, index: Index):
+        try:
+            os.makedirs(self.index_file.parent, exist_ok=True)
+            temporary = self.index_file.with_suffix('.tmp')
+            with open(temporary, 'w') as f:
+                json.dump({'key': key, 'names': index}, f)
+            os.replace(temporary, self.index_file)
+        except OSError:
+            pass  # the index is only an optimisation
+
+    def _build_index(self) -> Index:
+        # Load every module, noting when each name last changed.
+        # This must happen before anything else is loaded.
+        loaded_at: dict[str, int] = {}
+        unit_loaded_at: dict[str, int] = {}
+
+        def note_changes(count: int, before: dict, after: dict, into: dict):
+            for k, v in after.items():
+                if k not in before or before[k] is not v:
+                    into[k] = count
+
+        for count in range(1, len(self.modules) + 1):
+            namespace = dict(self.namespace)
+            units = dict(self.catalogue.units_by_name)
+            self.load(count)
+            note_changes(count, namespace, self.namespace, loaded_at)
+            note_changes(count, units, self.catalogue.units_by_name, unit_loaded_at)
+
+        index: Index = {k: (n, None, None) for k, n in loaded_at.items()}
+
+        # Prefixed units, as found once everything is registered,
+        # and a name under which their unit is found before then
+        unit_names: dict[int, str] = {}
+        for k, u in self.catalogue.units_by_name.items():
+            unit_names.setdefault(id(u), k)
+
+        prefixed = self._finish()
+        for name, unit in prefixed.items():
+            if self._exports.get(name) is unit:
+                continue
+            prefix = None
+            if isinstance(unit, PrefixedUnit):
+                prefix, unit = unit.prefix.prefix, unit.unit
+            key = unit_names.get(id(unit))
+            if key is not None:
+                index[name] = unit_loaded_at.get(key, 0), key, prefix
+        return index
+
+    # % Lookup
+
+    def names(self) -> list[str]:
+        'Every name in the namespace, loaded or not.'
+        return sorted({*self.namespace, *self.index()})
+
+    def resolve(self, name: str):
+        index = self.index()
+        if name in self.namespace:
+            return self.namespace[name]
+        if name not in index:
+            raise AttributeError(
+                f'module {self.package.__name__!r} has no attribute {name!r}')
+
+        count, unit_name, prefix = index[name]
+        self.load(count)
+        if unit_name is None:
+            return self.namespace[name]
+
+        unit: Unit = self.catalogue.units_by_name[unit_name]
+        if prefix is not None:
+            unit = self.catalogue._prefixes[prefix] * unit
+        self._resolved.add(name)
+        self.namespace[name] = unit
+        return unit
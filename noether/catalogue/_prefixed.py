@@ -0,0 +1,45 @@
+'''
+Prefixed units (microohm, kibibyte &c) in the catalogue namespace,
+for CATALOGUE_all_prefixes_in_namespace.
+
+There are thousands, so each is only made when its name is first used.
+'''
+
+from types import ModuleType
+
+from ..core import Catalogue, Prefix, Unit
+
+
+class PrefixedNamespace:
+    '''
+    Binds the names of `catalogue.all_prefixed_units()` in a module,
+    deferring prefixed units to the module's `__getattr__`.
+    '''
+
+    def __init__(self, module: ModuleType, catalogue: Catalogue):
+        self.module = module
+        self.namespace = vars(module)
+        self.deferred: dict[str, tuple[Prefix, Unit]] = {}
+
+        for name, (prefix, unit) in catalogue.prefixed_index().items():
+            if prefix is None:
+                self.namespace[name] = unit
+            elif name in self.namespace:
+                # takes over an existing name, so must be made now
+                self.namespace[name] = prefix * unit
+            else:
+                self.deferred[name] = prefix, unit
+
+    def __contains__(self, name: str):
+        return name in self.deferred
+
+    def resolve(self, name: str) -> Unit:
+        if name not in self.deferred:
+            raise AttributeError(
+                f'module {self.module.__name__!r} has no attribute {name!r}')
+        prefix, unit = self.deferred[name]
+        value = self.namespace[name] = prefix * unit
+        return value
+
+    def names(self) -> list[str]:
+        return sorted({*self.namespace, *self.deferred})
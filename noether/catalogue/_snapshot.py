@@ -0,0 +1,220 @@
+'''
+A pickled snapshot of the fully built catalogue, for CATALOGUE_snapshot.
+
+This restores, in one pass, everything importing the catalogue modules does:
+the namespace of each module, base dimensions and their names,
+display units and registered config options.
+Helper functions such as D() are restored from their code,
+so that a restored module has the same names as an imported one.
+The snapshot is remade whenever Noether's source or import options change.
+'''
+
+from dataclasses import astuple
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+import builtins
+import marshal
+import os
+import pickle
+import sys
+from types import FunctionType, ModuleType
+
+from ..config import Config, conf
+from ..helpers import get_dot_cache
+from ..core import Dimension, PrefixedUnit, display
+from ._lazy import cache_key
+
+SNAPSHOT_FILE = get_dot_cache() / 'noether' / 'catalogue.pickle'
+SNAPSHOT_VERSION = 2
+
+NOETHER_DIR = Path(__file__).parent.parent
+
+# Objects which must stay shared with the rest of Noether
+# rather than be copied, by (module, name)
+SHARED = {
+    id(conf): ('noether.config', 'conf'),
+    id(display): ('noether.core', 'display'),
+}
+
+
+def _snapshot_modules(package: str):
+    'Catalogue modules restored from the snapshot, rather than imported.'
+    for name, module in list(sys.modules.items()):
+        if not name.startswith(package + '.'):
+            continue
+        short = name[len(package) + 1:]
+        # info handlers are classes, so must be imported for real
+        if short.startswith(('_', 'info')):
+            continue
+        yield name, module
+
+
+Reference = tuple[str, str | None]  # module, and qualified name within it
+
+
+class Unportable(Exception):
+    '''A catalogue module defines something which cannot be snapshot.'''
+
+
+def _portable(namespace: dict) -> tuple[dict, dict[str, Reference]]:
+    '''
+    Split a namespace into values which pickle without
+    importing catalogue modules, and references to modules,
+    shared objects, and functions defined in catalogue modules.
+    '''
+    values: dict = {}
+    references: dict[str, Reference] = {}
+    for k, v in namespace.items():
+        if k.startswith('_') and k != '__all__':
+            continue  # module internals, and state of the import itself
+        if isinstance(v, ModuleType):
+            references[k] = v.__name__, None
+        elif id(v) in SHARED:
+            references[k] = SHARED[id(v)]
+        elif isinstance(v, (FunctionType, type)) and \
+                v.__module__.startswith(__package__ + '.'):
+            references[k] = v.__module__, v.__qualname__
+        else:
+            values[k] = v
+    return values, references
+
+
+def _functions(module: ModuleType) -> dict[str, tuple]:
+    '''
+    The code of each function defined in `module`,
+    which are otherwise pickled by importing the module.
+    Private classes and closures are left out, as with other internals.
+    '''
+    functions = {}
+    for k, v in vars(module).items():
+        if not isinstance(v, (FunctionType, type)) or v.__module__ != module.__name__:
+            continue
+        if v.__qualname__ != k:
+            continue  # an alias, or not defined at the top level
+        if isinstance(v, type) or v.__closure__:
+            if k.startswith('_'):
+                continue
+            raise Unportable(f'{module.__name__}.{k}')
+        functions[k] = (
+            marshal.dumps(v.__code__), v.__defaults__,
+            v.__kwdefaults__, v.__annotations__)
+    return functions
+
+
+def _function(module: ModuleType, name: str, saved: tuple) -> FunctionType:
+    code, defaults, kwdefaults, annotations = saved
+    function = FunctionType(marshal.loads(code), vars(module), name, defaults)
+    function.__kwdefaults__ = kwdefaults
+    function.__annotations__ = annotations
+    return function
+
+
+def save(package: ModuleType, options: list[str], path: Path = SNAPSHOT_FILE):
+    '''
+    Save the catalogue as imported into `package`,
+    along with the config `options` it registered.
+    '''
+    modules = {}
+    try:
+        for name, module in _snapshot_modules(package.__name__):
+            modules[name] = (
+                getattr(module, '__file__', None),
+                getattr(module, '__path__', None),
+                _functions(module),
+                _portable(vars(module)))
+    except Unportable:
+        return
+
+    registries = (
+        dict(Dimension._known_dimensions),
+        dict(Dimension._base_index),
+    )
+    state = {
+        'namespace': _portable(vars(package)),
+        'modules': modules,
+        'dimension_names': Dimension._names,
+        'display': vars(display),
+        'options': [astuple(Config.options[k]) for k in options],
+    }
+
+    try:
+        os.makedirs(path.parent, exist_ok=True)
+        temporary = path.with_suffix('.tmp')
+        with open(temporary, 'wb') as f:
+            pickle.dump((SNAPSHOT_VERSION, cache_key(NOETHER_DIR)), f)
+            pickle.dump(registries, f)
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        pass  # the snapshot is only an optimisation
+
+
+def restore(package: ModuleType, path: Path = SNAPSHOT_FILE) -> bool:
+    '''
+    Restore the catalogue into `package`,
+    returning False if there is no up-to-date snapshot.
+    '''
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        return False
+
+    known = dict(Dimension._known_dimensions)
+    base_index = dict(Dimension._base_index)
+    with f:
+        try:
+            if pickle.load(f) != (SNAPSHOT_VERSION, cache_key(NOETHER_DIR)):
+                return False
+            # Base dimensions are needed before any Dimension is unpickled
+            known_dimensions, base_index_saved = pickle.load(f)
+            Dimension._known_dimensions.update(known_dimensions)
+            Dimension._base_index.update(base_index_saved)
+            state = pickle.load(f)
+        except Exception:
+            Dimension._known_dimensions.clear()
+            Dimension._known_dimensions.update(known)
+            Dimension._base_index.clear()
+            Dimension._base_index.update(base_index)
+            return False
+
+    for option in state['options']:
+        name, default, typ, help = option
+        if name not in Config.options:
+            Config.register(name, default, help, typ)
+
+    for dim, names in state['dimension_names'].items():
+        Dimension._names[dim] = names
+    for dim in Dimension._interned.values():
+        dim._items = None
+    vars(display).update(state['display'])
+
+    # Modules and their functions first, so the namespaces may refer to them.
+    # Each is made as importing it would, without running it.
+    modules: dict[str, ModuleType] = {}
+    for name, (file, path_, functions, _) in state['modules'].items():
+        spec = spec_from_file_location(name, file, submodule_search_locations=path_)
+        module = module_from_spec(spec)
+        module.__builtins__ = builtins
+        for k, saved in functions.items():
+            setattr(module, k, _function(module, k, saved))
+        modules[name] = sys.modules[name] = module
+
+    def fill(module: ModuleType, portable: tuple[dict, dict[str, Reference]]):
+        values, references = portable
+        for k, (name, attribute) in references.items():
+            target = modules.get(name) or sys.modules.get(name)
+            if target is None:
+                continue  # e.g. a catalogue module imported only for real
+            for part in attribute.split('.') if attribute is not None else ():
+                target = getattr(target, part)
+            setattr(module, k, target)
+        vars(module).update(values)
+
+    for name, (_, _, _, portable) in state['modules'].items():
+        fill(modules[name], portable)
+    fill(package, state['namespace'])
+
+    for value in vars(package).values():
+        if isinstance(value, PrefixedUnit):
+            PrefixedUnit._remember(value)
+    return True
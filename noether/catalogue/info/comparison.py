@@ -1,57 +1,69 @@
-from typing import Generator
-
+from bisect import bisect_left, bisect_right
 from math import log
+import sys
 
 from noether import Dimension, Measure, MeasureInfo
 
-from .. import angstrom, km, cm, meter, foot
-from .. import year, day, hour, minute, second
-from .. import c, liter
-
 # TODO: incorporate all catalogue units to save effort
 # and then you can move some unusual units to a new `unusual.py`
 
-kmq = km**2
-COMPARISON_MEASURES: dict[str, Measure] = {
-    'average human height': cm(170),
 
-    'a light-minute': c * minute,
-    'a light-second': c * second,
-    'a light-nanosecond': c * second * 1e-9,
+def _comparison_measures() -> dict[str, Measure]:
+    # imported here, as the catalogue may not be loaded yet (CATALOGUE_lazy)
+    from .. import km, cm, meter, foot
+    from .. import minute, second
+    from .. import c, liter
+
+    kmq = km**2
+    return {
+        'average human height': cm(170),
+
+        'a light-minute': c * minute,
+        'a light-second': c * second,
+        'a light-nanosecond': c * second * 1e-9,
 
-    'the length of horse': meter(2.4),
-    'a city block': meter(100),
+        'the length of horse': meter(2.4),
+        'a city block': meter(100),
 
-    'the length of a double-decker bus': meter(18.75),
+        'the length of a double-decker bus': meter(18.75),
 
-    'the length of a football field': meter(104),
-    'the length of an American football field': foot(360),
+        'the length of a football field': meter(104),
+        'the length of an American football field': foot(360),
 
-    # % Area
+        # % Area
 
-    'a football field': meter(104) * meter(68),
-    'an American football field': foot(360) * foot(160),
+        'a football field': meter(104) * meter(68),
+        'an American football field': foot(360) * foot(160),
 
-    'Wales': kmq(20_779),
-    'Isle of Wight': kmq(380),
+        'Wales': kmq(20_779),
+        'Isle of Wight': kmq(380),
 
-    'Rhode Island': kmq(4_000),
-    'Texas': kmq(695_670),
-    'Alaska': kmq(1_700_130),
+        'Rhode Island': kmq(4_000),
+        'Texas': kmq(695_670),
+        'Alaska': kmq(1_700_130),
 
-    'Belgium': kmq(30_528),
-    'Saarland': kmq(2_569.69),
+        'Belgium': kmq(30_528),
+        'Saarland': kmq(2_569.69),
 
-    'Sergipe': kmq(91_910.4),
-    'São Paulo': kmq(1_521.11),
+        'Sergipe': kmq(91_910.4),
+        'São Paulo': kmq(1_521.11),
 
-    # % Speed
-    'the speed of sound in air': meter(343) / second,
-    'average human walk speed': meter(1.42) / second,
+        # % Speed
+        'the speed of sound in air': meter(343) / second,
+        'average human walk speed': meter(1.42) / second,
 
-    # % volume
-    'olympic swimming pool': liter(2_500_000)
-}
+        # % volume
+        'olympic swimming pool': liter(2_500_000)
+    }
+
+
+def __getattr__(name: str):
+    # COMPARISON_MEASURES is built when first used, for CATALOGUE_lazy
+    if name == 'COMPARISON_MEASURES':
+        global COMPARISON_MEASURES
+        COMPARISON_MEASURES = _comparison_measures()
+        return COMPARISON_MEASURES
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 @Measure.Info
@@ -62,15 +74,50 @@ class info_comparison(MeasureInfo):
 
     @classmethod
     def units(cls, dim: Dimension):
-        for k, v in COMPARISON_MEASURES.items():
+        measures = sys.modules[__name__].COMPARISON_MEASURES  # via __getattr__
+        for k, v in measures.items():
             if v.dim == dim:
                 yield k, v
 
         from noether import catalogue
 
+        catalogue.complete()
         for unit in catalogue.units_by_dimension.get(dim, []):
             yield unit.name, unit
 
+    # dimension -> (number of comparisons and catalogue units indexed,
+    # sorted log-magnitudes, and the (order, name, measure) of each, in the same order)
+    _indices: dict[Dimension, tuple[
+        tuple[int, int], list[float], list[tuple[int, str, Measure]]]] = {}
+
+    @classmethod
+    def index(cls, dim: Dimension):
+        '''
+        The comparisons of a dimension sorted by the log of their magnitude,
+        rebuilt when COMPARISON_MEASURES or the catalogue units of that
+        dimension are added to.
+        '''
+        from noether import catalogue
+
+        catalogue.complete()
+        count = (
+            len(sys.modules[__name__].COMPARISON_MEASURES),
+            len(catalogue.units_by_dimension.get(dim, ())))
+        cached = cls._indices.get(dim)
+        if cached is not None and cached[0] == count:
+            return cached[1], cached[2]
+
+        entries = []
+        for order, (name, unit) in enumerate(cls.units(dim)):
+            try:
+                magnitude = log(float(unit._value))
+            except (TypeError, ValueError, OverflowError):
+                continue  # zero, negative or complex: nothing to compare
+            entries.append((magnitude, order, name, unit))
+        entries.sort(key=lambda e: e[:2])
+        cls._indices[dim] = count, [e[0] for e in entries], [e[1:] for e in entries]
+        return cls._indices[dim][1:]
+
     @classmethod
     def get_comparisons(cls, measure: Measure):
         """
@@ -80,16 +127,46 @@ class info_comparison(MeasureInfo):
         """
         for name, unit in cls.units(measure.dim):
 
-            score = -abs(log(measure / unit))
+            # in SI, as `measure / unit` is only displayed differently
+            # for a measure converted with `@`
+            score = -abs(log(measure._value / unit._value))
             if score == 0:
                 continue  # ignore units that are identical
             yield score, name, unit
 
+    @classmethod
+    def best_comparison(cls, measure: Measure) -> tuple[str, Measure] | None:
+        '''
+        The comparison closest to the measure in magnitude,
+        found by bisecting the index of its dimension.
+        '''
+        magnitudes, entries = cls.index(measure.dim)
+        try:
+            target = log(float(measure._value))
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+        # the nearest magnitudes either side, ignoring identical units,
+        # preferring the first registered of any with equal magnitude
+        lo = bisect_left(magnitudes, target)
+        hi = bisect_right(magnitudes, target, lo)
+        nearest = []
+        if lo > 0:
+            nearest.append(bisect_left(magnitudes, magnitudes[lo - 1]))
+        if hi < len(magnitudes):
+            nearest.append(hi)
+        if not nearest:
+            return None
+
+        i = min(nearest, key=lambda i: (abs(target - magnitudes[i]), entries[i][0]))
+        _, name, unit = entries[i]
+        return name, unit
+
     @classmethod
     def info(cls, measure: Measure):
-        comparisons = list(cls.get_comparisons(measure))
-        if not comparisons:
+        best = cls.best_comparison(measure)
+        if best is None:
             return
-        best_score, name, unit = max(comparisons, key=lambda x: x[0])
-        relative = float(measure / unit)
+        name, unit = best
+        relative = float(measure._value / unit._value)
         yield f'{relative:.2f}× {name}'
@@ -1,8 +1,10 @@
+from bisect import bisect_right
+from functools import cache
+
 from noether.core import Measure, MeasureInfo
+from noether.errors import DimensionError
 
-from ..fundamental import meter
 from ..dimensions import length, frequency, energy
-from ..scientific.si import c, h
 
 SPECTRUM: dict[str, tuple[float, float]] = {
     # ISO 21348. spacewx.com/pdf/SET_21348_2004.pdf
@@ -54,13 +56,57 @@ SPECTRUM: dict[str, tuple[float, float]] = {
 }
 
 
+@cache
+def spectrum_index() -> tuple[list[float], list[tuple[str, ...]]]:
+    '''
+    The band boundaries in SPECTRUM, sorted, and the names of the bands
+    covering each interval between them, widest first.
+    `names[i]` is for `[boundaries[i-1], boundaries[i])`, so is found with
+    `bisect_right`, and the first and last are for outside every band.
+    Call `spectrum_index.cache_clear()` after changing SPECTRUM.
+    '''
+    boundaries = sorted({x for band in SPECTRUM.values() for x in band})
+    names = [()]
+    for a, b in zip(boundaries, boundaries[1:]):
+        names.append(tuple(name for _, name in sorted((
+            (hi - lo, name) for name, (lo, hi) in SPECTRUM.items()
+            if lo <= a and b <= hi), reverse=True)))
+    names.append(())
+    return boundaries, names
+
+
 def spectrum_names(wavelength: Measure[float]) -> list[str]:
-    names = []
-    for name, (a, b) in SPECTRUM.items():
-        v_nm = wavelength.value / 1e-9
-        if a <= v_nm < b:
-            names.append((b-a, name))
-    return [name for _, name in sorted(names, reverse=True)]
+    boundaries, names = spectrum_index()
+    return list(names[bisect_right(boundaries, wavelength.value / 1e-9)])
+
+
+def spectrum_names_array(wavelengths) -> list[list[str]]:
+    '''
+    The names of every wavelength of a MeasureArray at once,
+    which may be of frequencies or energies instead. Requires numpy.
+    '''
+    import numpy as np
+
+    boundaries, names = spectrum_index()
+    found = np.searchsorted(
+        boundaries, as_wavelength(wavelengths)._value / 1e-9, side='right')
+    return [list(names[i]) for i in found.ravel()]
+
+
+def as_wavelength(measure):
+    '''
+    The wavelength of light with a given wavelength,
+    frequency or energy, which may be a Measure or a MeasureArray.
+    '''
+    from ..scientific.si import c, h
+    if measure.dim == frequency:
+        return c / measure
+    elif measure.dim == energy:
+        return h*c / measure
+    elif measure.dim != length:
+        raise DimensionError(
+            measure.dim, length, 'Expected a wavelength, frequency or energy.')
+    return measure
 
 
 @Measure.Info
@@ -75,9 +121,4 @@ class info_spectrum(MeasureInfo):
 
     @staticmethod
     def info(measure: Measure):
-        wavelength = measure
-        if measure.dim == frequency:
-            wavelength = c / measure
-        elif measure.dim == energy:
-            wavelength = h*c / measure
-        yield from spectrum_names(wavelength)
+        yield from spectrum_names(as_wavelength(measure))
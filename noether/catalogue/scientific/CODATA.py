@@ -2,7 +2,13 @@
 Automatically-loaded CODATA fundamental physical constants.
 '''
 
-from ...helpers import scanline
+from functools import cache
+from hashlib import sha256
+import os
+from pathlib import Path
+import pickle
+
+from ...helpers import scanline, get_dot_cache, import_phase
 from noether.core import Unit
 from ...config import Config, conf
 from noether.core.Catalogue import Catalogue
@@ -12,6 +18,10 @@ catalogue = Catalogue(vars(si), 'CODATA data-fetching catalogue')
 
 
 COLUMN_LENGTHS = [60, 25, 25]
+
+# Parsed rows, kept between runs as the text parse is slow
+CODATA_CACHE = get_dot_cache() / 'noether' / 'codata.pickle'
+CODATA_CACHE_VERSION = 1
 NAMED_CODATA_UNITS = {
     'atomic_mass_constant': 'u',
     'electron_mass': 'm_e',
@@ -50,43 +60,92 @@ def _fmt_value(string: str):
                  )
 
 
+# (full name, name, value, uncertainty, unit expression)
+Row = tuple[str, str, float, float | None, str]
+
+
+@import_phase('CODATA parsing')
+def _parse(text: str) -> list[Row]:
+    rows: list[Row] = []
+
+    scanning = False
+    for line in text.splitlines():
+        if not scanning:
+            scanning = line.startswith('----')
+            continue
+
+        full_name, value, uncertainty, unit = scanline(
+            line, COLUMN_LENGTHS)
+
+        # if full_name == 'Avogadro constant':
+        #     # TODO: #42 ComposedUnit
+        #     # HACK
+        #     unit = ''
+
+        chunks = full_name.split()
+        if 'in' in chunks and not full_name.startswith('shielding'):
+            continue  # already defined in another unit
+        if chunks[-1] == 'relationship':
+            continue  # unit does not need extra definition
+
+        rows.append((
+            full_name,
+            _fmt_name(full_name),
+            _fmt_value(value),
+            _fmt_value(uncertainty) or None,
+            unit.replace('^', '**').replace(' ', '*'),
+        ))
+
+    return rows
+
+
+@import_phase('CODATA listing')
+def _rows(path: str, cache_path: Path = CODATA_CACHE) -> list[Row]:
+    '''
+    The parsed rows of the CODATA listing at `path`,
+    from `cache_path` if it was parsed from the same listing.
+    '''
+    with open(path, 'rb') as f:
+        source = f.read()
+    key = (CODATA_CACHE_VERSION, sha256(source).hexdigest())
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, rows = pickle.load(f)
+        if cached_key == key:
+            return rows
+    except Exception:
+        pass  # missing, truncated or otherwise unreadable: parse it again
+
+    rows = _parse(source.decode())
+    try:
+        os.makedirs(cache_path.parent, exist_ok=True)
+        temporary = cache_path.with_suffix('.tmp')
+        with open(temporary, 'wb') as f:
+            pickle.dump((key, rows), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_path)
+    except OSError:
+        pass  # the cache is only an optimisation
+    return rows
+
+
+@cache
+def _unit(expression: str) -> Unit:
+    # Many constants share a unit, such as J T**-1
+    return eval(expression, {}, catalogue) if expression else one
+
+
 def _codata(path: str):
     units: dict[str, Unit] = dict()
 
-    scanning = False
-    with open(path) as f:
-        for line in f.readlines():
-            if not scanning:
-                scanning = line.startswith('----')
-                continue
-
-            full_name, value, uncertainty, unit = scanline(
-                line, COLUMN_LENGTHS)
-
-            # if full_name == 'Avogadro constant':
-            #     # TODO: #42 ComposedUnit
-            #     # HACK
-            #     unit = ''
-
-            chunks = full_name.split()
-            if 'in' in chunks and not full_name.startswith('shielding'):
-                continue  # already defined in another unit
-            if chunks[-1] == 'relationship':
-                continue  # unit does not need extra definition
-
-            value = _fmt_value(value)
-            name = _fmt_name(full_name)
-            uncertainty = _fmt_value(uncertainty) or None
-            unit = unit.replace('^', '**').replace(' ', '*')
-            unit = eval(unit, {}, catalogue) if unit else one
-
-            symbol = NAMED_CODATA_UNITS.get(name)
-            units[name] = Unit(
-                unit(value, uncertainty),
-                name,
-                symbol,
-                info=f'{full_name}, CODATA 2018',
-            )
+    for full_name, name, value, uncertainty, unit in _rows(path):
+        symbol = NAMED_CODATA_UNITS.get(name)
+        units[name] = Unit(
+            _unit(unit)(value, uncertainty),
+            name,
+            symbol,
+            info=f'{full_name}, CODATA 2018',
+        )
 
     return units
 
@@ -4,6 +4,8 @@ TOML configuration.
 
 from typing import Generic, TypeVar
 from dataclasses import dataclass
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 import json
 import os
@@ -12,7 +14,7 @@ import toml
 import warnings
 
 from .errors import ConfigWarning
-from .helpers import get_dot_config
+from .helpers import get_dot_config, import_phase
 
 CONF_FILE = get_dot_config() / 'noether.toml'
 
@@ -34,20 +36,21 @@ class ConfigOption(Generic[ConfigType]):
     def at_import(self):
         return self.category.isupper()
 
+    def check(self, value):
+        if not isinstance(value, self.type):
+            raise TypeError(
+                f"conf.{self.name} must be {self.type.__name__},"
+                f" not {type(value).__name__}")
+
 
 def ConfigProperty(option: ConfigOption):
     def getter(self: Config):
-        if option.name in self._config:
-            return self._config[option.name]
-        return option.default
+        return self.get(option.name)
 
     def setter(self: Config, value):
-        typ = option.type
-        if not isinstance(value, typ):
-            raise TypeError(
-                f"conf.{option.name} must be {option.type.__name__},"
-                f" not {type(value).__name__}")
+        option.check(value)
         self._config[option.name] = value
+        self._changed()
 
         if option.at_import:
             warnings.warn(
@@ -58,14 +61,69 @@ def ConfigProperty(option: ConfigOption):
     def deleter(self: Config):
         if option.name in self._config:
             del self._config[option.name]
+            self._changed()
     return property(getter, setter, deleter)
 
 
+class ConfigSnapshot:
+    '''
+    The value of every option at one generation of a Config,
+    as plain attributes (eg `conf.snapshot.display_digits`)
+    for hot paths to read instead of `conf.get`.
+    '''
+
+    def __init__(self, config: 'Config', overrides: dict | None = None):
+        self._config = config
+        self._overrides = overrides or {}
+        self.__dict__.update(
+            (k, self._get(k)) for k in config.options)
+
+    def _get(self, key: str):
+        if key in self._overrides:
+            return self._overrides[key]
+        return self._config._get_global(key)
+
+    def __getattr__(self, key: str):
+        # option registered after this snapshot was taken
+        if '_overrides' not in self.__dict__:
+            raise AttributeError(key)
+        try:
+            value = self._get(key)
+        except KeyError:
+            raise AttributeError(key) from None
+        self.__dict__[key] = value
+        return value
+
+
+class ConfigOverride:
+    '''
+    Options overridden in one context by `Config.override`.
+    '''
+
+    def __init__(self, values: dict):
+        self.values = values
+        self._generation = -1
+        self._snapshot: ConfigSnapshot | None = None
+
+    def snapshot(self, config: 'Config') -> ConfigSnapshot:
+        # rebuilt if the global options change underneath the override
+        if self._snapshot is None or self._generation != config.generation:
+            self._snapshot = ConfigSnapshot(config, self.values)
+            self._generation = config.generation
+        return self._snapshot
+
+
 class Config:
     _config: dict
     options: dict[str, ConfigOption] = dict()
 
+    # incremented whenever an option changes
+    generation: int
+    _snapshot: ConfigSnapshot
+    _overrides: ContextVar[ConfigOverride | None]
+
     @classmethod
+    @import_phase('Config.register')
     def register(
         cls,
         key: str,
@@ -91,6 +149,20 @@ class Config:
             for k, v in self.options.items()}
         self._config.update(value or {})
         self._config.update(kwargs)
+        self.generation = 0
+        self._snapshot = ConfigSnapshot(self)
+        self._overrides = ContextVar(f'noether_config_{id(self)}', default=None)
+
+    def _changed(self):
+        self.generation += 1
+        self._snapshot = ConfigSnapshot(self)
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        override = self._overrides.get()
+        if override is None:
+            return self._snapshot
+        return override.snapshot(self)
 
     def _show_in_repr(self, k: str, v):
         if k not in self.options:
@@ -110,10 +182,17 @@ class Config:
     def reset(self):
         for k in self.options:
             self._config[k] = self.options[k].default
+        self._changed()
 
     # % Attributes
 
     def get(self, key: str):
+        override = self._overrides.get()
+        if override is not None and key in override.values:
+            return override.values[key]
+        return self._get_global(key)
+
+    def _get_global(self, key: str):
         if key in self._config:
             return self._config[key]
         elif key in self.options:
@@ -121,6 +200,31 @@ class Config:
         else:
             raise KeyError('Unknown config key', key)
 
+    @contextmanager
+    def override(self, **options):
+        '''
+        Set options only within the current thread or asyncio task,
+        until the end of the `with` block:
+
+        >>> with conf.override(display_digits=4):
+        ...     print(meter * 3.14159265)
+        3.142 m
+        '''
+        for key, value in options.items():
+            if key not in self.options:
+                raise KeyError('Unknown config key', key)
+            self.options[key].check(value)
+
+        outer = self._overrides.get()
+        if outer is not None:
+            options = outer.values | options
+
+        token = self._overrides.set(ConfigOverride(options))
+        try:
+            yield self
+        finally:
+            self._overrides.reset(token)
+
     # % IO
 
     def categories(self):
@@ -164,6 +268,7 @@ class Config:
             for name, value in cat.items():
                 fullname = f'{cat_name}_{name}'
                 self._config[fullname] = value
+        self._changed()
 
     def _remove_unused_keys(self):
         for name in list(self._config):
@@ -173,6 +278,7 @@ class Config:
                     ConfigWarning, stacklevel=4
                 )
                 del self._config[name]
+        self._changed()
 
     def load(self, path: Path = CONF_FILE):
         self._load(path)
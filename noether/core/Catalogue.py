@@ -3,11 +3,13 @@ Catalogue of units, which may handle interpreting
 units with prefixes.
 '''
 
-from itertools import count
-from ..helpers import removeprefix
+from itertools import chain
+from typing import Callable
+
 from ..config import Config, conf
-from . import Dimension, Unit
+from . import Dimension, Unit, PrefixedUnit
 from .Prefix import PrefixSet, Prefix
+from .PrefixTrie import PrefixTrie
 
 Config.register('UNITS_all_prefixes', False, help='''\
 Allow fetching any unit with any prefix (e.g. gibimeter).''')
@@ -20,27 +22,37 @@ class Catalogue:
     prefix_sets: dict[str, PrefixSet]
     units_by_name: dict[str, Unit]
     units_by_dimension: dict[Dimension, list[Unit]]
-    _prefixes: dict[str, Prefix]
+    _prefixes: PrefixTrie[Prefix]
+    # ids of the units in units_by_dimension
+    _dimension_unit_ids: set[int]
+
+    # Registers any units not yet loaded (see CATALOGUE_lazy)
+    _complete: Callable[[], None] | None
 
     def __init__(self, catalogue: dict, name: str):
         self.name = name
+        self._complete = None
 
         self.dimensions = dict()
         self.prefix_sets = dict()
         self.units_by_name = dict()
         self.units_by_dimension = dict()
-        self._prefixes = dict()
+        self._prefixes = PrefixTrie()
+        self._dimension_unit_ids = set()
 
         for k, v in catalogue.items():
             self.register(k, v)
 
     def register(self, name: str, value: Unit | Dimension | PrefixSet):
         if isinstance(value, Unit):
-            ud = self.units_by_dimension
-            ud.setdefault(value.dim, [])
+            old = self.units_by_name.get(name)
+            if old is not None and old is not value:
+                PrefixedUnit.forget(unit=old)
+
             # celsius == kelvin, therefore we check via `is` #71
-            if any(value is v for v in ud[value.dim]):
-                ud[value.dim].append(value)
+            if id(value) not in self._dimension_unit_ids:
+                self._dimension_unit_ids.add(id(value))
+                self.units_by_dimension.setdefault(value.dim, []).append(value)
 
             self.units_by_name[name] = value
             for n in value.names:
@@ -51,32 +63,56 @@ class Catalogue:
         elif isinstance(value, Dimension):
             self.dimensions[name] = value
         elif isinstance(value, PrefixSet):
+            if name in self.prefix_sets:
+                PrefixedUnit.forget(prefixes=self.prefix_sets[name])
             self.prefix_sets[name] = value
             for prefix in value:
                 self._prefixes[prefix.prefix] = prefix
                 self._prefixes[prefix.symbol] = prefix
 
+    def __setstate__(self, state: dict):
+        # ids are not kept by pickling
+        vars(self).update(state)
+        self._dimension_unit_ids = {
+            id(u) for units in self.units_by_dimension.values() for u in units}
+
+    def complete(self):
+        '''
+        Ensure every unit is registered, if they are being loaded lazily.
+        '''
+        if self._complete is not None:
+            complete, self._complete = self._complete, None
+            complete()
+
     def get_unit(self, name: str):
         for col in (self.prefix_sets, self.dimensions, self.units_by_name):
             if name in col:
                 return col[name]
 
-        for p, prefix in self._prefixes.items():
-            if not name.startswith(p):
-                continue
-            unit_name = removeprefix(name, p)
-            if unit_name not in self.units_by_name:
-                continue
-            unit = self.units_by_name[unit_name]
-            if not prefix in unit.prefixes:
-                if not conf.get('UNITS_all_prefixes'):
-                    continue
-            return prefix.value * unit
+        if self._complete is not None:
+            # a unit not yet loaded may have the name outright (as `km` does),
+            # which an eager import finds before any prefixed unit
+            self.complete()
+            return self.get_unit(name)
+
+        for prefix, unit in self.prefix_splits(name):
+            if prefix in unit.prefixes or conf.snapshot.UNITS_all_prefixes:
+                return prefix * unit
 
         raise NameError(
             f'No unit (or prefixed unit)'
             f' with name {name!r} could be found.')
 
+    def prefix_splits(self, name: str) -> list[tuple[Prefix, Unit]]:
+        '''
+        Every way `name` splits into a prefix and a known unit,
+        longest prefix first, whether or not the unit takes that prefix.
+        '''
+        return [
+            (prefix, self.units_by_name[name[len(p):]])
+            for p, prefix in self._prefixes.matches(name)
+            if name[len(p):] in self.units_by_name]
+
     def get(self, name: str):
         return self.get_unit(name)
         # TODO: allow prefixes, numbers —
@@ -86,23 +122,38 @@ class Catalogue:
         return self.get_unit(name)
 
     def units(self):
+        self.complete()
         return set(self.units_by_name.values())
 
     def prefixes(self):
         for prefix_set in self.prefix_sets.values():
             yield from prefix_set
 
-    def _all_prefixed_units(self):
+    def prefixed_index(self) -> dict[str, tuple[Prefix | None, Unit]]:
+        '''
+        The (prefix, unit) each name of `all_prefixed_units()` refers to,
+        with no prefix for unprefixed units, without making any units.
+        '''
+        self.complete()
+        index: dict[str, tuple[Prefix | None, Unit]] = {}
+        seen: set[int] = set()
         for unit in self.units_by_name.values():
-            yield unit
-            yield from unit.prefixed_units()
+            if id(unit) in seen:
+                continue
+            seen.add(id(unit))
+            for n in chain(unit.names, unit.symbols):
+                index.setdefault(n, (None, unit))
+            for prefix in unit.prefixes:
+                for n in unit.names:
+                    index.setdefault(prefix.prefix + n, (prefix, unit))
+                for s in unit.symbols:
+                    index.setdefault(prefix.symbol + s, (prefix, unit))
+        return index
 
     def all_prefixed_units(self):
-        units: dict[str, Unit] = {}
-        for unit in self._all_prefixed_units():
-            for n, u in unit._namespace().items():
-                units.setdefault(n, u)
-        return units
+        return {
+            n: unit if prefix is None else prefix * unit
+            for n, (prefix, unit) in self.prefixed_index().items()}
 
     def __repr__(self):
         U = len(self.units())
@@ -113,6 +164,7 @@ class Catalogue:
             f' {U} units, {P} prefixes>')
 
     def __json__(self):
+        self.complete()
         return {
             'dimensions': [
                 dim.__json__() for dim in
@@ -0,0 +1,112 @@
+'''
+Conversion of plain values between units,
+without making a Measure for each value.
+'''
+
+from math import log10
+from typing import Callable
+
+from ..config import conf
+from ..errors import DimensionError
+from ..helpers import BoundedCache
+from .Measure import Measure, OPENLINEAR
+from .units import AffineUnit, LogarithmicUnit
+
+CONVERTER_CACHE_SIZE = 1024
+
+
+def _log10(value):
+    if Measure._is_array(value):
+        import numpy as np
+        return np.log10(value)
+    return log10(value)
+
+
+def _to_base(unit: Measure) -> Callable:
+    'Values in `unit` to values in base units, as `unit(x)._value`.'
+    if isinstance(unit, LogarithmicUnit):
+        reference = Measure._extract_value(unit.unit)
+        per_ten = unit.units_per_ten
+        return lambda x: reference * 10 ** (x / per_ten)
+    scale = unit._value
+    if isinstance(unit, AffineUnit):
+        zero = unit.zero_point._value
+        return lambda x: x * scale + zero
+    return lambda x: x * scale
+
+
+def _from_base(unit: Measure) -> Callable:
+    'Values in base units to values in `unit`, as `(m @ unit).value`.'
+    if isinstance(unit, LogarithmicUnit):
+        reference = Measure._extract_value(unit.unit)
+        per_ten = unit.units_per_ten
+        return lambda v: _log10(v / reference) * per_ten
+    scale = unit._value
+    if isinstance(unit, AffineUnit):
+        zero = unit.zero_point._value
+        return lambda v: (v - zero) / scale
+    return lambda v: v / scale
+
+
+class Converter:
+    '''
+    Converts numbers or arrays in one unit to the same in another,
+    with the dimensions checked once, when made.
+    >>> to_fahrenheit = converter(degC, degF)
+    >>> to_fahrenheit(100)
+    212.0
+    '''
+
+    __slots__ = ('source', 'target', '_convert')
+
+    source: Measure
+    target: Measure
+
+    def __init__(self, source: Measure, target: Measure):
+        if not conf.snapshot.measure_ignore_dimension:
+            DimensionError.check(
+                source.dim, target.dim,
+                f"Cannot convert {source} to {target}."
+                f" Enable conf.{OPENLINEAR} to bypass this.")
+        self.source = source
+        self.target = target
+
+        nonlinear = (AffineUnit, LogarithmicUnit)
+        if isinstance(source, nonlinear) or isinstance(target, nonlinear):
+            to_base, from_base = _to_base(source), _from_base(target)
+            self._convert = lambda x: from_base(to_base(x))
+        else:
+            scale, target_scale = source._value, target._value
+            self._convert = lambda x: x * scale / target_scale
+
+    def __call__(self, value):
+        return self._convert(value)
+
+    def __repr__(self):
+        return f'converter({self.source!r}, {self.target!r})'
+
+
+# (id(source), id(target)) -> Converter
+_converters: BoundedCache[tuple[int, int], Converter] = \
+    BoundedCache(CONVERTER_CACHE_SIZE)
+
+
+def converter(source: Measure, target: Measure) -> Converter:
+    '''
+    A Converter from values in `source` to values in `target`,
+    shared with every other call for the same pair of units.
+    '''
+    key = (id(source), id(target))
+    found = _converters.get(key)
+    # ids may be reused once a unit is garbage collected
+    if found is None or found.source is not source or found.target is not target:
+        found = Converter(source, target)
+        _converters[key] = found
+    elif found.source.dim is not found.target.dim:
+        # made while conf.measure_ignore_dimension was enabled
+        if not conf.snapshot.measure_ignore_dimension:
+            found = Converter(source, target)
+    return found
+
+
+converter.cache_info = _converters.cache_info  # type: ignore
@@ -1,13 +1,14 @@
 from collections import namedtuple
 from fractions import Fraction
-from functools import wraps
+from functools import lru_cache, wraps
+from itertools import zip_longest
+from math import gcd, lcm
 from typing import ClassVar
 
-from noether.helpers import Rational
+from noether.helpers import Rational, Real
 from noether.helpers import reorder_dict_by_values
 from noether.Multiplication import Multiplication
 
-from noether.display import DISPLAY_REPR_CODE
 
 from ..config import conf
 
@@ -16,22 +17,45 @@ BaseDimension = str
 DimInfo = namedtuple('DimInfo', ('order', 'symbol'))
 BaseDimDict = dict[BaseDimension, Rational]
 
+# Most programs only ever combine a handful of dimensions
+OPERATION_CACHE_SIZE = 1024
+
+
+# Exponents as integer numerators over a common denominator,
+# indexed by Dimension._base_index, without trailing zeros.
+DimVector = tuple[tuple[int, ...], int]
+
 
 class Dimension(Multiplication[BaseDimension]):
     '''
     Dimension of a unit, such as time, speed or temperature.
+
+    Dimensions are interned: there is only ever one Dimension object
+    for a given set of exponents, so they may be compared with `is`.
     '''
 
+    __slots__ = ('_hash', '_items', '_vector')
+    _hash: int
+    _items: 'list[tuple[BaseDimension, Rational]] | None'
+    _vector: DimVector
+
     # Known base dimensions
     _known_dimensions: ClassVar[dict[BaseDimension, DimInfo]] = dict()
 
+    # Position of each base dimension in a DimVector.
+    # Unlike _known_dimensions, this is never reordered.
+    _base_index: ClassVar[dict[BaseDimension, int]] = dict()
+
     # Known composed dimension names
     _names: ClassVar[dict['Dimension', list[str]]] = dict()
 
+    # The canonical Dimension for each set of exponents
+    _interned: ClassVar[dict[DimVector, 'Dimension']] = dict()
+
     # Instantiation
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         dimensions: BaseDimension | BaseDimDict | None = None,
         *names: str
     ):
@@ -40,21 +64,147 @@ class Dimension(Multiplication[BaseDimension]):
             dims = {dimensions: 1}
         elif isinstance(dimensions, dict):
             dims = dimensions
-            well_formed = all(
-                isinstance(d, BaseDimension)
-                and d in type(self)._known_dimensions
-                for d, exp in dimensions.items()
-            )
-            if not well_formed:
-                raise TypeError(
-                    "Malformed Dimension."
-                    " Use e.g. `length = Dimension.new(...)`"
-                    " and compose derived dimensions.")
-
-        super().__init__(dims)
-        self._names.setdefault(self, [])
+        well_formed = all(
+            isinstance(d, BaseDimension)
+            and d in cls._known_dimensions
+            for d in dims
+        )
+        if not well_formed:
+            raise TypeError(
+                "Malformed Dimension."
+                " Use e.g. `length = Dimension.new(...)`"
+                " and compose derived dimensions.")
+
+        dims = {d: exp for d, exp in dims.items() if exp}
+        key = cls._vector_of(dims)
+        self = cls._interned.get(key)
+        if self is not None:
+            return self
+
+        self = super().__new__(cls)
+        dict.__init__(self, dims)
+        self._hash = hash(key)
+        self._items = None
+        self._vector = key
+        # another thread may have beaten us to it
+        self = cls._interned.setdefault(key, self)
+        cls._names.setdefault(self, [])
+        return self
+
+    def __init__(
+        self,
+        dimensions: BaseDimension | BaseDimDict | None = None,
+        *names: str
+    ):
+        # exponents are set by __new__
         self._names[self].extend(names)
 
+    # Exponent vectors
+
+    @classmethod
+    def _vector_of(cls, dims: BaseDimDict) -> DimVector:
+        fractions = {cls._base_index[d]: Fraction(exp)
+                     for d, exp in dims.items()}
+        if not fractions:
+            return (), 1
+        denominator = lcm(*(f.denominator for f in fractions.values()))
+        vector = [0] * (max(fractions) + 1)
+        for i, f in fractions.items():
+            vector[i] = f.numerator * (denominator // f.denominator)
+        return tuple(vector), denominator
+
+    @staticmethod
+    def _normalise(vector: tuple[int, ...], denominator: int) -> DimVector:
+        g = 1 if denominator == 1 else gcd(denominator, *vector)
+        if g != 1:
+            vector = tuple(v // g for v in vector)
+            denominator //= g
+        while vector and not vector[-1]:
+            vector = vector[:-1]
+        return vector, denominator
+
+    def _vector_geo(self, value: 'Dimension', direction: int):
+        (a, da), (b, db) = self._vector, value._vector
+        if da == db:
+            vector = tuple(
+                x + y * direction
+                for x, y in zip_longest(a, b, fillvalue=0))
+        else:
+            denominator = lcm(da, db)
+            ma, mb = denominator // da, (denominator // db) * direction
+            vector = tuple(
+                x * ma + y * mb
+                for x, y in zip_longest(a, b, fillvalue=0))
+            da = denominator
+
+        result = self._interned.get(self._normalise(vector, da))
+        if result is None:
+            # not seen before, so build (and intern) it from exponents
+            result = super()._geo(value, direction)
+        return result
+
+    def _vector_pow(self, exponent: Real):
+        vector, denominator = self._vector
+        if isinstance(exponent, int):
+            numerator = exponent
+        else:
+            power = Fraction(exponent)
+            numerator = power.numerator
+            denominator *= power.denominator
+        result = self._interned.get(self._normalise(
+            tuple(v * numerator for v in vector), denominator))
+        if result is None:
+            result = super().__pow__(exponent)
+        return result
+
+    # Operations, memoised
+
+    @staticmethod
+    @lru_cache(maxsize=OPERATION_CACHE_SIZE)
+    def _operation(a: 'Dimension', b: 'Dimension | Real', op: str) -> 'Dimension':
+        if op == '**':
+            return a._vector_pow(b)  # type: ignore
+        return a._vector_geo(b, +1 if op == '*' else -1)  # type: ignore
+
+    @classmethod
+    def cache_info(cls):
+        '''
+        Hits and misses of the table of `*`, `/` and `**` results.
+        '''
+        return cls._operation.cache_info()
+
+    def _geo(self, value: 'BaseDimension | Dimension', direction: int):
+        if not isinstance(value, Dimension):
+            return super()._geo(value, direction)
+        return self._operation(self, value, '*' if direction == 1 else '/')
+
+    def __pow__(self, exponent: Real):
+        return self._operation(self, exponent, '**')
+
+    def __reduce__(self):
+        return (type(self), (dict(self), ))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    # Interned, so identity is equality
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, Dimension):
+            return self is other
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        if isinstance(other, Dimension):
+            return self is not other
+        return dict.__ne__(self, other)
+
     @classmethod
     def new(
         cls,
@@ -66,7 +216,10 @@ class Dimension(Multiplication[BaseDimension]):
         Register a new base dimension and return its unit.
         '''
         cls._known_dimensions[name] = DimInfo(order, symbol)
+        cls._base_index.setdefault(name, len(cls._base_index))
         reorder_dict_by_values(cls._known_dimensions)
+        for dim in cls._interned.values():
+            dim._items = None  # order may have changed
         self = cls({name: Fraction(1)}, name)
         display.display(self)
         return self
@@ -76,11 +229,13 @@ class Dimension(Multiplication[BaseDimension]):
         return list(self.values()) == [Fraction(1)]
 
     def items(self):
-        exponents = list(super().items())
-        # positive first, then negative
-        exponents.sort(key=lambda q: (
-            q[1] < 0, self._known_dimensions[q[0]].order))
-        return exponents
+        if self._items is None:
+            exponents = list(super().items())
+            # positive first, then negative
+            exponents.sort(key=lambda q: (
+                q[1] < 0, self._known_dimensions[q[0]].order))
+            self._items = exponents
+        return list(self._items)
 
     # |~~\ '      |
     # |   ||(~|~~\|/~~|\  /
@@ -122,7 +277,7 @@ class Dimension(Multiplication[BaseDimension]):
         return super().__repr__()
 
     def __repr__(self):
-        if conf.get(DISPLAY_REPR_CODE):
+        if conf.snapshot.display_repr_code:
             return super().__repr__()
         return self.__noether__()
 
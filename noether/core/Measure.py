@@ -4,13 +4,13 @@ from typing import Callable, Optional, TypeVar, ClassVar, Generic, TYPE_CHECKING
 from dataclasses import dataclass
 from functools import total_ordering
 import operator
+import sys
 from sys import version_info
 from datetime import date, datetime, timedelta
 
 from ..helpers import MeasureValue
 from ..errors import NoetherError, DimensionError
 from ..config import Config, conf
-from ..display import DISPLAY_REPR_CODE
 
 from .Prefix import Prefix
 from .Dimension import Dimension, dimensionless
@@ -50,10 +50,26 @@ class Measure(Generic[T]):
     stddev: Optional[T] = None
     dim: Dimension
 
+    # Operands which are handed off to MeasureArray,
+    # set once numpy has been imported (see _is_array)
+    _array_types: ClassVar[tuple[type, ...]] = ()
+    # numpy should defer to us in e.g. `ndarray * Measure`
+    __array_priority__: ClassVar[int] = 1000
+
     @property
     def value(self):
         return self._value
 
+    @classmethod
+    def _is_array(cls, value) -> bool:
+        '''
+        Whether `value` is handed off to MeasureArray. Noether does not import
+        numpy itself, so MeasureArray is only loaded once something else has.
+        '''
+        if not cls._array_types and 'numpy' in sys.modules:
+            from . import _MeasureArray  # sets _array_types
+        return isinstance(value, cls._array_types)
+
     def __init__(
         self,
         value: "Measure[T] | T | timedelta" = 1,
@@ -90,6 +106,20 @@ class Measure(Generic[T]):
                 raise TypeError('stddev must be a real number, not a'
                                 f' {type(self.stddev).__name__}')
 
+    # Trusted construction, for values computed from already validated Measures
+
+    def _set(self, value: T, stddev: Optional[T], dim: Dimension):
+        # bypass Frozen, and the checks in __init__
+        object.__setattr__(self, '_value', value)
+        object.__setattr__(self, 'stddev', stddev)
+        object.__setattr__(self, 'dim', dim)
+
+    @classmethod
+    def _new(cls, value: T, stddev: Optional[T], dim: Dimension) -> 'Measure':
+        self = object.__new__(cls)
+        self._set(value, stddev, dim)
+        return self
+
     def cast(self, to: type):
         return Measure(
             to(self._value),
@@ -152,7 +182,7 @@ class Measure(Generic[T]):
 
     def to_timedelta(self):
         from ..catalogue.fundamental import second  # type: ignore
-        if not conf.get(OPENLINEAR):
+        if not conf.snapshot.measure_ignore_dimension:
             DimensionError.check(
                 self.dim, second.dim,
                 f"Cannot convert to a timedelta."
@@ -164,9 +194,23 @@ class Measure(Generic[T]):
     # |__/ |_)|__/|\__| \/
     #         |        _/
 
+    # (config snapshot, number of handlers, handlers enabled by that snapshot)
+    _enabled_handlers: ClassVar[tuple] = (None, 0, [])
+
+    @classmethod
+    def _enabled_info_handlers(cls) -> list[type[MeasureInfo]]:
+        snapshot = conf.snapshot
+        cached, count, handlers = Measure._enabled_handlers
+        if cached is not snapshot or count != len(cls.info_handlers):
+            handlers = [
+                h for h in cls.info_handlers
+                if getattr(snapshot, h.__name__)]
+            Measure._enabled_handlers = snapshot, len(cls.info_handlers), handlers
+        return handlers
+
     def _info(self):
-        for handler in self.info_handlers:
-            if conf.get(handler.__name__) and handler.should_display(self):
+        for handler in self._enabled_info_handlers():
+            if handler.should_display(self):
                 for i in handler.info(self):
                     yield i, handler.style
 
@@ -175,7 +219,7 @@ class Measure(Generic[T]):
         return display.dimension_unit(self.dim)
 
     def __repr__(self):
-        if conf.get(DISPLAY_REPR_CODE):
+        if conf.snapshot.display_repr_code:
             return self._repr_code()
         return self.__noether__()
 
@@ -229,10 +273,15 @@ class Measure(Generic[T]):
                 se = self.epsilon or 0
                 oe = other.epsilon or 0
                 stddev = value * (se**2 + oe**2)**0.5
-        else:
+        elif isinstance(other, MeasureValue):
             value = op(self._value, other)
+        elif self._is_array(other):
+            from ._MeasureArray import MeasureArray
+            return op(MeasureArray(self), other)
+        else:
+            return Measure(op(self._value, other), stddev, dim)
 
-        return Measure(value, stddev, dim)
+        return Measure._new(value, stddev, dim)
 
     def __mul__(self, other): return self.__geo(other)
     def __rmul__(self, other): return self.__geo(other)
@@ -242,15 +291,18 @@ class Measure(Generic[T]):
     def __rtruediv__(self, other): return other * self**-1
 
     def __call__(self, value: MeasureValue, stddev: Optional[MeasureValue] = None):
+        if not isinstance(value, MeasureValue) and self._is_array(value):
+            from ._MeasureArray import MeasureArray
+            return self * MeasureArray(value, stddev)
         return self * Measure(value, stddev)
 
     def __pow__(self, exp):
-        return Measure(
-            self._value ** exp,
-            (None if self.epsilon is None
-                else (self._value ** exp) * self.epsilon * exp),
-            self.dim ** exp,
-        )
+        value = self._value ** exp
+        stddev = None if self.epsilon is None else value * self.epsilon * exp
+        if isinstance(value, MeasureValue) and isinstance(exp, MeasureValue):
+            return Measure._new(value, stddev, self.dim ** exp)
+        # eg a complex root of a negative value, rejected by __init__
+        return Measure(value, stddev, self.dim ** exp)
 
     # |  '
     # |  ||/~\ /~//~~||/~\
@@ -263,7 +315,7 @@ class Measure(Generic[T]):
         return self if self._value > 0 else -self  # type: ignore
 
     def __lin_cmp(self, other, op: Callable):
-        if conf.get(OPENLINEAR):
+        if conf.snapshot.measure_ignore_dimension:
             return
 
         match op:
@@ -280,7 +332,7 @@ class Measure(Generic[T]):
                 f"{oper} only works on units of the same dimension."
                 f" Enable conf.{OPENLINEAR} to bypass this.")
 
-        elif self.dim and not conf.get(BARENUMBER):
+        elif self.dim and not conf.snapshot.measure_barenumber:
             raise NoetherError(
                 f"{oper} only works on Measures and Units."
                 f" Enable conf.{BARENUMBER} to bypass this.")
@@ -291,6 +343,11 @@ class Measure(Generic[T]):
                 return op(other, self.to_timedelta())
             else:
                 return op(self.to_timedelta(), other)
+        if not isinstance(other, (Measure, Dimension, MeasureValue)) and self._is_array(other):
+            from ._MeasureArray import MeasureArray
+            if reverse:
+                return op(other, MeasureArray(self))
+            return op(MeasureArray(self), other)
 
         self.__lin_cmp(other, op)
 
@@ -313,8 +370,10 @@ class Measure(Generic[T]):
                 value = op(other, self._value)
             else:
                 value = op(self._value, other)
+            if not isinstance(other, MeasureValue):
+                return Measure(value, stddev, dim)
 
-        return Measure(value, stddev, dim)
+        return Measure._new(value, stddev, dim)
 
     def __add__(self, other): return self.__lin(other, operator.add)
     def __radd__(self, other): return self.__lin(other, operator.add)
@@ -329,18 +388,22 @@ class Measure(Generic[T]):
 
     @staticmethod
     def _extract_dim(v: 'Measure | MeasureValue') -> Dimension:
-        return v.dim if isinstance(v, Measure) else Dimension()  # type: ignore
+        return v.dim if isinstance(v, Measure) else dimensionless  # type: ignore
 
     @staticmethod
     def _extract_value(v: 'Measure | MeasureValue') -> MeasureValue:
         return v._value if isinstance(v, Measure) else v  # type: ignore
 
     def __eq__(self, other):
-        if self._extract_dim(other) != self.dim and not conf.get(OPENLINEAR):
+        if not isinstance(other, Measure) and self._is_array(other):
+            return NotImplemented
+        if self._extract_dim(other) is not self.dim and not conf.snapshot.measure_ignore_dimension:
             return False
         return self._value == self._extract_value(other)
 
     def __lt__(self, other):
+        if not isinstance(other, Measure) and self._is_array(other):
+            return NotImplemented
         self.__lin_cmp(other, operator.lt)
         return self._value < self._extract_value(other)
 
@@ -375,8 +438,37 @@ class Measure(Generic[T]):
     def __rmatmul__(self, display_this: 'Measure | timedelta'):
         if isinstance(display_this, timedelta):
             display_this = self.from_timedelta(display_this)
+        if self._is_array(display_this):
+            from ._MeasureArray import MeasureArray
+            return MeasureArray(display_this) @ self
         return Measure(display_this) @ self
 
+    # Pickling. The dataclass only knows the fields of Measure itself,
+    # while subclasses such as Unit add slots and attributes of their own.
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            for name in [slots] if isinstance(slots, str) else slots:
+                if name not in ('__dict__', '__weakref__') and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    # numpy protocols
+
+    def __array_ufunc__(self, ufunc, method: str, *inputs, **kwargs):
+        from ._MeasureArray import array_ufunc
+        return array_ufunc(ufunc, method, *inputs, **kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        from ._MeasureArray import array_function
+        return array_function(func, types, args, kwargs)
+
 
 # Avoid import loops
 from .MeasureRelative import MeasureRelative  # noqa
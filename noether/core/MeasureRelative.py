@@ -29,11 +29,11 @@ class MeasureRelative(Measure):
         return value / self.unit._value
 
     def __init__(self, measure: Measure, unit: 'Unit'):
-        Measure.__init__(self, measure)
+        self._set(measure._value, measure.stddev, measure.dim)
         object.__setattr__(self, 'unit', unit)
 
     def display_unit(self):
-        if not conf.get(OPENLINEAR):
+        if not conf.snapshot.measure_ignore_dimension:
             DimensionError.check(
                 self.dim, self.unit.dim,
                 f"To use @ on units with different dimensions, enable conf.{OPENLINEAR}.")
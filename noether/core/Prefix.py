@@ -36,7 +36,7 @@ class Prefix(Generic[T]):
 
         if isinstance(measure, Unit):
             if not isinstance(measure, PrefixedUnit):
-                return PrefixedUnit(self, measure)
+                return PrefixedUnit.of(self, measure)
 
         return self.value * measure
 
@@ -59,6 +59,9 @@ class PrefixSet(set[Prefix]):
             f'{self.name} | {other.name}',
             set(self) | set(other))
 
+    def __reduce__(self):
+        return (type(self), (self.name, list(self)))
+
     def __repr__(self):
         return f'PrefixSet({self.name!r}, {set(self)!r})'
 
@@ -0,0 +1,72 @@
+'''
+Character trie for splitting names such as `kilometre` into a prefix and the rest.
+'''
+
+from typing import Generic, Iterable, TypeVar
+
+V = TypeVar('V')
+
+# Key under which a node stores the value ending there.
+# No character is the empty string, so it can't clash with a child.
+_END = ''
+
+
+class PrefixTrie(Generic[V]):
+    '''
+    Maps strings to values, looking up every key that
+    a string starts with in time proportional to its length.
+
+    >>> trie = PrefixTrie([('k', 1e3), ('kilo', 1e3), ('Ki', 1024)])
+    >>> trie.matches('kilometre')
+    [('kilo', 1000.0), ('k', 1000.0)]
+    '''
+
+    __slots__ = ('_root', '_size')
+
+    def __init__(self, items: Iterable[tuple[str, V]] = ()):
+        self._root: dict = {}
+        self._size = 0
+        for key, value in items:
+            self[key] = value
+
+    def __setitem__(self, key: str, value: V):
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        if _END not in node:
+            self._size += 1
+        node[_END] = value
+
+    def __getitem__(self, key: str) -> V:
+        node = self._root
+        for char in key:
+            node = node[char]
+        return node[_END]
+
+    def __contains__(self, key: str):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        return self._size
+
+    def matches(self, string: str) -> list[tuple[str, V]]:
+        '''
+        Every (key, value) where `string` starts with key, longest first.
+        '''
+        found = []
+        node = self._root
+        for i, char in enumerate(string):
+            if _END in node and i:
+                found.append((string[:i], node[_END]))
+            node = node.get(char)
+            if node is None:
+                break
+        else:
+            if _END in node:
+                found.append((string, node[_END]))
+        found.reverse()
+        return found
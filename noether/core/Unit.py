@@ -10,10 +10,10 @@ from noether.helpers import Rational, Real, removeprefix
 
 from ..errors import NoetherError
 from ..config import conf
-from ..display import DISPLAY_REPR_CODE, canonical_number
+from ..display import canonical_number
 from .Prefix import PrefixSet
 from .Dimension import Dimension
-from .Measure import Measure, UNCERTAINTY_SHORTHAND
+from .Measure import Measure
 
 
 class Unit(Measure):
@@ -33,8 +33,11 @@ class Unit(Measure):
         info: str | None = None,
     ):
         if isinstance(measure, Dimension):
-            measure = Measure(dim=measure)
-        super().__init__(measure)
+            self._set(1, None, measure)
+        elif isinstance(measure, Measure):
+            self._set(measure._value, measure.stddev, measure.dim)
+        else:
+            super().__init__(measure)
 
         def setattr(x, v):
             # bypass Frozen
@@ -109,7 +112,7 @@ class Unit(Measure):
     #         |        _/
 
     def __repr__(self):
-        if conf.get(DISPLAY_REPR_CODE):
+        if conf.snapshot.display_repr_code:
             return self._repr_code()
         return self.__noether__()
 
@@ -159,7 +162,7 @@ class Unit(Measure):
             val: Real = measure  # type: ignore
             stddev = None
 
-        v = canonical_number(val, stddev, conf.get(UNCERTAINTY_SHORTHAND))
+        v = canonical_number(val, stddev, conf.snapshot.uncertainty_display_shorthand)
         if self.dim or self.symbols:
             v += ' ' + self.symbol
         return v
@@ -3,6 +3,7 @@ from typing import TypeVar
 from .Unit import Unit
 from .UnitSet import UnitSet
 from .Dimension import Dimension
+from ..helpers import import_phase
 
 
 class DisplayHandler:
@@ -15,10 +16,18 @@ class DisplayHandler:
     dimension_units: dict[Dimension, list[Unit]]
     _dimension_symbol: dict[str, str]  # HACK
 
+    # Units made for dimensions with none of their own,
+    # valid while the units of their base dimensions are unchanged
+    _composite_units: dict[Dimension, Unit]
+    # number of base dimensions, whose order the composites follow
+    _composite_bases: int
+
     def __init__(self, *items: Unit):
         self.dimensions = set()
         self.dimension_units = dict()
         self._dimension_symbol = dict(dimensionless='')
+        self._composite_units = dict()
+        self._composite_bases = 0
 
         self.displays(*items)
 
@@ -29,6 +38,16 @@ class DisplayHandler:
         if units:
             return units[-1]
 
+        if self._composite_bases != len(Dimension._known_dimensions):
+            self._composite_units.clear()
+            self._composite_bases = len(Dimension._known_dimensions)
+
+        unit = self._composite_units.get(dim)
+        if unit is None:
+            unit = self._composite_units[dim] = self._composite_unit(dim)
+        return unit
+
+    def _composite_unit(self, dim: Dimension):
         from noether.core.units import GeometricUnit, LinearUnit
         from .Dimension import BaseDimension
 
@@ -43,6 +62,14 @@ class DisplayHandler:
             for d, exp in dim.items()
         })
 
+    def _units_changed(self, dim: Dimension):
+        # Composites are made of the units of base dimensions
+        if dim.is_base_dimension():
+            base, = dim
+            for composite in [d for d in self._composite_units if base in d]:
+                del self._composite_units[composite]
+
+    @import_phase('display registration')
     def display(self, value: T) -> T:
         if isinstance(value, Dimension):
             self.dimensions.add(value)
@@ -50,6 +77,7 @@ class DisplayHandler:
         elif isinstance(value, Unit):
             self.dimension_units.setdefault(value.dim, [])
             self.dimension_units[value.dim].append(value)
+            self._units_changed(value.dim)
             if value.symbols:
                 for n in value.dim.names:
                     self._dimension_symbol[n] = value.symbol
@@ -71,6 +99,7 @@ class DisplayHandler:
             self.dimension_units.setdefault(value.dim, [])
             if value in self.dimension_units[value.dim]:
                 self.dimension_units[value.dim].remove(value)
+                self._units_changed(value.dim)
         elif isinstance(value, UnitSet):
             for unit in value:
                 self.remove(unit)
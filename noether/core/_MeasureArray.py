@@ -0,0 +1,799 @@
+'''
+MeasureArray - many measurements sharing a single Dimension.
+
+Requires numpy.
+'''
+
+__all__ = ('MeasureArray', )
+
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+from datetime import timedelta
+import math
+import operator
+
+import numpy as np
+
+from ..errors import NoetherError, DimensionError
+from ..config import conf
+
+from .Prefix import Prefix
+from .Dimension import Dimension, dimensionless
+from .Measure import Measure, OPENLINEAR, BARENUMBER
+
+if TYPE_CHECKING:
+    from .Unit import Unit
+    from .UnitSet import UnitSet
+
+
+class MeasureArray:
+    '''
+    An array of measurements, with one Dimension and optional uncertainties.
+
+    Behaves like Measure under `*`, `/`, `**`, `+`, `-`, `@` and comparison,
+    but checks dimensions once per operation rather than once per value.
+    >>> meter(np.arange(3))
+    [0 m, 1 m, 2 m]  # length
+    '''
+
+    __slots__ = ('_value', 'stddev', 'dim', 'unit')
+
+    _value: np.ndarray
+    stddev: Optional[np.ndarray]
+    dim: Dimension
+    unit: 'Unit | None'
+
+    # numpy should defer to us in e.g. `ndarray * MeasureArray`
+    __array_priority__ = 1000
+
+    def __init__(
+        self,
+        value: 'MeasureArray | Measure | Iterable | np.ndarray' = 1,
+        stddev: 'Iterable | np.ndarray | None' = None,
+        dim: Optional[Dimension] = None,
+        unit: 'Unit | None' = None,
+    ):
+        if isinstance(value, MeasureArray):
+            self._value = value._value
+            self.stddev = value.stddev
+            self.dim = value.dim
+            self.unit = value.unit
+        elif isinstance(value, Measure):
+            self._value = np.asarray(value._value)
+            self.stddev = (None if value.stddev is None
+                           else np.asarray(value.stddev))
+            self.dim = value.dim
+            self.unit = None
+        else:
+            self._value = np.asarray(value)
+            self.stddev = None
+            self.dim = dimensionless
+            self.unit = None
+
+        if stddev is not None:
+            self.stddev = np.asarray(stddev)
+        if dim is not None:
+            self.dim = dim
+        if unit is not None:
+            self.unit = unit
+
+        if self._value.dtype.kind not in 'biuf':
+            raise TypeError('value must be an array of real numbers, not'
+                            f' {self._value.dtype}')
+
+    @classmethod
+    def _new(cls, value, stddev, dim: Dimension):
+        self = object.__new__(cls)
+        self._value = value
+        self.stddev = stddev
+        self.dim = dim
+        self.unit = None
+        return self
+
+    @classmethod
+    def from_measures(cls, measures: Iterable[Measure]):
+        '''
+        Collect Measures (which must share a dimension) into an array.
+        '''
+        measures = list(measures)
+        if not measures:
+            return cls(np.array([], dtype=float))
+
+        dim = measures[0].dim
+        for m in measures:
+            if m.dim is not dim and not conf.snapshot.measure_ignore_dimension:
+                DimensionError.check(
+                    dim, m.dim,
+                    "MeasureArray values must share a dimension."
+                    f" Enable conf.{OPENLINEAR} to bypass this.")
+
+        value = np.array([m._value for m in measures])
+        stddev = None
+        if any(m.stddev is not None for m in measures):
+            stddev = np.array([m.stddev or 0 for m in measures])
+        return cls._new(value, stddev, dim)
+
+    @property
+    def value(self):
+        if self.unit is None:
+            return self._value
+
+        from .units import AffineUnit
+        value = self._value
+        if isinstance(self.unit, AffineUnit):
+            value = value - self.unit.zero_point._value
+        return value / self.unit._value
+
+    @property
+    def epsilon(self):
+        if self.stddev is None:
+            return None
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self._value != 0, self.stddev / self._value, 0)
+
+    # Array-like behaviour
+
+    @property
+    def shape(self): return self._value.shape
+    @property
+    def ndim(self): return self._value.ndim
+    @property
+    def size(self): return self._value.size
+
+    def __len__(self): return len(self._value)
+    def __bool__(self): return bool(self._value)
+
+    def __getitem__(self, index):
+        value = self._value[index]
+        stddev = None if self.stddev is None else self.stddev[index]
+
+        if np.ndim(value):
+            new = self._new(value, stddev, self.dim)
+            new.unit = self.unit
+            return new
+
+        measure = Measure(
+            value.item(),
+            None if stddev is None else stddev.item(),
+            self.dim)
+        if self.unit is not None:
+            return measure @ self.unit
+        return measure
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _broadcast_stddev(self):
+        if self.stddev is None:
+            return None
+        return np.broadcast_to(self.stddev, self._value.shape)
+
+    # |~~\ '      |
+    # |   ||(~|~~\|/~~|\  /
+    # |__/ |_)|__/|\__| \/
+    #         |        _/
+
+    def display_unit(self) -> 'Unit':
+        if self.unit is not None:
+            if not conf.snapshot.measure_ignore_dimension:
+                DimensionError.check(
+                    self.dim, self.unit.dim,
+                    f"To use @ on units with different dimensions, enable conf.{OPENLINEAR}.")
+            return self.unit
+
+        from ._DisplayHandler import display
+        return display.dimension_unit(self.dim)
+
+    def __repr__(self):
+        if conf.snapshot.display_repr_code:
+            return self._repr_code()
+        return self.__noether__()
+
+    def _repr_code(self):
+        chunks = [repr(self._value)]
+        if self.stddev is not None:
+            chunks.append(repr(self.stddev))
+        if self.dim:
+            chunks.append('dim=' + self.dim._repr_code())
+        return 'MeasureArray({})'.format(', '.join(chunks))
+
+    def __str__(self):
+        from ..display import format_column
+        strings = format_column(self, self.display_unit(), align=False)
+
+        def fmt(i: int):
+            # LinearUnit displays zero as an empty string
+            return strings[i] or '0'
+
+        indices = np.arange(len(strings)).reshape(self._value.shape)
+        return np.array2string(
+            indices, separator=', ',
+            formatter={'int': fmt})  # type: ignore
+
+    def __noether__(self):
+        if self.dim and conf.snapshot.info_dimension:
+            return f'{self}  # {self.dim.name()}'
+        return str(self)
+
+    def __rich__(self):
+        if self.dim and conf.snapshot.info_dimension:
+            return f'{self}[green italic]  # {self.dim.name()}'
+        return str(self)
+
+    #  /~~\                   |     '
+    # |  __/~//~\|/~\ /~\ /~/~|~|/~\|/~~
+    #  \__/\/_\_/|   |   |\/_ | |   |\__
+
+    @staticmethod
+    def _coerce(other):
+        if isinstance(other, timedelta):
+            return Measure.from_timedelta(other)
+        if isinstance(other, Prefix):
+            return other.value
+        return other
+
+    def __geo(self, other, op=operator.mul, reverse=False) -> 'MeasureArray':
+        other = self._coerce(other)
+
+        if isinstance(other, (Measure, MeasureArray)):
+            o_value, o_eps, o_dim = other._value, other.epsilon, other.dim
+        else:
+            o_value, o_eps, o_dim = np.asarray(other), None, dimensionless
+
+        if reverse:
+            value = op(o_value, self._value)
+            dim = op(o_dim, self.dim)
+        else:
+            value = op(self._value, o_value)
+            dim = op(self.dim, o_dim)
+
+        stddev = None
+        s_eps = self.epsilon
+        if s_eps is not None or o_eps is not None:
+            se = 0 if s_eps is None else s_eps
+            oe = 0 if o_eps is None else o_eps
+            stddev = value * (se**2 + oe**2)**0.5
+
+        return self._new(value, stddev, dim)
+
+    def __relative(self, unit: 'Unit') -> 'MeasureArray':
+        new = self._new(self._value, self.stddev, self.dim)
+        new.unit = unit
+        return new
+
+    # As with MeasureRelative, `arr @ km / hour` displays `arr` in km/h
+
+    def __displayed_with(self, other) -> bool:
+        from .Unit import Unit
+        return self.unit is not None and isinstance(other, Unit)
+
+    def __mul__(self, other):
+        if self.__displayed_with(other):
+            return self.__relative(self.unit * other)
+        return self.__geo(other)
+
+    def __truediv__(self, other):
+        if self.__displayed_with(other):
+            return self.__relative(self.unit / other)
+        return self.__geo(other, operator.truediv)
+
+    def __and__(self, other: 'Unit'):
+        if not self.__displayed_with(other):
+            return NotImplemented
+        return self.__relative(self.unit & other)
+
+    def __rmul__(self, other): return self.__geo(other, reverse=True)
+    def __floordiv__(self, other): return self.__geo(other, operator.floordiv)
+
+    def __rtruediv__(self, other):
+        return self.__geo(other, operator.truediv, reverse=True)
+
+    def __rfloordiv__(self, other):
+        return self.__geo(other, operator.floordiv, reverse=True)
+
+    def __pow__(self, exp):
+        if isinstance(exp, (Measure, MeasureArray)):
+            if exp.dim:
+                raise DimensionError(
+                    exp.dim, dimensionless, 'Exponents must be dimensionless.')
+            exp = exp._value
+
+        if np.ndim(exp):
+            if self.dim:
+                raise NoetherError(
+                    'Only dimensionless measures may take an array of exponents.')
+            dim = self.dim
+        else:
+            dim = self.dim ** exp
+
+        base = self._value
+        if base.dtype.kind in 'biu' and np.any(np.less(exp, 0)):
+            # numpy forbids negative powers of integers
+            base = base.astype(float)
+
+        value = base ** exp
+        eps = self.epsilon
+        return self._new(
+            value,
+            None if eps is None else value * eps * exp,
+            dim,
+        )
+
+    # |  '
+    # |  ||/~\ /~//~~||/~\
+    # |__||   |\/_\__||
+
+    def __neg__(self): return self * -1
+    def __pos__(self): return self
+
+    def __abs__(self):
+        return self._new(np.abs(self._value), self.stddev, self.dim)
+
+    def __lin_cmp(self, other, op: Callable):
+        if conf.snapshot.measure_ignore_dimension:
+            return
+
+        match op:
+            case operator.add: oper = "Addition"
+            case operator.sub: oper = "Subtraction"
+            case operator.mod: oper = "Modulo"
+            case operator.eq: oper = "Comparison"
+            case operator.lt: oper = "Comparison"
+            case _: oper = "A linear operation"
+
+        if isinstance(other, (Measure, MeasureArray)):
+            DimensionError.check(
+                self.dim, other.dim,
+                f"{oper} only works on units of the same dimension."
+                f" Enable conf.{OPENLINEAR} to bypass this.")
+
+        elif self.dim and not conf.snapshot.measure_barenumber:
+            raise NoetherError(
+                f"{oper} only works on Measures and Units."
+                f" Enable conf.{BARENUMBER} to bypass this.")
+
+    def __lin(self, other, op: Callable, reverse=False) -> 'MeasureArray':
+        if isinstance(other, Dimension):
+            return self
+
+        other = self._coerce(other)
+        self.__lin_cmp(other, op)
+
+        stddev = self.stddev
+        if isinstance(other, (Measure, MeasureArray)):
+            o_value = other._value
+            if other.stddev is not None:
+                ss = 0 if stddev is None else stddev
+                stddev = (ss**2 + other.stddev**2) ** 0.5
+        else:
+            o_value = np.asarray(other)
+
+        if reverse:
+            value = op(o_value, self._value)
+        else:
+            value = op(self._value, o_value)
+
+        return self._new(value, stddev, self.dim)
+
+    def __add__(self, other): return self.__lin(other, operator.add)
+    def __radd__(self, other): return self.__lin(other, operator.add)
+    def __sub__(self, other): return self.__lin(other, operator.sub)
+    def __mod__(self, other): return self.__lin(other, operator.mod)
+
+    def __rsub__(self, other):
+        return self.__lin(other, operator.sub, reverse=True)
+
+    # Equality and ordering
+
+    __hash__ = None  # type: ignore
+
+    def __cmp(self, other, op: Callable):
+        other = self._coerce(other)
+        self.__lin_cmp(other, operator.lt)
+        if isinstance(other, (Measure, MeasureArray)):
+            other = other._value
+        return op(self._value, other)
+
+    def __eq__(self, other):  # type: ignore
+        other = self._coerce(other)
+        o_dim = getattr(other, 'dim', dimensionless)
+        if o_dim is not self.dim and not conf.snapshot.measure_ignore_dimension:
+            return np.zeros(self.shape, dtype=bool)
+        if isinstance(other, (Measure, MeasureArray)):
+            other = other._value
+        return self._value == other
+
+    def __ne__(self, other):  # type: ignore
+        return ~self.__eq__(other)
+
+    def __lt__(self, other): return self.__cmp(other, operator.lt)
+    def __le__(self, other): return self.__cmp(other, operator.le)
+    def __gt__(self, other): return self.__cmp(other, operator.gt)
+    def __ge__(self, other): return self.__cmp(other, operator.ge)
+
+    #  /~~       |               |~~\ '      |
+    # |  |   |(~~|~/~\|/~\ /~\   |   ||(~|~~\|/~~|\  /
+    #  \__\_/|_) | \_/|   |   |  |__/ |_)|__/|\__| \/
+    #                                    |        _/
+
+    def __matmul__(self, display_with: 'Unit | UnitSet'):
+        from .Unit import Unit
+        from .UnitSet import UnitSet
+
+        if isinstance(display_with, UnitSet):
+            unit = display_with.unit_for_dimension(self.dim)
+            if unit is None:
+                return self
+            return self @ unit
+
+        if not isinstance(display_with, Unit):
+            raise TypeError('Can only use @ (display relative to) on a Unit.')
+
+        # Dimension checks are deferred until display, as with MeasureRelative
+        return self.__relative(display_with)
+
+    # numpy protocols
+
+    def __array_ufunc__(self, ufunc, method: str, *inputs, **kwargs):
+        return array_ufunc(ufunc, method, *inputs, **kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        return array_function(func, types, args, kwargs)
+
+    def reshape(self, *shape): return np.reshape(self, shape)
+    def ravel(self): return np.ravel(self)
+    def sum(self, *args, **kwargs): return np.sum(self, *args, **kwargs)
+    def mean(self, *args, **kwargs): return np.mean(self, *args, **kwargs)
+    def min(self, *args, **kwargs): return np.min(self, *args, **kwargs)
+    def max(self, *args, **kwargs): return np.max(self, *args, **kwargs)
+
+    @property
+    def T(self): return np.transpose(self)
+
+
+# Arithmetic on a Measure defers to MeasureArray for any array operand
+Measure._array_types = (np.ndarray, MeasureArray)
+
+
+# % numpy dispatch
+# Dimensions are worked out once per call from the Dimension of each operand;
+# numpy only ever sees the bare value arrays.
+
+Noetherish = Measure | MeasureArray
+
+
+def _wrap(result):
+    "Unpack 0-dimensional results into Measures, as numpy does with scalars."
+    if isinstance(result, MeasureArray) and result.ndim == 0:
+        return result[()]
+    return result
+
+
+def _as_array(x) -> MeasureArray:
+    if isinstance(x, MeasureArray):
+        return x
+    if isinstance(x, Measure):
+        return MeasureArray(x)
+    return MeasureArray(MeasureArray._coerce(x))
+
+
+def _angle():
+    "The angle dimension, if it has been registered."
+    if 'angle' in Dimension._known_dimensions:
+        return Dimension('angle')
+    return dimensionless
+
+
+def _check_dimensionless(ufunc, *dims: Dimension, allowed=(dimensionless, )):
+    for dim in dims:
+        if dim not in allowed and not conf.snapshot.measure_ignore_dimension:
+            raise DimensionError(
+                dim, dimensionless,
+                f"np.{ufunc.__name__} requires a dimensionless input.")
+
+
+def _common_dimension(values, message: str) -> Dimension:
+    dims = [v.dim for v in values if isinstance(v, Noetherish)]
+    dim = dims[0] if dims else dimensionless
+    if not conf.snapshot.measure_ignore_dimension:
+        for d in dims:
+            DimensionError.check(
+                dim, d, message + f" Enable conf.{OPENLINEAR} to bypass this.")
+        if len(dims) < len(values) and dim and not conf.snapshot.measure_barenumber:
+            raise NoetherError(
+                message + f" Enable conf.{BARENUMBER} to mix in bare numbers.")
+    return dim
+
+
+def _unwrap(value):
+    if isinstance(value, Noetherish):
+        return value._value
+    if isinstance(value, (list, tuple)):
+        return type(value)(_unwrap(v) for v in value)
+    return value
+
+
+def _unwrap_stddev(value):
+    if isinstance(value, MeasureArray):
+        return value._broadcast_stddev()
+    if isinstance(value, Measure):
+        return value.stddev
+    return None
+
+
+_UFUNC_OPERATORS: dict[np.ufunc, Callable] = {
+    np.add: operator.add,
+    np.subtract: operator.sub,
+    np.multiply: operator.mul,
+    np.divide: operator.truediv,
+    np.floor_divide: operator.floordiv,
+    np.remainder: operator.mod,
+    np.power: operator.pow,
+    np.negative: operator.neg,
+    np.positive: operator.pos,
+    np.absolute: operator.abs,
+    np.equal: operator.eq,
+    np.not_equal: operator.ne,
+    np.less: operator.lt,
+    np.less_equal: operator.le,
+    np.greater: operator.gt,
+    np.greater_equal: operator.ge,
+}
+
+_UFUNC_POWERS: dict[np.ufunc, float] = {
+    np.sqrt: 0.5,
+    np.square: 2,
+    np.cbrt: 1/3,
+    np.reciprocal: -1,
+}
+
+# Result has the dimension of its (matching) inputs
+_UFUNC_SAME_DIMENSION = {
+    np.maximum, np.minimum, np.fmax, np.fmin, np.fmod, np.hypot,
+    np.copysign, np.nextafter,
+    np.fabs, np.rint, np.floor, np.ceil, np.trunc, np.conjugate, np.spacing,
+}
+
+# Result is a plain array, but inputs must match
+_UFUNC_PLAIN = {
+    np.isnan, np.isinf, np.isfinite, np.signbit, np.sign,
+}
+
+_UFUNC_TRIGONOMETRIC = {np.sin, np.cos, np.tan}
+_UFUNC_INVERSE_TRIGONOMETRIC = {np.arcsin, np.arccos, np.arctan}
+
+_UFUNC_DIMENSIONLESS = {
+    np.exp, np.exp2, np.expm1, np.log, np.log2, np.log10, np.log1p,
+    np.sinh, np.cosh, np.tanh, np.arcsinh, np.arccosh, np.arctanh,
+}
+
+
+def array_ufunc(ufunc: np.ufunc, method: str, *inputs, **kwargs):
+    if kwargs.get('out') is not None:
+        return NotImplemented
+
+    if method in ('reduce', 'accumulate') and (
+            ufunc in (np.add, np.maximum, np.minimum, np.fmax, np.fmin)):
+        array, = inputs
+        array = _as_array(array)
+        value = getattr(ufunc, method)(array._value, **kwargs)
+        stddev = array._broadcast_stddev()
+        if stddev is not None and ufunc is np.add:
+            # as np.sum does, with no uncertainty in any initial value
+            kwargs.pop('initial', None)
+            stddev = getattr(ufunc, method)(stddev ** 2, **kwargs) ** 0.5
+        elif stddev is not None:
+            raise NoetherError(
+                f"np.{ufunc.__name__}.{method} does not support uncertainties.")
+        return _wrap(MeasureArray._new(value, stddev, array.dim))
+
+    if method != '__call__':
+        return NotImplemented
+
+    if ufunc in _UFUNC_OPERATORS:
+        first, *rest = inputs
+        return _wrap(_UFUNC_OPERATORS[ufunc](_as_array(first), *rest))
+
+    if ufunc in _UFUNC_POWERS:
+        array, = inputs
+        return _wrap(_as_array(array) ** _UFUNC_POWERS[ufunc])
+
+    values = [_unwrap(x) for x in inputs]
+    dims = [x.dim for x in inputs if isinstance(x, Noetherish)]
+
+    if ufunc in _UFUNC_SAME_DIMENSION or ufunc in _UFUNC_PLAIN:
+        dim = _common_dimension(
+            inputs, f"np.{ufunc.__name__} only works on values of the same dimension.")
+        result = ufunc(*values, **kwargs)
+        if ufunc in _UFUNC_PLAIN:
+            return result
+        return _wrap(MeasureArray._new(result, None, dim))
+
+    if ufunc in _UFUNC_TRIGONOMETRIC:
+        _check_dimensionless(ufunc, *dims, allowed=(dimensionless, _angle()))
+        dim = dimensionless
+    elif ufunc in _UFUNC_INVERSE_TRIGONOMETRIC:
+        _check_dimensionless(ufunc, *dims)
+        dim = _angle()
+    elif ufunc is np.arctan2:
+        _common_dimension(inputs, "np.arctan2 requires values of the same dimension.")
+        dim = _angle()
+    elif ufunc in _UFUNC_DIMENSIONLESS:
+        _check_dimensionless(ufunc, *dims)
+        dim = dimensionless
+    else:
+        return NotImplemented
+
+    return _wrap(MeasureArray._new(ufunc(*values, **kwargs), None, dim))
+
+
+_FUNCTIONS: dict[Callable, Callable] = {}
+
+
+def implements(*functions: Callable):
+    "Register an implementation of a numpy function for Measures."
+    def decorator(implementation: Callable):
+        for func in functions:
+            _FUNCTIONS[func] = implementation
+        return implementation
+    return decorator
+
+
+def array_function(func, types, args, kwargs):
+    if func not in _FUNCTIONS:
+        return NotImplemented
+    return _wrap(_FUNCTIONS[func](func, *args, **kwargs))
+
+
+@implements(
+    np.reshape, np.ravel, np.transpose, np.squeeze, np.expand_dims,
+    np.flip, np.roll, np.broadcast_to, np.copy, np.atleast_1d, np.atleast_2d,
+    np.take, np.repeat, np.tile, np.swapaxes, np.moveaxis, np.sort,
+    np.cumsum, np.diff,
+)
+def _apply_to_values(func, a, *args, **kwargs):
+    "Functions which move values around without changing their dimension."
+    a = _as_array(a)
+    stddev = a._broadcast_stddev()
+    if stddev is not None and func in (np.sort, np.cumsum, np.diff):
+        stddev = None  # uncertainties no longer line up with values
+    elif stddev is not None:
+        stddev = func(stddev, *args, **kwargs)
+    return MeasureArray._new(func(a._value, *args, **kwargs), stddev, a.dim)
+
+
+@implements(np.sum, np.nansum)
+def _sum(func, a, *args, **kwargs):
+    a = _as_array(a)
+    stddev = a._broadcast_stddev()
+    if stddev is not None:
+        stddev = func(stddev ** 2, *args, **kwargs) ** 0.5
+    return MeasureArray._new(func(a._value, *args, **kwargs), stddev, a.dim)
+
+
+@implements(np.mean, np.nanmean)
+def _mean(func, a, *args, **kwargs):
+    a = _as_array(a)
+    value = func(a._value, *args, **kwargs)
+    stddev = a._broadcast_stddev()
+    if stddev is not None:
+        n = a._value.size / np.size(value)
+        stddev = (np.sum(stddev ** 2, *args, **kwargs) ** 0.5) / n
+    return MeasureArray._new(value, stddev, a.dim)
+
+
+@implements(
+    np.min, np.max, np.amin, np.amax, np.nanmin, np.nanmax, np.ptp,
+    np.median, np.nanmedian, np.percentile, np.nanpercentile,
+    np.quantile, np.nanquantile, np.std, np.nanstd, np.around, np.round,
+)
+def _same_dimension(func, a, *args, **kwargs):
+    "Functions whose result has the dimension of their input."
+    a = _as_array(a)
+    return MeasureArray._new(func(a._value, *args, **kwargs), None, a.dim)
+
+
+@implements(np.var, np.nanvar)
+def _var(func, a, *args, **kwargs):
+    a = _as_array(a)
+    return MeasureArray._new(func(a._value, *args, **kwargs), None, a.dim ** 2)
+
+
+@implements(np.prod)
+def _prod(func, a, axis=None, **kwargs):
+    a = _as_array(a)
+    value = func(a._value, axis=axis, **kwargs)
+    if axis is None:
+        n = a._value.size
+    else:
+        axes = axis if isinstance(axis, tuple) else (axis, )
+        n = math.prod(a._value.shape[i] for i in axes)
+    return MeasureArray._new(value, None, a.dim ** n)
+
+
+@implements(
+    np.argmin, np.argmax, np.argsort, np.nonzero, np.count_nonzero,
+    np.shape, np.ndim, np.size, np.isreal, np.iscomplex,
+)
+def _plain(func, a, *args, **kwargs):
+    "Functions which return plain (dimensionless) information about values."
+    return func(_as_array(a)._value, *args, **kwargs)
+
+
+@implements(np.concatenate, np.stack, np.vstack, np.hstack, np.dstack, np.column_stack)
+def _join(func, arrays, *args, **kwargs):
+    arrays = [_as_array(a) for a in arrays]
+    dim = _common_dimension(
+        arrays, f"np.{func.__name__} only works on values of the same dimension.")
+
+    stddev = None
+    if any(a.stddev is not None for a in arrays):
+        stddev = func([
+            np.zeros(a.shape) if a.stddev is None else a._broadcast_stddev()
+            for a in arrays
+        ], *args, **kwargs)
+    value = func([a._value for a in arrays], *args, **kwargs)
+    return MeasureArray._new(value, stddev, dim)
+
+
+@implements(np.append)
+def _append(func, arr, values, axis=None):
+    return _join(np.concatenate, [
+        np.ravel(_as_array(arr)) if axis is None else arr,
+        np.ravel(_as_array(values)) if axis is None else values,
+    ], axis=0 if axis is None else axis)
+
+
+@implements(np.where)
+def _where(func, condition, *xy):
+    if not xy:
+        return func(_unwrap(condition))
+    dim = _common_dimension(
+        xy, "np.where only works on values of the same dimension.")
+    return MeasureArray._new(func(_unwrap(condition), *map(_unwrap, xy)), None, dim)
+
+
+@implements(np.clip)
+def _clip(func, a, a_min=None, a_max=None, *args, **kwargs):
+    a = _as_array(a)
+    bounds = [b for b in (a_min, a_max) if b is not None]
+    dim = _common_dimension(
+        [a, *bounds], "np.clip bounds must have the same dimension as values.")
+    value = func(a._value, _unwrap(a_min), _unwrap(a_max), *args, **kwargs)
+    return MeasureArray._new(value, None, dim)
+
+
+@implements(np.isclose, np.allclose)
+def _isclose(func, a, b, rtol=1e-05, atol=1e-08, equal_nan=False):
+    values = [a, b]
+    if isinstance(atol, Noetherish):
+        values.append(atol)
+    elif atol:
+        # the default absolute tolerance is only meaningful for bare numbers
+        atol = 0 if _common_dimension(values, '') else atol
+    _common_dimension(
+        values, f"np.{func.__name__} only works on values of the same dimension.")
+    return func(_unwrap(a), _unwrap(b), rtol, _unwrap(atol), equal_nan)
+
+
+@implements(np.array_equal)
+def _array_equal(func, a, b, *args, **kwargs):
+    if getattr(a, 'dim', dimensionless) != getattr(b, 'dim', dimensionless):
+        return False
+    return func(_unwrap(a), _unwrap(b), *args, **kwargs)
+
+
+@implements(np.linspace)
+def _linspace(func, start, stop, *args, **kwargs):
+    dim = _common_dimension(
+        [start, stop], "np.linspace needs a start and stop of the same dimension.")
+    return MeasureArray._new(
+        func(_unwrap(start), _unwrap(stop), *args, **kwargs), None, dim)
+
+
+@implements(np.zeros_like, np.empty_like)
+def _like(func, a, *args, **kwargs):
+    a = _as_array(a)
+    return MeasureArray._new(func(a._value, *args, **kwargs), None, a.dim)
+
+
@@ -9,4 +9,13 @@ from .units import *
 
 from .UnitSet import UnitSet
 from .Catalogue import Catalogue
+from .Converter import Converter, converter
 from ._DisplayHandler import display
+
+
+def __getattr__(name: str):
+    # numpy is optional, and only imported when MeasureArray is first used
+    if name == 'MeasureArray':
+        from ._MeasureArray import MeasureArray
+        return MeasureArray
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -18,7 +18,7 @@ class GeometricUnit(Unit):
     def __init__(self, unit_or_dict: Unit | dict[Unit, Rational]):
         if isinstance(unit_or_dict, dict):
             units = Multiplication(unit_or_dict)
-            product = prod(Measure(x) ** e for x, e in units.items())
+            product = prod(Measure._new(x._value, x.stddev, x.dim) ** e for x, e in units.items())
             unit: Unit = product  # type: ignore
         else:
             unit = unit_or_dict
@@ -1,6 +1,6 @@
 from typing import Iterable
 
-from noether.display import DISPLAY_REPR_CODE, canonical_number, plus_minus_symbol
+from noether.display import canonical_number, plus_minus_symbol
 from ...config import conf
 from ..Measure import Measure
 from ..Unit import Unit
@@ -35,7 +35,7 @@ class LinearUnit(Unit):
     #         |        _/
 
     def __repr__(self):
-        if conf.get(DISPLAY_REPR_CODE):
+        if conf.snapshot.display_repr_code:
             return self._repr_code()
         return self.__noether__()
 
@@ -45,12 +45,12 @@ class LinearUnit(Unit):
         ))
 
     def __noether__(self):
-        if conf.get('info_dimension'):
+        if conf.snapshot.info_dimension:
             return f'{self}  # {self.dim.name()}'
         return str(self)
 
     def __rich__(self):
-        if conf.get('info_dimension'):
+        if conf.snapshot.info_dimension:
             return f'{self}[green italic]  # {self.dim.name()}'
         return str(self)
 
@@ -1,12 +1,24 @@
+from typing import ClassVar, Iterable
+
+from ...helpers import BoundedCache
 from ..Unit import Unit
 from ..Prefix import Prefix
 
+# More than enough for every prefix of every catalogued unit.
+# Past this, prefixed units are only forgotten once unused,
+# so `kilo * meter is noether.kilometer` always holds.
+PREFIXED_UNIT_CACHE_SIZE = 4096
+
 
 class PrefixedUnit(Unit):
     "A prefixed unit e.g. megawatt, centiliter."
     unit: Unit
     prefix: Prefix
 
+    # (prefix, id(unit)) -> prefix * unit
+    _cache: ClassVar[BoundedCache[tuple[Prefix, int], 'PrefixedUnit']] = \
+        BoundedCache(PREFIXED_UNIT_CACHE_SIZE, keep_referenced=True)
+
     def __init__(self, prefix: Prefix, unit: Unit):
 
         object.__setattr__(self, 'unit', unit)
@@ -18,3 +30,34 @@ class PrefixedUnit(Unit):
             [f'{prefix.prefix}{n}' for n in unit.names],
             [f'{prefix.symbol}{s}' for s in unit.symbols],
         )
+
+    @classmethod
+    def of(cls, prefix: Prefix, unit: Unit) -> 'PrefixedUnit':
+        '''
+        The prefixed unit, shared with every other call for the same pair.
+        '''
+        key = (prefix, id(unit))
+        prefixed = cls._cache.get(key)
+        # ids may be reused once a unit is garbage collected
+        if prefixed is None or prefixed.unit is not unit:
+            prefixed = cls(prefix, unit)
+            cls._cache[key] = prefixed
+        return prefixed
+
+    @classmethod
+    def forget(cls, unit: Unit | None = None, prefixes: Iterable[Prefix] = ()):
+        '''
+        Drop cached prefixed units of `unit` or with any of `prefixes`.
+        '''
+        prefixes = set(prefixes)
+        cls._cache.discard_where(
+            lambda key, prefixed: prefixed.unit is unit or key[0] in prefixes)
+
+    @classmethod
+    def cache_info(cls):
+        return cls._cache.cache_info()
+
+    @classmethod
+    def _remember(cls, prefixed: 'PrefixedUnit'):
+        'Share `prefixed`, made elsewhere, with later calls to `of`.'
+        cls._cache[prefixed.prefix, id(prefixed.unit)] = prefixed
@@ -7,9 +7,13 @@ Handles Unicode.
 from decimal import Decimal
 from fractions import Fraction
 from math import ceil, log10
-from noether.helpers import Real, removeprefix, removesuffix
+from typing import Iterable, TYPE_CHECKING
+from noether.helpers import Real, removesuffix
 
-from .config import Config, conf
+from .config import Config, ConfigSnapshot, conf
+
+if TYPE_CHECKING:
+    from .core import Measure, MeasureArray, Unit
 
 DISPLAY_UNICODE_SYMBOLS = Config.register("display_unicode_symbols", True, '''\
 Use Unicode symbols eg ± instead of +-.
@@ -36,7 +40,7 @@ Set to -1 to disable.
 
 
 def plus_minus_symbol() -> str:
-    if conf.get(DISPLAY_UNICODE_SYMBOLS):
+    if conf.snapshot.display_unicode_symbols:
         return '±'
     return '+-'
 
@@ -48,87 +52,223 @@ SUPERSCRIPT = str.maketrans(
 
 
 def superscript(number):
-    if conf.get(DISPLAY_UNICODE_EXPONENT):
+    if conf.snapshot.display_unicode_exponent:
         return str(number).translate(SUPERSCRIPT)
     return f'**{number}'
 
 
-def _to_decimal(number: Real | str):
+def _decimal_str(number: Real | str) -> str:
+    '''
+    `str(Decimal(number))`, with floats as they are written.
+    '''
     if isinstance(number, Fraction):
         number = float(number)
     if isinstance(number, float):
-        number = str(number)
-    return Decimal(number)
+        string = str(number)
+        # Decimal would only rewrite exponents, infinities and nan
+        if 'e' not in string and 'n' not in string:
+            return string
+        return str(Decimal(string))
+    if isinstance(number, int):
+        return str(int(number))
+    return str(Decimal(number))
+
+
+def _between_0_and_1(decimal: str):
+    if 'E' in decimal or not decimal[-1].isdigit():
+        # exponents, infinities and nan
+        return 0 < Decimal(decimal) < 1
+    return decimal.startswith('0.') and bool(decimal[2:].strip('0'))
 
 
 def uncertainty(number: Real | str, stddev: Real | str):
     '''Display'''
-    a = _to_decimal(number)
-    b = _to_decimal(stddev)
+    a = _decimal_str(number)
+    b = _decimal_str(stddev)
 
-    if not (0 < b < 1):
+    if not _between_0_and_1(b):
         return f'{a}({b})'
 
-    ai, af = str(a).split('.', 1)
-    bi, bf = str(b).split('.', 1)
+    ai, af = a.split('.', 1)
+    bi, bf = b.split('.', 1)
     assert bi == '0'
 
-    ad = len(af)
-    bd = len(bf)
-    az = bd - ad
-    bz = -1 - b.adjusted()
-    bf = bf[bz:]
-    af += '0'*az
-
-    return f'{ai}.{af}({bf})'
+    az = len(bf) - len(af)
+    bz = len(bf) - len(bf.lstrip('0'))
+    return f'{ai}.{af}{"0" * az}({bf[bz:]})'
 
 
 def scinot(number: Real, digits: int | None = None):
     notation = format(number, f'.{digits}e' if digits is not None else 'e')
     num, exp = notation.split('e')
-
-    while num.endswith('0'):
-        num = num[:-1]
-    num = removesuffix(num, '.')
+    num = removesuffix(num.rstrip('0'), '.')
 
     sign = '' if exp.startswith('+') else '-'
-    exp = int(exp[1:])
-    return f'{num}e{sign}{exp}'
+    return f'{num}e{sign}{int(exp[1:])}'
+
+
+def _group_thousands(n: str):
+    # Groups of three from the right, joined by underscores.
+    # A sign counts as a digit, as it always has
+    head = len(n) % 3 or 3
+    return '_'.join([n[:head], *[n[i:i+3] for i in range(head, len(n), 3)]])
 
 
-def _fmt(number: Real):
+def _fmt(number: Real, digits: int | None = None, underscore_after: int | None = None):
     if number == 0:
         return '0'
+    if digits is None:
+        digits = conf.snapshot.display_digits
+    if underscore_after is None:
+        underscore_after = conf.snapshot.display_underscore_after
+
     mag = log10(abs(number))
-    DIGITS: int = conf.get(DISPLAY_DIGITS)
-    n = str(round(number, DIGITS - ceil(mag)))
-    if 'e' in n or (len(n) > DIGITS and not -3 < mag < 4):
+    ndigits = digits - ceil(mag)
+    if type(number) is float and 0 <= ndigits and digits < 15 and 1e-4 <= abs(number) < 1e15:
+        # The digits str(round(...)) gives, without making another float:
+        # in this range it has neither too many digits nor an exponent
+        n = '%.*f' % (ndigits, number)
+        if not ndigits:
+            n += '.0'
+        else:
+            n = n.rstrip('0')
+            if n[-1] == '.':
+                n += '0'
+    else:
+        n = str(round(number, ndigits))
+        if 'e' in n:
+            return scinot(number)
+
+    if len(n) > digits and not -3 < mag < 4:
         return scinot(number)
 
-    m = ''
-    if '.' in n:
-        n, m = n.split('.')
-        m = '' if m == '0' else '.'+m
-    UNDERSCORE_DIGITS = conf.get(DISPLAY_UNDERSCORE_AFTER)
-    if UNDERSCORE_DIGITS != -1 and len(n) > UNDERSCORE_DIGITS:
-        n_ = ''
-        for i, d in enumerate(reversed(n)):
-            n_ += d
-            if i % 3 == 2:
-                n_ += '_'
-        n = ''.join(reversed(n_))
-        n = removeprefix(n, '_')
+    n, point, m = n.partition('.')
+    if m == '0':
+        point = m = ''
+    if underscore_after != -1 and len(n) > underscore_after:
+        n = _group_thousands(n)
 
-    return f'{n}{m}'
+    return f'{n}{point}{m}'
 
 
 def canonical_number(number: Real, stddev: Real | None = None, display_shorthand: bool = False):
+    return _canonical_number(number, stddev, display_shorthand, conf.snapshot)
+
+
+def _canonical_number(
+    number: Real,
+    stddev: Real | None,
+    display_shorthand: bool,
+    snapshot: ConfigSnapshot,
+):
+    if stddev is not None and display_shorthand:
+        return uncertainty(number, stddev)
+
+    digits = snapshot.display_digits
+    underscore_after = snapshot.display_underscore_after
     if stddev is not None:
-        if display_shorthand:
-            return uncertainty(number, stddev)
-        else:
-            pm = plus_minus_symbol()
-            return f'{_fmt(number)} {pm} {_fmt(stddev)}'
+        pm = '±' if snapshot.display_unicode_symbols else '+-'
+        return (
+            f'{_fmt(number, digits, underscore_after)} {pm} '
+            f'{_fmt(stddev, digits, underscore_after)}')
     if isinstance(number, float) and number.is_integer():
-        return _fmt(int(number))
-    return _fmt(number)
+        number = int(number)
+    return _fmt(number, digits, underscore_after)
+
+
+# % Columns
+
+def _array_measures(array: 'MeasureArray') -> 'list[Measure]':
+    from .core import Measure
+
+    stddev = array._broadcast_stddev()
+    values = array._value.ravel().tolist()
+    stddevs = [None] * len(values) if stddev is None else stddev.ravel().tolist()
+    return [Measure(v, s, array.dim) for v, s in zip(values, stddevs)]
+
+
+def _values_and_stddevs(
+    values: 'MeasureArray | list[Measure]',
+    unit: 'Unit',
+) -> tuple[list, list]:
+    '''
+    Values and stddevs in terms of `unit`,
+    as Unit._repr_measure would find them.
+    '''
+    scale = unit._value
+    if not isinstance(values, list):  # MeasureArray
+        array = values._value.ravel()
+        stddev = values._broadcast_stddev()
+        if array.dtype.kind == 'f' and type(scale) in (int, float):
+            # the same divisions, all at once
+            return (
+                (array / scale).tolist(),
+                [None] * array.size if stddev is None
+                else (stddev.ravel() / scale).tolist())
+        values = _array_measures(values)
+
+    return (
+        [m._value / scale for m in values],
+        [None if m.stddev is None else m.stddev / scale for m in values])
+
+
+def _align(strings: list[str]) -> list[str]:
+    # Line up the decimal point, or the end of the whole number
+    def whole(s: str):
+        for i, c in enumerate(s):
+            if c not in '-+0123456789_':
+                return i
+        return len(s)
+
+    wholes = [whole(s) for s in strings]
+    left = max(wholes, default=0)
+    padded = [' ' * (left - w) + s for s, w in zip(strings, wholes)]
+    width = max(map(len, padded), default=0)
+    return [s.ljust(width) for s in padded]
+
+
+def format_column(
+    values: 'Iterable[Measure] | MeasureArray',
+    unit: 'Unit | None' = None,
+    align: bool = True,
+) -> list[str]:
+    '''
+    Format many measures as `str(measure @ unit)` would, in order.
+    The unit defaults to the display unit of the first measure
+    (or of the array), and is resolved only once, as is the config.
+
+    If `align`, the strings are padded to the same width,
+    lining up the decimal point, for printing in columns
+    or in a `rich` table.
+    '''
+    from .core import Unit
+    from .errors import DimensionError
+
+    is_array = hasattr(values, '_broadcast_stddev')
+    if not is_array:
+        values = list(values)
+        if not values:
+            return []
+    if unit is None:
+        unit = values.display_unit() if is_array else values[0].display_unit()
+
+    snapshot = conf.snapshot
+    if not snapshot.measure_ignore_dimension:
+        for dim in {values.dim} if is_array else {m.dim for m in values}:
+            DimensionError.check(
+                dim, unit.dim,
+                'To display in a unit of another dimension,'
+                ' enable conf.measure_ignore_dimension.')
+
+    if type(unit)._repr_measure is Unit._repr_measure:
+        suffix = ' ' + unit.symbol if unit.dim or unit.symbols else ''
+        shorthand = snapshot.uncertainty_display_shorthand
+        strings = [
+            _canonical_number(v, s, shorthand, snapshot) + suffix
+            for v, s in zip(*_values_and_stddevs(values, unit))]
+    else:
+        # Units such as degC and feet & inches format each measure themselves
+        measures = _array_measures(values) if is_array else values
+        strings = [unit._repr_measure(m) for m in measures]
+
+    return _align(strings) if align else strings
@@ -25,8 +25,8 @@ class DimensionError(NoetherError):
 
     @classmethod
     def check(cls, dim1: 'Dimension', dim2: 'Dimension', message: str | None = None):
-        # ensure not dimensionless - those are usually okay
-        if dim1 != dim2:
+        # Dimensions are interned, so this is a pointer comparison
+        if dim1 is not dim2:
             raise cls(dim1, dim2, message)
 
     def __str__(self):
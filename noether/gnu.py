@@ -1,18 +1,30 @@
 '''
-A GNU Units-like CLI. Note that the `-f` option is not currently supported.
+A GNU Units-like CLI.
 
-See `man units` for info on usage.
+See `man units` for info on usage. Definitions files given with `-f`
+are searched before Noether's catalogue; see `noether._definitions`
+for what they may contain.
+
+With `--batch FILE` (or `-` for stdin), each line is a `have want` pair,
+separated by a tab or spaces, and each conversion is written as
+`have<TAB>want<TAB>multiply<TAB>divide`, or as JSON lines with `--json`.
 '''
 
 from argparse import ArgumentParser
+from functools import lru_cache
+import json
+import sys
+from typing import IO, Iterable
+import warnings
 
-from noether import catalogue, conf, Measure, Prefix, dimensionless
+from noether import catalogue, conf, Catalogue, Measure, Prefix, dimensionless
+from noether._definitions import Resolver, load_definitions
 
 from noether.display import DISPLAY_DIGITS, DISPLAY_UNDERSCORE_AFTER
 
 parser = ArgumentParser(
     description=__doc__,
-    usage='units [-q] [from-unit to-unit]'
+    usage='units [-q] [-f FILE] [--batch FILE [--json]] [from-unit to-unit]'
 )
 
 parser.add_argument(
@@ -21,6 +33,15 @@ parser.add_argument(
 parser.add_argument(
     '-q', action='store_false', dest='loud',
     help='Suppress prompts in interactive mode.')
+parser.add_argument(
+    '-f', '--file', action='append', default=[], dest='files', metavar='FILE',
+    help='Also use the units defined in FILE, in GNU Units format.')
+parser.add_argument(
+    '--batch', metavar='FILE',
+    help='Convert each `have want` line of FILE (- for stdin).')
+parser.add_argument(
+    '--json', action='store_true',
+    help='With --batch, write JSON lines, including errors.')
 
 Value = Measure | Prefix
 
@@ -34,26 +55,117 @@ def dim(v: Value):
     return v.dim
 
 
+def ratio(a: Value, b: Value) -> float:
+    'The number of `b` in `a`, as a number, for prefixes as for units.'
+    if isinstance(a, Prefix):
+        a = a.value
+    if isinstance(b, Prefix):
+        b = b.value
+    result = a / b
+    return result.value if isinstance(result, Measure) else result
+
+
 def compare(a: Value, b: Value):
     if dim(a) != dim(b):
         print('conformability error')
         print(' '*7, a)
         print(' '*7, b)
 
-    print(' '*7, '*', (a/b).value)
-    print(' '*7, '/', (b/a).value)
+    print(' '*7, '*', ratio(a, b))
+    print(' '*7, '/', ratio(b, a))
+
+
+# Catalogues of definitions files, searched first
+definitions: list[Catalogue] = []
+resolver: Resolver | None = None
+
+
+def use_definitions(path: str):
+    global resolver
+    definitions.append(load_definitions(path))
+    resolver = Resolver([*definitions, catalogue])
+    lookup.cache_clear()
+    conversion.cache_clear()
+
+
+def find(inp: str) -> Value:
+    'The unit or prefix named `inp`, raising NameError if there is none.'
+    if resolver is not None:
+        return resolver.get(inp)
+    unit = catalogue.get(inp)
+    if not isinstance(unit, (Measure, Prefix)):
+        raise NameError(f"unknown unit '{inp}'")
+    return unit
 
 
 def get(inp: str) -> Value | None:
     try:
-        unit = catalogue.get(inp)
+        return find(inp)
     except NameError:
         print(f"unknown unit '{inp}'")
-    else:
-        if not isinstance(unit, (Measure, Prefix)):
-            print(f"unknown unit '{inp}'")
+
+
+# % Batch
+
+# Enough for the names used by any one script
+BATCH_CACHE_SIZE = 4096
+
+
+class ConversionError(ValueError):
+    pass
+
+
+@lru_cache(maxsize=BATCH_CACHE_SIZE)
+def lookup(name: str) -> Value:
+    'As `get`, but raising ConversionError for unknown units.'
+    try:
+        return find(name)
+    except NameError:
+        raise ConversionError(f"unknown unit '{name}'") from None
+
+
+@lru_cache(maxsize=BATCH_CACHE_SIZE)
+def conversion(have: str, want: str) -> tuple[float, float]:
+    'The multiply and divide factors `compare` prints, for conforming units.'
+    a, b = lookup(have), lookup(want)
+    if dim(a) != dim(b):
+        raise ConversionError('conformability error')
+    return ratio(a, b), ratio(b, a)
+
+
+def batch(lines: Iterable[str], out: IO[str], err: IO[str], as_json: bool = False) -> int:
+    '''
+    Convert each `have want` line, writing results as they are done
+    and errors to `err` (or as JSON), as GNU Units reports each line's
+    error and goes on. Returns the number which failed.
+    '''
+    failed = 0
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        pair = line.split('\t') if '\t' in line else line.split()
+        have, want = (p.strip() for p in pair) if len(pair) == 2 else (line, '')
+
+        try:
+            if not want:
+                raise ConversionError('expected a `have want` pair')
+            multiply, divide = conversion(have, want)
+        except Exception as e:
+            failed += 1
+            error = str(e) if isinstance(e, ConversionError) else f'{type(e).__name__}: {e}'
+            if as_json:
+                out.write(json.dumps({'have': have, 'want': want, 'error': error}) + '\n')
+            else:
+                err.write(f'line {number}: {error}\n')
+            continue
+
+        if as_json:
+            out.write(json.dumps({
+                'have': have, 'want': want, 'multiply': multiply, 'divide': divide}) + '\n')
         else:
-            return unit
+            out.write(f'{have}\t{want}\t{multiply}\t{divide}\n')
+    return failed
 
 
 def prompt(prompt: str) -> Value:
@@ -66,6 +178,26 @@ def prompt(prompt: str) -> Value:
 if __name__ == '__main__':
     args = parser.parse_args()
 
+    for file in args.files:
+        if not file:
+            continue  # `-f ''` is the standard file, which is Noether's catalogue
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            use_definitions(file)
+        for warning in caught:
+            print(warning.message, file=sys.stderr)
+
+    if args.batch is not None:
+        if args.units:
+            parser.print_usage()
+            parser.exit(2)
+        if args.batch == '-':
+            failed = batch(sys.stdin, sys.stdout, sys.stderr, args.json)
+        else:
+            with open(args.batch) as f:
+                failed = batch(f, sys.stdout, sys.stderr, args.json)
+        exit(2 if failed else 0)
+
     if args.units:
         if len(args.units) != 2:
             parser.print_usage()
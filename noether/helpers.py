@@ -2,10 +2,16 @@
 Helpful standalone functions.
 '''
 
+from collections import OrderedDict, namedtuple
 from fractions import Fraction
 import os
 import pathlib
-from typing import Generic, TypeVar
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from types import ModuleType
+from weakref import WeakValueDictionary
+from typing import Callable, Generic, TypeVar
 
 
 # Typing does not currently support
@@ -65,6 +71,101 @@ def reorder_dict_by_values(dictionary: dict):
         dictionary[k] = v
 
 
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+class BoundedCache(Generic[KT, VT]):
+    '''
+    A thread-safe mapping which forgets its least recently used
+    items past `maxsize`, counting hits and misses as
+    `functools.lru_cache` does.
+
+    With `keep_referenced`, items past `maxsize` are only forgotten
+    once nothing else refers to them, so that the same value
+    is found for a key for as long as it is in use.
+    '''
+
+    def __init__(self, maxsize: int = 128, keep_referenced: bool = False):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[KT, VT] = OrderedDict()
+        # items past maxsize, while referenced elsewhere
+        self._evicted: WeakValueDictionary[KT, VT] | None = \
+            WeakValueDictionary() if keep_referenced else None
+        self._lock = Lock()
+
+    def get(self, key: KT, default: VT | None = None) -> VT | None:
+        with self._lock:
+            if key not in self._data:
+                value = None if self._evicted is None else self._evicted.pop(key, None)
+                if value is None:
+                    self.misses += 1
+                    return default
+                self._insert(key, value)
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def _insert(self, key: KT, value: VT):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            old_key, old_value = self._data.popitem(last=False)
+            if self._evicted is not None:
+                self._evicted[old_key] = old_value
+
+    def __setitem__(self, key: KT, value: VT):
+        with self._lock:
+            if self._evicted is not None:
+                self._evicted.pop(key, None)
+            self._insert(key, value)
+
+    def __contains__(self, key: KT):
+        return key in self._data or (self._evicted is not None and key in self._evicted)
+
+    def __len__(self):
+        return len(self._data)
+
+    def discard_where(self, predicate: Callable[[KT, VT], bool]):
+        with self._lock:
+            for data in (self._data, self._evicted):
+                if data is None:
+                    continue
+                for key in [k for k, v in list(data.items()) if predicate(k, v)]:
+                    del data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            if self._evicted is not None:
+                self._evicted.clear()
+            self.hits = self.misses = 0
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+class ModuleNamespace(dict):
+    '''
+    A module's attributes as a mapping, for the globals of `eval()`,
+    including those found by the module's `__getattr__`.
+    As globals, names are also found from lambdas and comprehensions.
+    '''
+
+    def __init__(self, module: ModuleType):
+        super().__init__()
+        self.module = module
+
+    def __missing__(self, name: str):
+        try:
+            value = getattr(self.module, name)
+        except AttributeError:
+            raise KeyError(name) from None
+        self[name] = value
+        return value
+
+
 # % Pathing
 
 
@@ -73,3 +174,43 @@ def get_dot_config():
         os.path.expanduser(
             os.environ.get(
                 'XDG_CONFIG_HOME', '~/.config')))
+
+
+def get_dot_cache():
+    return pathlib.Path(
+        os.path.expanduser(
+            os.environ.get(
+                'XDG_CACHE_HOME', '~/.cache')))
+
+
+# % Import phases
+
+# Seconds spent in each phase of `import noether` which importtime cannot
+# separate from the rest of a module, for `python -m noether.bench import`.
+# Only timed if NOETHER_IMPORT_PHASES is set.
+import_phases: dict[str, float] = {}
+_active_phases: set[str] = set()
+
+
+def import_phase(name: str):
+    '''
+    Decorator adding the time spent in a function to `import_phases[name]`,
+    leaving it unchanged unless NOETHER_IMPORT_PHASES is set.
+    '''
+    def decorator(function: Callable) -> Callable:
+        if not os.environ.get('NOETHER_IMPORT_PHASES'):
+            return function
+
+        @wraps(function)
+        def timed(*args, **kwargs):
+            if name in _active_phases:  # eg display() of a UnitSet
+                return function(*args, **kwargs)
+            _active_phases.add(name)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                import_phases[name] = import_phases.get(name, 0) + perf_counter() - start
+                _active_phases.discard(name)
+        return timed
+    return decorator
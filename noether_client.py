@@ -0,0 +1,111 @@
+'''
+A thin client for a Noether server (`python -m noether serve`).
+
+Provide terms (eg `-10degC @ degF`) to see their value, as with
+`python -m noether`, or none to evaluate each line of stdin.
+Only the standard library is imported, so it starts quickly:
+
+    $ python -m noether serve &
+    $ python -m noether_client 5cm @ in
+    1.96850394 in  # length
+
+From Python, a Client keeps its connection open between requests:
+
+    >>> with Client() as client:
+    ...     client.evaluate('5cm @ in', display_digits=3)
+    '1.97 in  # length'
+'''
+
+from pathlib import Path
+import json
+import os
+import socket
+import sys
+
+# as in noether/_server.py
+SOCKET_PATH = Path(
+    os.environ.get('NOETHER_SOCKET')
+    or Path(os.path.expanduser(os.environ.get('XDG_CACHE_HOME', '~/.cache')))
+    / 'noether' / 'server.sock')
+
+
+class ServerError(Exception):
+    'A term could not be evaluated by the server.'
+
+
+class Client:
+    def __init__(self, path: Path | str = SOCKET_PATH):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.socket.connect(str(path))
+        except OSError:
+            self.socket.close()
+            raise
+        self.reader = self.socket.makefile('rb')
+
+    def request(self, expr: str, **fields) -> dict:
+        'The response to a request, as a dict with `result` and `value` or `error`.'
+        line = json.dumps({'expr': expr, **fields}, ensure_ascii=False)
+        self.socket.sendall(line.encode() + b'\n')
+        response = self.reader.readline()
+        if not response:
+            raise ConnectionError('The Noether server closed the connection')
+        return json.loads(response)
+
+    def evaluate(self, expr: str, value: bool = False, **options):
+        'The result (or value) of `expr`, with config `options` set for it.'
+        response = self.request(expr, options=options) if options else self.request(expr)
+        if 'error' in response:
+            raise ServerError(response['error'])
+        return response['value'] if value else response['result']
+
+    def close(self):
+        self.reader.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    from argparse import ArgumentParser
+    parser = ArgumentParser(
+        description=__doc__.split('\n\n')[1],
+        usage='python -m noether_client [-h] [--value] [--socket PATH] [terms ...]')
+    parser.add_argument(
+        '--value', '-V', action='store_true',
+        help='Display only numeric values')
+    parser.add_argument(
+        '--socket', default=SOCKET_PATH,
+        help=f'The server socket (default {SOCKET_PATH}, or NOETHER_SOCKET)')
+    # as in noether/__main__.py, terms such as `-10degC` look like options
+    args, terms = parser.parse_known_args(argv)
+
+    try:
+        client = Client(args.socket)
+    except OSError as e:
+        print(f'Cannot connect to a Noether server at {args.socket} ({e.strerror}).'
+              ' Start one with `python -m noether serve`.', file=sys.stderr)
+        return 1
+
+    lines = [' '.join(terms)] if terms else sys.stdin
+    failed = False
+    with client:
+        for number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                print(client.evaluate(line, value=args.value), flush=True)
+            except ServerError as e:
+                failed = True
+                where = f'line {number}: ' if not terms else ''
+                print(where + str(e), file=sys.stderr, flush=True)
+    return 2 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -15,6 +15,7 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yunruse/noether",
     packages=packages,
+    py_modules=['noether_client'],
     classifiers=[
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
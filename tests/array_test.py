@@ -0,0 +1,151 @@
+'''
+Test MeasureArray against the behaviour of Measure.
+'''
+from unittest import TestCase, skipIf
+
+import noether
+from noether import meter, second, cm, degC, Measure
+from noether.errors import DimensionError, NoetherError
+
+try:
+    import numpy as np
+    from noether import MeasureArray
+except ImportError:
+    np = None
+
+noether.conf.reset()
+
+
+@skipIf(np is None, 'numpy is not installed')
+class test_measure_array(TestCase):
+    def assertMatches(self, array: 'MeasureArray', measures: list[Measure]):
+        self.assertEqual(len(array), len(measures))
+        for a, m in zip(array, measures):
+            self.assertIs(a.dim, m.dim)
+            self.assertAlmostEqual(a._value, m._value)
+            if m.stddev is None:
+                self.assertIsNone(a.stddev)
+            else:
+                self.assertAlmostEqual(a.stddev, m.stddev)
+
+    def test_construction(self):
+        a = meter(np.arange(3))
+        self.assertIsInstance(a, MeasureArray)
+        self.assertIs(a.dim, meter.dim)
+        self.assertIsInstance(np.arange(3) * meter, MeasureArray)
+        self.assertMatches(
+            MeasureArray.from_measures([meter, cm]), [meter, cm])
+
+    def test_numpy_not_imported(self):
+        from noether.bench import fresh_environment, run_python
+        code = ('import sys, noether; assert "numpy" not in sys.modules;'
+                ' import numpy; print(type(noether.meter(numpy.arange(2))).__name__)')
+        with fresh_environment() as env:
+            self.assertEqual(run_python(code, env).stdout.strip(), 'MeasureArray')
+
+    def test_geometric(self):
+        values = [1.0, 2.0, 3.5]
+        array = meter(np.array(values), np.array([0.1, 0.2, 0.3]))
+        measures = [meter(v, s) for v, s in zip(values, [0.1, 0.2, 0.3])]
+
+        self.assertMatches(array * second, [m * second for m in measures])
+        self.assertMatches(array / second, [m / second for m in measures])
+        self.assertMatches(array ** 2, [m ** 2 for m in measures])
+        self.assertMatches(array * array, [m * m for m in measures])
+
+    def test_linear(self):
+        a = meter(np.array([1.0, 2.0]))
+        self.assertMatches(a + cm, [meter + cm, meter * 2 + cm])
+        self.assertMatches(cm - a, [cm - meter, cm - meter * 2])
+        with self.assertRaises(DimensionError):
+            a + second
+
+    def test_comparison(self):
+        a = meter(np.array([1.0, 2.0]))
+        self.assertEqual(list(a > meter(1.5)), [False, True])
+        self.assertEqual(list(a == meter), [True, False])
+        self.assertEqual(list(a == second), [False, False])
+
+    def test_display(self):
+        a = degC(np.array([0.0, 100.0]))
+        self.assertEqual(str(a @ degC), '[0 °C, 100 °C]')
+        self.assertEqual(list((meter(np.arange(2)) @ cm).value), [0, 100])
+
+    def test_display_unit_arithmetic(self):
+        from noether import km, hour
+        # as `meter(3) @ km / hour`, only the display unit is divided
+        a = meter(np.array([1.0, 2.0])) @ km / hour
+        self.assertIs(a.dim, meter.dim)
+        self.assertEqual(list(a._value), [1.0, 2.0])
+        self.assertIs(a.unit.dim, (meter(3) @ km / hour).unit.dim)
+        speed = (meter(np.array([1.0])) / second) @ km / hour
+        self.assertEqual(str(speed), f"[{speed[0]}]")
+
+    def test_format_column(self):
+        from noether.display import format_column
+        a = meter(np.array([1.0, 2.5, 1e6]), np.array([0.1, 0.2, 0.3]))
+        self.assertEqual(
+            format_column(a @ cm, align=False),
+            [str(m @ cm) for m in a])
+        self.assertEqual(format_column(a, align=False), [str(m) for m in a])
+
+    def test_spectrum_names(self):
+        from noether.catalogue.info.spectrum import (
+            spectrum_names, spectrum_names_array, as_wavelength)
+        from noether import nm, hertz
+        wavelengths = nm(np.array([0.0005, 121.5, 500.0, 2e11]))
+        self.assertEqual(
+            spectrum_names_array(wavelengths),
+            [spectrum_names(w) for w in wavelengths])
+        self.assertEqual(spectrum_names(nm(500)), ['visible', 'green'])
+        self.assertEqual(
+            spectrum_names_array(as_wavelength(hertz(np.array([5e14])))),
+            [['visible', 'orange']])
+        self.assertEqual(
+            spectrum_names_array(hertz(np.array([5e14]))), [['visible', 'orange']])
+        with self.assertRaises(DimensionError):
+            spectrum_names_array(second(np.array([1.0])))
+
+    def test_ufuncs(self):
+        a = meter(np.array([1.0, 4.0, 9.0]))
+        root = np.sqrt(a)
+        self.assertEqual(root.dim, meter.dim ** 0.5)
+        self.assertEqual(list(root._value), [1, 2, 3])
+        self.assertEqual(np.sqrt(meter(4)), np.sqrt(meter * 4))
+        self.assertIsInstance(np.sqrt(meter(4)), Measure)
+        self.assertEqual(np.multiply(a, second).dim, (meter * second).dim)
+        with self.assertRaises(DimensionError):
+            np.add(a, second)
+        with self.assertRaises(DimensionError):
+            np.exp(a)
+
+    def test_functions(self):
+        a = meter(np.array([1.0, 2.0, 3.0]))
+        self.assertEqual(np.sum(a), meter(6))
+        self.assertEqual(np.mean(a), meter(2))
+        self.assertEqual(np.var(a).dim, meter.dim ** 2)
+        self.assertMatches(
+            np.concatenate([a, meter(np.array([4.0]))]),
+            [meter(1), meter(2), meter(3), meter(4)])
+        self.assertMatches(
+            np.where(a > meter(2), a, cm(0)),
+            [meter(0), meter(0), meter(3)])
+        with self.assertRaises(DimensionError):
+            np.concatenate([a, second(np.ones(1))])
+
+    def test_products(self):
+        a = meter(np.ones((2, 3, 4)))
+        self.assertEqual(np.prod(a, axis=(0, 2)).dim, meter.dim ** 8)
+        self.assertEqual(np.prod(a, axis=-1).dim, meter.dim ** 4)
+        self.assertEqual(np.prod(a).dim, meter.dim ** 24)
+
+    def test_reduce_uncertainty(self):
+        a = meter(np.array([1.0, 2.0, 3.0]), np.array([0.3, 0.4, 1.2]))
+        total = np.add.reduce(a)
+        self.assertEqual(total.value, 6)
+        self.assertAlmostEqual(total.stddev, 1.3)
+        self.assertAlmostEqual(total.stddev, np.sum(a).stddev)
+        self.assertAlmostEqual(np.add.accumulate(a)[1].stddev, 0.5)
+        with self.assertRaises(NoetherError):
+            np.maximum.reduce(a)
+        self.assertEqual(np.maximum.reduce(meter(np.array([1.0, 3.0]))), meter(3))
@@ -0,0 +1,63 @@
+'''
+Test evaluating terms, as `python -m noether` does, and many at once, as with `--batch`.
+'''
+from unittest import TestCase
+from io import StringIO
+import json
+import subprocess
+import sys
+
+import noether
+from noether import _batch
+
+noether.conf.reset()
+
+
+class test_batch(TestCase):
+    def run_batch(self, text: str, **kwargs):
+        out, err = StringIO(), StringIO()
+        failed = _batch.run(noether, StringIO(text), out, err, **kwargs)
+        return failed, out.getvalue().splitlines(), err.getvalue()
+
+    def test_plain(self):
+        failed, out, err = self.run_batch('5cm @ in\n\nnonsense_unit\n3 * meter\n')
+        self.assertEqual(failed, 1)
+        self.assertEqual(out, [repr(noether.cm(5) @ noether.inch), repr(noether.meter(3))])
+        self.assertEqual(err, "line 3: NameError: name 'nonsense_unit' is not defined\n")
+
+    def test_terms_cannot_rebind_names(self):
+        _, out, _ = self.run_batch('(meter := second)\nmeter\n')
+        self.assertEqual(out, [repr(noether.second), repr(noether.meter)])
+
+    def test_nested_scopes(self):
+        response = _batch.respond(_batch.Evaluator(noether), '"[meter*i for i in range(2)]"')
+        self.assertEqual(response['result'], repr([noether.meter * i for i in range(2)]))
+
+    def test_value(self):
+        _, out, _ = self.run_batch('-10degC @ degF\n3\n', value=True)
+        self.assertEqual(out, [str((noether.degC(-10) @ noether.degF).value), '3'])
+
+    def test_json(self):
+        failed, out, _ = self.run_batch(
+            '"2 kg"\n{"expr": "1/0", "id": 8}\n[]\n', as_json=True)
+        self.assertEqual(failed, 2)
+        first, second, third = map(json.loads, out)
+        self.assertEqual(first, {'result': '2 kg  # mass', 'value': 2})
+        self.assertEqual(second, {'id': 8, 'error': 'ZeroDivisionError: division by zero'})
+        self.assertIn('error', third)
+
+
+class test_terms(TestCase):
+    def run_terms(self, terms: str) -> str:
+        result = subprocess.run(
+            [sys.executable, '-m', 'noether', '--no-color', terms],
+            capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.strip()
+
+    def test_nested_scopes(self):
+        # names are found from comprehensions and lambdas, as in a module
+        self.assertEqual(
+            self.run_terms('[meter*i for i in range(3)]'),
+            repr([noether.meter * i for i in range(3)]))
+        self.assertEqual(self.run_terms('(lambda: 3 in)()'), repr(noether.inch(3)))
@@ -0,0 +1,53 @@
+'''
+Test the benchmark command line.
+'''
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from contextlib import redirect_stdout
+from io import StringIO
+import json
+
+import noether
+from noether import bench
+
+noether.conf.reset()
+
+
+class test_bench(TestCase):
+    def test_subsystem(self):
+        self.assertEqual(bench.subsystem('noether.catalogue.scientific.CODATA'),
+                         'noether.catalogue.scientific')
+        self.assertEqual(bench.subsystem('noether.config'), 'noether.config')
+        self.assertEqual(bench.subsystem('numpy.linalg._linalg'), 'numpy')
+        self.assertEqual(bench.subsystem('json.decoder'), 'stdlib')
+        self.assertEqual(bench.subsystem('_collections_abc'), 'stdlib')
+
+    def test_import_breakdown(self):
+        results = dict(bench.import_breakdown(repeat=1))
+        self.assertIn('noether.catalogue', results)
+        self.assertNotIn('sitecustomize', results)
+        # phases are counted within subsystems
+        phases = {k: results.pop(k) for k in list(results) if k.startswith('phase: ')}
+        self.assertIn('phase: Config.register', phases)
+        self.assertIn('phase: display registration', phases)
+        self.assertIn('phase: CODATA listing', phases)
+        self.assertAlmostEqual(
+            results.pop('total'), sum(results.values()))
+
+    def test_record(self):
+        bench.suites['_test'] = lambda: iter([('a', 2.0), ('b', 1e-3)])
+        try:
+            with TemporaryDirectory() as tmp:
+                path = Path(tmp) / 'bench.jsonl'
+                for _ in range(2):
+                    out = StringIO()
+                    with redirect_stdout(out):
+                        bench.main(['--record', str(path), '_test'])
+                records = [json.loads(line) for line in path.read_text().splitlines()]
+        finally:
+            del bench.suites['_test']
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[1]['results'], {'a': 2.0, 'b': 1e-3})
+        self.assertIn('2.00 s  a  (+0%)', out.getvalue())
@@ -0,0 +1,230 @@
+'''
+Test name lookup in the catalogue.
+'''
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from pathlib import Path
+import sys
+
+import noether
+from noether.bench import fresh_environment, run_python
+from noether import kilometer, microsecond, meter, second, kilo, Unit, PrefixedUnit
+from noether.core import Catalogue
+from noether.core.PrefixTrie import PrefixTrie
+
+noether.conf.reset()
+catalogue = noether.catalogue
+
+
+class test_catalogue(TestCase):
+    def test_prefix_trie(self):
+        trie = PrefixTrie([('k', 1), ('kilo', 2), ('Ki', 3)])
+        self.assertEqual(trie.matches('kilometre'), [('kilo', 2), ('k', 1)])
+        self.assertEqual(trie.matches('Kib'), [('Ki', 3)])
+        self.assertEqual(trie.matches('meter'), [])
+        self.assertEqual(len(trie), 3)
+        self.assertIn('kilo', trie)
+        self.assertNotIn('kil', trie)
+
+    def test_get_prefixed(self):
+        self.assertEqual(catalogue.get('kilometre'), kilometer)
+        self.assertEqual(catalogue.get('µs'), microsecond)
+        self.assertEqual(catalogue.get('km'), kilometer)
+        with self.assertRaises(NameError):
+            catalogue.get('kibimeter')
+
+    def test_prefix_splits(self):
+        splits = catalogue.prefix_splits('kilometre')
+        self.assertEqual([(p.prefix, u) for p, u in splits], [('kilo', meter)])
+        self.assertEqual(catalogue.prefix_splits('meter'), [])
+
+    def test_prefixed_flyweight(self):
+        self.assertIs(kilo * meter, kilo * meter)
+        self.assertIs(catalogue.get('dam'), catalogue.get('decameter'))
+        hits = PrefixedUnit.cache_info().hits
+        kilo * meter
+        self.assertEqual(PrefixedUnit.cache_info().hits, hits + 1)
+
+    def test_prefixed_eviction(self):
+        # units in use keep their identity once past the cache size
+        cache = PrefixedUnit._cache
+        maxsize, cache.maxsize = cache.maxsize, 4
+        try:
+            kilometre = kilo * meter
+            for prefix in catalogue.prefix_sets['SI_large']:
+                prefix * second
+            self.assertFalse(any(u is kilometre for u in cache._data.values()))
+            self.assertIs(kilo * meter, kilometre)
+            self.assertIs(kilo * meter, noether.kilometer)
+        finally:
+            cache.maxsize = maxsize
+
+    def test_prefixed_invalidation(self):
+        SI = catalogue.prefix_sets['SI_large']
+        old = Unit(meter, 'testunit', 'tu', prefixes=SI)
+        local = Catalogue({'SI': SI, 'testunit': old}, 'test')
+        prefixed = local.get('kilotestunit')
+        self.assertIs(local.get('kilotestunit'), prefixed)
+
+        local.register('testunit', Unit(second, 'testunit', 'tu', prefixes=SI))
+        self.assertFalse(any(
+            u is prefixed for u in PrefixedUnit._cache._data.values()))
+        self.assertIs(local.get('kilotestunit').dim, second.dim)
+
+    def test_lazy(self):
+        code = (
+            'import sys, noether\n'
+            'print(noether.meter, "noether.catalogue.data" in sys.modules)\n'
+            'print(noether.inch, noether.kilometer, noether.h)\n'
+            'print("noether.catalogue.humorous" in sys.modules)\n'
+        )
+        with fresh_environment('[CATALOGUE]\nlazy = true\n') as env:
+            for _ in range(2):  # building the index, then using it
+                out = run_python(code, env).stdout.split('\n')
+            cache = Path(env['XDG_CACHE_HOME'])
+            self.assertTrue((cache / 'noether' / 'catalogue_index.json').is_file())
+
+        self.assertEqual(out[:3], [
+            'meter False',
+            f'inch kilometer {noether.h}',
+            'False'])
+
+    def test_lazy_lookup(self):
+        # units defined outright are found before prefixed units, as when eager
+        code = (
+            'import noether\n'
+            'km = noether.catalogue["km"]\n'
+            'print(type(km).__name__, km.names, km is noether.catalogue.get_unit("kilometre"))\n'
+            'print(km is noether.kilo * noether.meter)\n'
+        )
+        outputs = []
+        for config in ('', '[CATALOGUE]\nlazy = true\n'):
+            with fresh_environment(config) as env:
+                outputs.append(run_python(code, env).stdout)
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIs(type(catalogue['km']), Unit)
+
+    def test_snapshot(self):
+        code = (
+            'import sys, noether\n'
+            'print("noether.catalogue.scientific.si" in sys.modules)\n'
+            'print(noether.inch, noether.kilometer, noether.h)\n'
+            'print(noether.kilometer is noether.kilo * noether.meter)\n'
+            'print(repr(noether.kelvin(300)), noether.catalogue.get_unit("mi"))\n'
+            'from noether.catalogue.scientific.si import c\n'
+            'print(c is noether.c)\n'
+            'print(noether.SI_d is sys.modules["noether.catalogue.scientific.si"].SI_d)\n'
+        )
+        names = (
+            'import sys, noether\n'
+            'print(dir(noether))\n'
+            'print(dir(sys.modules["noether.catalogue.dimensions"]))\n'
+        )
+        with fresh_environment('[CATALOGUE]\nsnapshot = true\n') as env:
+            outputs = [
+                run_python(code, env).stdout
+                for _ in range(2)  # saving the snapshot, then restoring it
+            ]
+            cache = Path(env['XDG_CACHE_HOME'])
+            self.assertTrue((cache / 'noether' / 'catalogue.pickle').is_file())
+            restored_names = run_python(names, env).stdout
+        with fresh_environment() as env:
+            self.assertEqual(restored_names, run_python(names, env).stdout)
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(outputs[1].split('\n')[:7], [
+            'True',
+            f'inch kilometer {noether.h}',
+            'True',
+            f'{noether.kelvin(300)!r} mile',
+            'True',
+            'True',
+            ''])
+
+    def test_codata_cache(self):
+        CODATA = sys.modules['noether.catalogue.scientific.CODATA']
+        with TemporaryDirectory() as tmp:
+            cache = Path(tmp) / 'codata.pickle'
+            listing = Path(tmp) / 'CODATA.txt'
+            listing.write_text(Path(CODATA._CODATA_PATH).read_text())
+            rows = CODATA._parse(listing.read_text())
+
+            self.assertEqual(CODATA._rows(listing, cache), rows)
+            self.assertTrue(cache.is_file())
+            self.assertEqual(CODATA._rows(listing, cache), rows)
+
+            # Changing the listing invalidates the cache
+            with open(listing, 'a') as f:
+                f.write(f'{"speed of dark":60}{"1":25}{"(exact)":25}m s^-1\n')
+            self.assertEqual(CODATA._rows(listing, cache)[-1], (
+                'speed of dark', 'speed_of_dark', 1.0, None, 'm*s**-1'))
+
+            # A corrupt cache is parsed again, and replaced
+            import pickle
+            for corrupt in (b'', b'\x80\x04', pickle.dumps(3), pickle.dumps((1, 2, 3)),
+                            b'\x80\x04\x95\x10\x00\x00\x00\x00\x00\x00\x00'
+                            b'\x8c\x07noether\x8c\x07nothing\x93.'):
+                cache.write_bytes(corrupt)
+                self.assertEqual(CODATA._rows(listing, cache)[-1][0], 'speed of dark')
+                self.assertEqual(CODATA._rows(listing, cache)[-1][0], 'speed of dark')
+
+    def test_prefixed_namespace(self):
+        namespace = vars(sys.modules['noether.catalogue'])
+        self.assertIn('zettameter', dir(noether))
+        self.assertIs(noether.zettameter, noether.zetta * meter)
+        self.assertIs(namespace['zettameter'], noether.zettameter)
+        self.assertEqual(
+            set(catalogue.all_prefixed_units()),
+            set(catalogue.prefixed_index()))
+
+        star = {}
+        exec('from noether import *', star)
+        self.assertIs(star['yobibyte'], noether.yobi * noether.byte)
+        with self.assertRaises(AttributeError):
+            noether.zettaparsec_of_nonsense
+
+    def test_units_by_dimension(self):
+        lengths = catalogue.units_by_dimension[meter.dim]
+        self.assertIn(meter, lengths)
+        self.assertEqual(len(lengths), len({id(u) for u in lengths}))
+
+    def test_comparison_index(self):
+        from noether.catalogue.info.comparison import info_comparison
+        from noether import cm
+
+        def slowest(measure):
+            _, name, unit = max(
+                info_comparison.get_comparisons(measure), key=lambda x: x[0])
+            return name, unit
+
+        for measure in (meter(3), kilometer(120), cm(0.2), meter / second * 20):
+            self.assertEqual(
+                info_comparison.best_comparison(measure), slowest(measure))
+        # a measure converted with @ is compared by its value in SI
+        from noether import foot
+        converted = meter(3) @ foot
+        self.assertEqual(
+            info_comparison.best_comparison(converted), slowest(converted))
+        self.assertEqual(
+            info_comparison.best_comparison(converted), slowest(meter(3)))
+        self.assertEqual(
+            list(info_comparison.info(cm(171))),
+            ['1.01× average human height'])
+        self.assertEqual(
+            list(info_comparison.info(cm(171) @ foot)),
+            ['1.01× average human height'])
+        # identical units are no comparison
+        self.assertNotEqual(info_comparison.best_comparison(meter(1))[1], meter)
+        self.assertIsNone(info_comparison.best_comparison(meter(-1)))
+
+    def test_comparison_measures(self):
+        from noether.catalogue.info import comparison
+        from noether import cm
+        self.assertEqual(comparison.COMPARISON_MEASURES['average human height'], cm(170))
+        comparison.COMPARISON_MEASURES['a tall human'] = cm(195)
+        try:
+            self.assertEqual(
+                list(comparison.info_comparison.info(cm(194))), ['0.99× a tall human'])
+        finally:
+            del comparison.COMPARISON_MEASURES['a tall human']
+        self.assertNotIn('tall', *comparison.info_comparison.info(cm(194)))
@@ -0,0 +1,60 @@
+'''
+Test the config snapshot read by hot paths.
+'''
+from unittest import TestCase
+
+import noether
+from noether import meter, second
+from noether.config import Config
+
+noether.conf.reset()
+
+
+class test_config(TestCase):
+    def tearDown(self):
+        noether.conf.reset()
+
+    def test_snapshot(self):
+        conf = noether.conf
+        generation = conf.generation
+        self.assertFalse(conf.snapshot.measure_ignore_dimension)
+
+        conf.measure_ignore_dimension = True
+        self.assertGreater(conf.generation, generation)
+        self.assertTrue(conf.snapshot.measure_ignore_dimension)
+        self.assertEqual((meter + second)._value, 2)
+
+        conf.reset()
+        self.assertFalse(conf.snapshot.measure_ignore_dimension)
+
+    def test_late_registration(self):
+        key = Config.register('test_late_option', 3)
+        self.assertEqual(getattr(noether.conf.snapshot, key), 3)
+        del Config.options[key]
+        delattr(Config, key)
+
+    def test_override(self):
+        conf = noether.conf
+        with conf.override(display_digits=4):
+            self.assertEqual(str(meter * 3.14159265), '3.142 m')
+            with conf.override(measure_ignore_dimension=True):
+                self.assertEqual(conf.get('display_digits'), 4)
+                self.assertEqual((meter + second)._value, 2)
+            self.assertFalse(conf.measure_ignore_dimension)
+        self.assertEqual(str(meter * 3.14159265), '3.14159265 m')
+
+        with self.assertRaises(TypeError):
+            with conf.override(display_digits='4'):
+                pass
+
+    def test_override_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def show(digits: int):
+            with noether.conf.override(display_digits=digits):
+                return [str(meter * 3.14159265) for _ in range(200)]
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(show, [2, 4, 6, 8] * 4))
+        for digits, result in zip([2, 4, 6, 8] * 4, results):
+            self.assertEqual(set(result), {str(meter * round(3.14159265, digits - 1))})
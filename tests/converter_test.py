@@ -0,0 +1,57 @@
+'''
+Test converters against conversion by Measure.
+'''
+from unittest import TestCase, skipIf
+
+import noether
+from noether import meter, foot, cm, second, degC, degF, kelvin, bel, decibel
+from noether import converter, Converter
+from noether.errors import DimensionError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+noether.conf.reset()
+
+
+class test_converter(TestCase):
+    def test_linear(self):
+        to_feet = converter(meter, foot)
+        self.assertIsInstance(to_feet, Converter)
+        self.assertEqual(to_feet(3), (meter(3) @ foot).value)
+        self.assertEqual(converter(cm, meter)(250), 2.5)
+
+    def test_affine(self):
+        for a, b in [(degC, degF), (degF, kelvin), (kelvin, degC)]:
+            for x in (-40, 0, 37.5, 100):
+                self.assertEqual(converter(a, b)(x), (a(x) @ b).value)
+
+    def test_logarithmic(self):
+        self.assertAlmostEqual(converter(bel, decibel)(2), 20)
+        one = noether.Measure(1)
+        self.assertAlmostEqual(converter(decibel, one)(30), 1000)
+        with self.assertRaises(ValueError):
+            converter(one, bel)(-1)
+
+    def test_cached(self):
+        self.assertIs(converter(meter, foot), converter(meter, foot))
+        self.assertIsNot(converter(meter, foot), converter(foot, meter))
+
+    def test_dimensions(self):
+        with self.assertRaises(DimensionError):
+            converter(meter, second)
+        with noether.conf.override(measure_ignore_dimension=True):
+            converter(meter, second)
+        with self.assertRaises(DimensionError):
+            converter(meter, second)
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_arrays(self):
+        values = np.array([-40.0, 0.0, 100.0])
+        self.assertEqual(
+            list(converter(degC, degF)(values)),
+            [(degC(x) @ degF).value for x in values])
+        self.assertEqual(
+            list(converter(decibel, bel)(np.array([10.0, 20.0]))), [1, 2])
@@ -0,0 +1,43 @@
+'''
+Test Dimension arithmetic and interning.
+'''
+from fractions import Fraction
+import pickle
+from unittest import TestCase
+
+import noether
+from noether import Dimension, dimensionless, length, time, mass, speed, energy
+
+noether.conf.reset()
+
+
+class test_dimension(TestCase):
+    def test_interned(self):
+        self.assertIs(length / time, speed)
+        self.assertIs(mass * length**2 / time**2, energy)
+        self.assertIs(Dimension({'length': 1, 'time': -1}), speed)
+        self.assertIs(length ** 0, dimensionless)
+        self.assertIs(Dimension(), dimensionless)
+        self.assertIs(length ** 0.5, length ** Fraction(1, 2))
+
+    def test_arithmetic(self):
+        self.assertIs(speed * time, length)
+        self.assertIs(length / length, dimensionless)
+        self.assertIs((length ** Fraction(1, 3)) ** 3, length)
+        self.assertIs(speed ** 0.5 * speed ** 0.5, speed)
+        self.assertIs(1 / speed, time / length)
+        self.assertEqual((time / length ** 0.5)['length'], -0.5)
+
+    def test_equality(self):
+        self.assertEqual(speed, {'length': 1, 'time': -1})
+        self.assertNotEqual(speed, length)
+        self.assertEqual(hash(length / time), hash(speed))
+
+    def test_pickle(self):
+        self.assertIs(pickle.loads(pickle.dumps(speed)), speed)
+
+    def test_operation_cache(self):
+        speed * time
+        hits = Dimension.cache_info().hits
+        self.assertIs(speed * time, length)
+        self.assertEqual(Dimension.cache_info().hits, hits + 1)
@@ -1,12 +1,14 @@
 '''
 Test various repr() and str() methods for objects.
 '''
+from collections import ChainMap
 from typing import Any, Callable
 from unittest import TestCase
 
 import noether
 from noether import time, length, Dimension
-from noether.display import uncertainty
+from noether.display import uncertainty, canonical_number, format_column
+from noether.helpers import ModuleNamespace
 
 from pathlib import Path
 
@@ -29,6 +31,43 @@ class test_unit_display(TestCase):
         for dim, string in self.dim_mult_display:
             self.assertEqual(dim.name(), string)
 
+    def test_composite_display_unit(self):
+        from noether import meter, second, kilogram, Unit
+        from noether.core import display
+
+        dim = (meter**3 * kilogram / second**3).dim
+        unit = display.dimension_unit(dim)
+        self.assertIs(display.dimension_unit(dim), unit)
+        self.assertEqual(str(unit), 'meter**3 * kilogram / second**3')
+
+        # Changing a base dimension's unit changes the composite
+        league = Unit(meter * 4828, 'test_league', 'lea')
+        display(league)
+        try:
+            self.assertEqual(str(display.dimension_unit(dim)), 'test_league**3 * kilogram / second**3')
+        finally:
+            display.remove(league)
+        self.assertEqual(str(display.dimension_unit(dim)), str(unit))
+
+    def test_format_column(self):
+        from noether import meter, cm, foot, inch, kelvin, degC, second
+        from noether.errors import DimensionError
+
+        measures = [meter(1.5), meter(1234567), cm(3), meter(2, 0.1), meter(-0.25)]
+        for unit in (None, cm, foot & inch):
+            self.assertEqual(
+                format_column(measures, unit, align=False),
+                [str(m if unit is None else m @ unit) for m in measures])
+
+        self.assertEqual(format_column([meter(1.5), meter(-20), meter(300, 1)]), [
+            '  1.5 m  ',
+            '-20 m    ',
+            '300 ± 1 m'])
+        self.assertEqual(format_column([kelvin(300)], degC), ['26.85 °C'])
+        self.assertEqual(format_column([]), [])
+        with self.assertRaises(DimensionError):
+            format_column([meter, second])
+
     uncertainty_display = (
         ('1.00794', '0.00007', '1.00794(7)'),
         ('1.45', '0.12', '1.45(12)'),
@@ -38,6 +77,23 @@ class test_unit_display(TestCase):
         ('1243', '3', '1243(3)'),
     )
 
+    number_display = (
+        (1e-4, '0.0001'),
+        (9.99999999999e-5, '0.0001'),
+        (0.000123456789, '1.234568e-4'),
+        (99999.99999, '100_000'),
+        (123456789.0, '123_456_789'),
+        (123456789.5, '1.234568e8'),
+        (1234567.5, '1_234_567.5'),
+        (0.1 + 0.2, '0.3'),
+        (2 / 3, '0.666666667'),
+        (999999999999999.9, '1e15'),
+    )
+
+    def test_number_display(self):
+        for number, string in self.number_display:
+            self.assertEqual(canonical_number(number), string)
+
     def test_uncertainty_display(self):
         for a, b, c in self.uncertainty_display:
             d = uncertainty(a, b)
@@ -61,7 +117,7 @@ class test_unit_display(TestCase):
         namespace: dict[str, Any] | None = None
     ):
         for value, name, repr_test in self.get_tests(name):
-            val = eval(value, noether.__dict__, namespace or {})
+            val = eval(value, {}, ChainMap(namespace or {}, ModuleNamespace(noether)))
             self.assertEqual(
                 repr_test, func(val),
                 msg=f'repr : {value} : {name}')
@@ -0,0 +1,113 @@
+'''
+Test the GNU Units-like CLI.
+'''
+from unittest import TestCase, mock
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from io import StringIO
+import json
+import warnings
+
+import noether
+from noether import gnu
+from noether._definitions import Resolver, load_definitions
+from noether.errors import NoetherWarning
+
+noether.conf.reset()
+
+
+class test_gnu(TestCase):
+    def test_batch(self):
+        out, err = StringIO(), StringIO()
+        failed = gnu.batch(
+            StringIO('inch cm\nkg\tmeter\n\n# comment\nfoo bar\ninch cm\n'), out, err)
+        self.assertEqual(failed, 2)
+        self.assertEqual(
+            out.getvalue().splitlines(),
+            ['inch\tcm\t2.54\t0.39370078740157477'] * 2)
+        self.assertEqual(
+            err.getvalue().splitlines(),
+            ['line 2: conformability error', "line 5: unknown unit 'foo'"])
+        self.assertGreater(gnu.conversion.cache_info().hits, 0)
+
+    def test_batch_prefixes(self):
+        # with -f, prefixes are found as units are
+        with TemporaryDirectory() as tmp, \
+                mock.patch.object(gnu, 'definitions', []), \
+                mock.patch.object(gnu, 'resolver', None):
+            (Path(tmp) / 'site.units').write_text('myria-  1e4\n')
+            with mock.patch.object(
+                    gnu, 'load_definitions',
+                    lambda path: load_definitions(path, cache_dir=Path(tmp))):
+                gnu.use_definitions(str(Path(tmp) / 'site.units'))
+            out, err = StringIO(), StringIO()
+            failed = gnu.batch(StringIO('kilo mega\nmyria kilo\n'), out, err)
+        gnu.lookup.cache_clear()
+        gnu.conversion.cache_clear()
+        self.assertEqual(failed, 0, err.getvalue())
+        self.assertEqual(
+            out.getvalue().splitlines(),
+            ['kilo\tmega\t0.001\t1000.0', 'myria\tkilo\t10.0\t0.1'])
+
+    def test_batch_errors(self):
+        find = gnu.find
+
+        def broken(name: str):
+            if name == 'broken':
+                raise ZeroDivisionError('division by zero')
+            return find(name)
+
+        gnu.lookup.cache_clear()
+        gnu.conversion.cache_clear()
+        out, err = StringIO(), StringIO()
+        with mock.patch.object(gnu, 'find', broken):
+            failed = gnu.batch(StringIO('inch cm\nbroken cm\ninch cm\n'), out, err)
+        gnu.lookup.cache_clear()
+        gnu.conversion.cache_clear()
+        self.assertEqual(failed, 1)
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+        self.assertEqual(err.getvalue(), 'line 2: ZeroDivisionError: division by zero\n')
+
+    def test_batch_json(self):
+        out = StringIO()
+        gnu.batch(StringIO('mile km\nmile\n'), out, StringIO(), as_json=True)
+        converted, error = map(json.loads, out.getvalue().splitlines())
+        self.assertEqual(converted['multiply'], (noether.mile / noether.km).value)
+        self.assertEqual(error['error'], 'expected a `have want` pair')
+
+    def test_definitions(self):
+        with TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            (tmp / 'site.units').write_text(
+                'grain_bin    3 bushel_ish + 2 bushel_ishes  # plural, defined later\n'
+                'bushel_ish   10 liter\n'
+                'binful       grain_bin\n'
+                'myria-       1e4\n'
+                'wibble       !\n'
+                'wobble       1|4 wibble / s\n'
+                'warm(x)      units=[1;K] x K\n'
+                '!include more.units\n')
+            (tmp / 'more.units').write_text('cubit_ish  45 cm\n')
+
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                compiled = load_definitions(tmp / 'site.units', cache_dir=tmp)
+            self.assertIn('nonlinear', str(caught[0].message))
+            cached = load_definitions(tmp / 'site.units', cache_dir=tmp)
+
+            for definitions in compiled, cached:
+                units = Resolver([definitions, noether.catalogue])
+                self.assertEqual(units['grain_bin'], noether.liter(50))
+                self.assertIs(units['binful'], units['grain_bin'])
+                self.assertAlmostEqual(float(units['myriabushel_ish'] / noether.liter), 1e5)
+                self.assertEqual(units['cubit_ishs'], noether.cm(45))
+                self.assertEqual(units['cm3'], noether.cm**3)
+                self.assertEqual(units['wobble'] * noether.second * 4, units['wibble'])
+                self.assertIs(units['meters'], noether.meter)
+                with self.assertRaises(NameError):
+                    units['warm']
+
+            (tmp / 'more.units').write_text('cubit_ish  50 cm\n')
+            with self.assertWarns(NoetherWarning):
+                changed = load_definitions(tmp / 'site.units', cache_dir=tmp)
+            self.assertEqual(changed['cubit_ish'], noether.cm(50))
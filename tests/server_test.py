@@ -0,0 +1,89 @@
+'''
+Test the Noether server and its client.
+'''
+from unittest import TestCase, skipUnless
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from threading import Thread
+import signal
+import socket
+import subprocess
+import sys
+
+import noether
+import noether_client
+
+noether.conf.reset()
+
+
+@skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are not supported')
+class test_server(TestCase):
+    def setUp(self):
+        from noether._server import make_server
+        self.tmp = TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'server.sock'
+        self.server = make_server(self.path)
+        self.thread = Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.tmp.cleanup()
+
+    def test_evaluate(self):
+        with noether_client.Client(self.path) as client:
+            self.assertEqual(
+                client.evaluate('5cm @ in'), repr(noether.cm(5) @ noether.inch))
+            self.assertEqual(client.evaluate('3 * meter', value=True), 3)
+            self.assertEqual(
+                client.evaluate('meter * 3.14159265', display_digits=3),
+                '3.14 m  # length')
+            # options only apply to their own request
+            self.assertEqual(
+                client.evaluate('meter * 3.14159265'), '3.14159265 m  # length')
+            with self.assertRaises(noether_client.ServerError):
+                client.evaluate('nonsense_unit')
+            self.assertEqual(client.request('1/0', id=3)['id'], 3)
+
+    def test_connections_are_independent(self):
+        with noether_client.Client(self.path) as first:
+            self.assertEqual(first.evaluate('(meter := second)'), repr(noether.second))
+            self.assertEqual(first.evaluate('meter'), repr(noether.meter))
+        with noether_client.Client(self.path) as second:
+            self.assertEqual(second.evaluate('meter'), repr(noether.meter))
+
+    def test_socket(self):
+        from noether._server import make_server
+        self.assertEqual(self.path.stat().st_mode & 0o077, 0)
+        with self.assertRaises(OSError):
+            make_server(self.path)
+
+
+@skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are not supported')
+class test_serve_command(TestCase):
+    def test_sigterm(self):
+        from noether.bench import fresh_environment
+        with fresh_environment() as env:
+            path = Path(env['XDG_CACHE_HOME']) / 'server.sock'
+            server = subprocess.Popen(
+                [sys.executable, '-m', 'noether', 'serve', '--socket', str(path)],
+                env=env, stdout=subprocess.PIPE, text=True)
+            try:
+                self.assertEqual(server.stdout.readline(), f'Noether listening on {path}\n')
+                with noether_client.Client(path) as client:
+                    self.assertEqual(client.evaluate('3 * meter', value=True), 3)
+                server.send_signal(signal.SIGTERM)
+                self.assertEqual(server.wait(timeout=10), 0)
+            finally:
+                server.kill()
+                server.stdout.close()
+            self.assertFalse(path.exists())
+
+    def test_socket_without_serve(self):
+        result = subprocess.run(
+            [sys.executable, '-m', 'noether', '--socket', 'server.sock', '3m'],
+            capture_output=True, text=True)
+        self.assertEqual(result.returncode, 2)
+        self.assertIn('--socket is only used with', result.stderr)